@@ -0,0 +1,227 @@
+"""Throughput benchmarks for the `YouTubeClient`, run against the offline mock server.
+
+Run it from the root of the repo:
+
+    python -m benchmarks.bench_client --page-size 20 --latency 0.005 --json bench_output.json
+
+To benchmark against real traffic instead, record a crawl with a `RecordingTransport`
+and replay it:
+
+    python -m benchmarks.bench_client --replay data/cassettes/crawl.jsonl --simulate-latency
+"""
+
+import json
+import time
+import pathlib
+import argparse
+import statistics
+import tracemalloc
+
+from typing import Dict
+from typing import List
+from typing import Callable
+
+from google.oauth2.credentials import Credentials
+
+from youtube.client import YouTubeClient
+from youtube.mock_server import MockYouTubeServer
+from youtube.transport import ReplayTransport
+
+
+def build_client(api_url: str, channel_id: str) -> YouTubeClient:
+    """Creates a client that talks to the mock server without going through oAuth."""
+
+    youtube_session = YouTubeClient(
+        api_key='mock-api-key',
+        channel_id=channel_id,
+        client_secret_path='mock_client_secret.json',
+        state_path='mock_state.json',
+        credentials=Credentials(token='mock-token')
+    )
+    youtube_session.api_url = api_url
+
+    return youtube_session
+
+
+def percentile(values: List[float], share: float) -> float:
+    """Returns the nearest-rank percentile of a list of values."""
+
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(share * len(ordered)) - 1))
+
+    return ordered[index]
+
+
+def measure(name: str, youtube_session: YouTubeClient, scenario: Callable[[], int]) -> Dict:
+    """Runs a scenario and reports its throughput, latency and peak memory.
+
+    Arguments:
+    ----
+    name {str} -- The name of the scenario.
+
+    youtube_session {YouTubeClient} -- The client the scenario uses.
+
+    scenario {Callable[[], int]} -- Runs the scenario and returns the number of
+        items it processed.
+
+    Returns:
+    ----
+    {Dict} -- The results of the run.
+    """
+
+    latencies = []
+    youtube_session.metrics.reset()
+    youtube_session.metrics.add_post_request_hook(
+        hook=lambda request, response: latencies.append(response['latency'])
+    )
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    items = scenario()
+
+    elapsed = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Drop the hook so the next scenario starts clean.
+    youtube_session.metrics._post_request_hooks.pop()
+
+    return {
+        'scenario': name,
+        'elapsed_seconds': round(elapsed, 4),
+        'requests': len(latencies),
+        'requests_per_second': round(len(latencies) / elapsed, 2) if latencies else 0.0,
+        'items': items,
+        'items_per_second': round(items / elapsed, 2),
+        'latency_p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'latency_p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'latency_mean_ms': round(statistics.mean(latencies) * 1000, 3) if latencies else 0.0,
+        'peak_memory_mb': round(peak_memory / 1024 / 1024, 3)
+    }
+
+
+def crawl(youtube_session: YouTubeClient) -> int:
+    """Crawls every playlist, its items and the videos in them."""
+
+    channel_playlists = youtube_session.grab_channel_playlists(parts=['snippet', 'contentDetails'])
+    playlist_ids = [playlist['id'] for page in channel_playlists for playlist in page['items']]
+
+    video_ids = []
+
+    for playlist_id in playlist_ids:
+        for page in youtube_session.playlists_items(playlist_id=playlist_id, all_pages=True):
+            video_ids += [item['snippet']['resourceId']['videoId'] for item in page.get('items', [])]
+
+    videos = youtube_session.grab_videos(
+        video_ids=list(dict.fromkeys(video_ids)),
+        parts=['snippet', 'statistics']
+    )
+
+    return len(video_ids) + sum(len(page.get('items', [])) for page in videos)
+
+
+def bulk_mutations(youtube_session: YouTubeClient, mock_server: MockYouTubeServer, count: int) -> int:
+    """Inserts, updates and deletes playlist items and videos."""
+
+    playlist_id = next(iter(mock_server.playlists))
+    video_ids = list(mock_server.videos)[:count]
+
+    inserted = []
+
+    for video_id in video_ids:
+        response = youtube_session.insert_playlist_items(
+            part=['snippet'],
+            data={'snippet': {'playlistId': playlist_id, 'resourceId': {'kind': 'youtube#video', 'videoId': video_id}}}
+        )
+        inserted.append(response['id'])
+
+    for video_id in video_ids:
+        youtube_session.update_video(
+            part=['snippet'],
+            data={'id': video_id, 'snippet': dict(mock_server.videos[video_id]['snippet'], title='Benchmark')}
+        )
+
+    for playlist_item_id in inserted:
+        youtube_session.delete_playlist_items(playlist_item_id=playlist_item_id)
+
+    return len(video_ids) * 3
+
+
+def parsing(youtube_session: YouTubeClient, data_folder: pathlib.Path) -> int:
+    """Parses the playlist and playlist item exports."""
+
+    playlists = youtube_session.parse_playlist_ids(
+        playlist_json_path=data_folder.joinpath('channel_playlists.json')
+    )
+    playlist_items = youtube_session.parse_playlist_items(
+        playlist_items_json_path=data_folder.joinpath('channel_playlists_items_all.json')
+    )
+
+    return len(playlists) + len(playlist_items)
+
+
+def run_against_mock_server(arguments: argparse.Namespace, data_folder: pathlib.Path) -> List[Dict]:
+    """Runs every scenario against a fresh mock server."""
+
+    with MockYouTubeServer(data_folder=data_folder, page_size=arguments.page_size,
+                           latency=arguments.latency, error_rate=arguments.error_rate) as mock_server:
+
+        youtube_session = build_client(api_url=mock_server.url, channel_id=mock_server.channel_id)
+
+        return [
+            measure('crawl', youtube_session, lambda: crawl(youtube_session)),
+            measure('bulk_mutations', youtube_session, lambda: bulk_mutations(youtube_session, mock_server, arguments.mutations)),
+            measure('parsing', youtube_session, lambda: parsing(youtube_session, data_folder))
+        ]
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description='Benchmark the YouTubeClient against the mock server.')
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--mutations', type=int, default=50)
+    parser.add_argument('--json', dest='json_path', default=None)
+    parser.add_argument('--replay', dest='cassette_path', default=None)
+    parser.add_argument('--simulate-latency', action='store_true')
+    arguments = parser.parse_args()
+
+    data_folder = pathlib.Path(__file__).parents[1].joinpath('data')
+
+    # Replay a recorded crawl, the mutations only make sense against the mock server.
+    if arguments.cassette_path:
+
+        youtube_session = build_client(api_url='https://www.googleapis.com', channel_id='replay')
+        youtube_session.transport = ReplayTransport(
+            cassette_path=arguments.cassette_path,
+            simulate_latency=arguments.simulate_latency
+        )
+
+        results = [
+            measure('crawl', youtube_session, lambda: crawl(youtube_session)),
+            measure('parsing', youtube_session, lambda: parsing(youtube_session, data_folder))
+        ]
+
+    else:
+        results = run_against_mock_server(arguments=arguments, data_folder=data_folder)
+
+    # Print the results.
+    for result in results:
+        print(
+            '{scenario:<15} {requests:>6} req {requests_per_second:>9} req/s '
+            'p50 {latency_p50_ms:>8} ms p99 {latency_p99_ms:>8} ms '
+            '{items_per_second:>11} items/s peak {peak_memory_mb:>8} MB'.format(**result)
+        )
+
+    if arguments.json_path:
+        with open(arguments.json_path, 'w+') as results_file:
+            json.dump(obj=results, fp=results_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
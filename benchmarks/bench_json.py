@@ -0,0 +1,98 @@
+"""Micro-benchmark for the JSON backends, run on the exports in the `data` folder.
+
+Run it from the root of the repo:
+
+    python -m benchmarks.bench_json --repeat 5
+"""
+
+import time
+import pathlib
+import argparse
+
+from typing import Dict
+from typing import List
+from typing import Callable
+
+from youtube import json_backend
+
+
+def best_of(function: Callable[[], object], repeat: int) -> float:
+    """Runs a function `repeat` times and returns the fastest run, in seconds."""
+
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def bench_file(file_path: pathlib.Path, backends: List[str], repeat: int) -> List[Dict]:
+    """Times decoding, pretty encoding and compact encoding of one file with each backend."""
+
+    raw = file_path.read_bytes()
+    results = []
+
+    for name in backends:
+
+        json_backend.use_backend(name=name)
+        content = json_backend.loads(raw)
+
+        results.append({
+            'file': file_path.name,
+            'backend': name,
+            'megabytes': round(len(raw) / 1024 / 1024, 3),
+            'decode_ms': round(best_of(lambda: json_backend.loads(raw), repeat) * 1000, 3),
+            'encode_pretty_ms': round(best_of(lambda: json_backend.dumps(content, pretty=True), repeat) * 1000, 3),
+            'encode_compact_ms': round(best_of(lambda: json_backend.dumps(content), repeat) * 1000, 3)
+        })
+
+    return results
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description='Compare the JSON backends on the data exports.')
+    parser.add_argument('--repeat', type=int, default=5)
+    arguments = parser.parse_args()
+
+    data_folder = pathlib.Path(__file__).parents[1].joinpath('data')
+    backends = [name for name in json_backend.BACKENDS if name != 'orjson' or json_backend.orjson]
+    default_backend = json_backend.backend()
+
+    results = []
+
+    for file_path in sorted(data_folder.glob('*.json')):
+        results += bench_file(file_path=file_path, backends=backends, repeat=arguments.repeat)
+
+    json_backend.use_backend(name=default_backend)
+
+    # Print every file, then the totals and the speedup over the standard library.
+    for result in results:
+        print('{file:<45} {backend:<7} {megabytes:>7} MB  decode {decode_ms:>9} ms  '
+              'pretty {encode_pretty_ms:>9} ms  compact {encode_compact_ms:>9} ms'.format(**result))
+
+    totals = {}
+
+    for result in results:
+        total = totals.setdefault(result['backend'], {'decode_ms': 0.0, 'encode_pretty_ms': 0.0, 'encode_compact_ms': 0.0})
+        for key in total:
+            total[key] += result[key]
+
+    print()
+
+    for name, total in totals.items():
+
+        speedups = '  '.join(
+            '{key} x{speedup:.1f}'.format(key=key, speedup=totals['json'][key] / value)
+            for key, value in total.items() if value
+        )
+
+        print('{name:<7} decode {decode_ms:>9.3f} ms  pretty {encode_pretty_ms:>9.3f} ms  '
+              'compact {encode_compact_ms:>9.3f} ms  vs json: {speedups}'.format(name=name, speedups=speedups, **total))
+
+
+if __name__ == '__main__':
+    main()
@@ -44,6 +44,13 @@ setup(
         'pywin32'
     ],
 
+    # some features only need extra packages if you want to use them.
+    extras_require={
+        'zstd': ['zstandard'],
+        'fast-json': ['orjson'],
+        'images': ['Pillow']
+    },
+
     # some keywords for my library.
     keywords='api, youtube, google, youtube videos',
 
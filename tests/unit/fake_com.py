@@ -0,0 +1,203 @@
+"""A stand-in for the parts of Illustrator's COM API the client uses.
+
+Every public attribute read, write or method call on a fake object counts as
+one COM round trip, so tests can assert how chatty the client is.
+"""
+
+
+class RoundTrips():
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+class FakeComObject():
+
+    def __init__(self, round_trips: RoundTrips) -> None:
+        object.__setattr__(self, '_round_trips', round_trips)
+
+    def __getattribute__(self, name: str):
+        if not name.startswith('_'):
+            object.__getattribute__(self, '_round_trips').count += 1
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        if not name.startswith('_'):
+            self._round_trips.count += 1
+        object.__setattr__(self, name, value)
+
+
+class FakeRGBColor(FakeComObject):
+
+    def __init__(self, round_trips: RoundTrips) -> None:
+        super().__init__(round_trips=round_trips)
+        self._values = {}
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in ['Red', 'Green', 'Blue']:
+            self._values[name] = value
+
+    def _rgb(self) -> tuple:
+        return (self._values.get('Red'), self._values.get('Green'), self._values.get('Blue'))
+
+
+class FakeCharacterAttributes(FakeComObject):
+
+    def __init__(self, text_range: 'FakeTextRange') -> None:
+        super().__init__(round_trips=text_range._round_trips)
+        self._text_range = text_range
+
+    @property
+    def FillColor(self):
+        # Like win32com, every read hands back a new proxy for the color.
+        fill = self._text_range._frame._fills[self._text_range._offset]
+        if fill is None:
+            return None
+        proxy = FakeRGBColor(round_trips=self._round_trips)
+        for name, value in fill._values.items():
+            object.__setattr__(proxy, name, value)
+            proxy._values[name] = value
+        return proxy
+
+    @FillColor.setter
+    def FillColor(self, color) -> None:
+        frame = self._text_range._frame
+        start = self._text_range._offset
+        end = start + self._text_range._length
+        frame._fills[start:end] = [color] * (end - start)
+
+
+class FakeCharacters(FakeComObject):
+
+    def __init__(self, frame: 'FakeTextFrame') -> None:
+        super().__init__(round_trips=frame._round_trips)
+        self._frame = frame
+
+    def __call__(self, index: int) -> 'FakeTextRange':
+        self._round_trips.count += 1
+        return FakeTextRange(frame=self._frame, offset=index - 1, length=1)
+
+    def __iter__(self):
+        for offset in range(len(self._frame._contents)):
+            self._round_trips.count += 1
+            yield FakeTextRange(frame=self._frame, offset=offset, length=1)
+
+
+class FakeTextRange(FakeComObject):
+
+    def __init__(self, frame: 'FakeTextFrame', offset: int = 0, length: int = None) -> None:
+        super().__init__(round_trips=frame._round_trips)
+        self._frame = frame
+        self._offset = offset
+        self._length = len(frame._contents) if length is None else length
+
+    @property
+    def Contents(self) -> str:
+        return self._frame._contents[self._offset:self._offset + self._length]
+
+    @Contents.setter
+    def Contents(self, text: str) -> None:
+        self._frame._set_contents(text=text)
+        self._length = len(text)
+
+    @property
+    def Length(self) -> int:
+        return self._length
+
+    @Length.setter
+    def Length(self, length: int) -> None:
+        self._length = length
+
+    @property
+    def Characters(self) -> FakeCharacters:
+        return FakeCharacters(frame=self._frame)
+
+    @property
+    def CharacterAttributes(self) -> FakeCharacterAttributes:
+        return FakeCharacterAttributes(text_range=self)
+
+
+class FakeTextFrame(FakeComObject):
+
+    def __init__(self, round_trips: RoundTrips, contents: str = '') -> None:
+        super().__init__(round_trips=round_trips)
+        self._set_contents(text=contents)
+
+    def _set_contents(self, text: str) -> None:
+        self._contents = text
+        self._fills = [None] * len(text)
+
+    @property
+    def TextRange(self) -> FakeTextRange:
+        return FakeTextRange(frame=self)
+
+    def _colors(self) -> list:
+        """The RGB tuple of every character, `None` where it was never colored."""
+
+        return [fill._rgb() if fill is not None else None for fill in self._fills]
+
+
+class FakeLayer(FakeComObject):
+
+    def __init__(self, round_trips: RoundTrips) -> None:
+        super().__init__(round_trips=round_trips)
+        self._text_frames = {
+            'GoalSubscriber': FakeTextFrame(round_trips=round_trips, contents='HELP MY CHANNEL GROW TO'),
+            'CurrentSubscriber': FakeTextFrame(round_trips=round_trips, contents='0 SO FAR !!!')
+        }
+
+    def TextFrames(self, name: str) -> FakeTextFrame:
+        return self._text_frames[name]
+
+
+class FakeDocument(FakeComObject):
+
+    def __init__(self, round_trips: RoundTrips, path: str) -> None:
+        super().__init__(round_trips=round_trips)
+        self._path = path
+        self._layer = FakeLayer(round_trips=round_trips)
+        self._exports = []
+        self._closed = None
+
+    def Layers(self, name: str) -> FakeLayer:
+        return self._layer
+
+    def Export(self, ExportFile: str, ExportFormat: int, Options) -> None:
+        frames = self._layer._text_frames
+        self._exports.append({
+            'file_name': ExportFile,
+            'texts': {name: frame._contents for name, frame in frames.items()},
+            'colors': {name: frame._colors() for name, frame in frames.items()}
+        })
+
+    def Close(self, Saving: int) -> None:
+        self._closed = Saving
+
+
+class FakeIllustrator(FakeComObject):
+
+    def __init__(self) -> None:
+        super().__init__(round_trips=RoundTrips())
+        self._documents = []
+        self._quit = False
+
+    def Open(self, path: str) -> FakeDocument:
+        document = FakeDocument(round_trips=self._round_trips, path=path)
+        self._documents.append(document)
+        return document
+
+    @property
+    def ActiveDocument(self) -> FakeDocument:
+        return self._documents[-1]
+
+    def Quit(self) -> None:
+        self._quit = True
+
+    def Dispatch(self, prog_id: str) -> FakeComObject:
+        """Stands in for `win32com.client.Dispatch`."""
+
+        if prog_id == 'Illustrator.RGBColor':
+            return FakeRGBColor(round_trips=self._round_trips)
+
+        return FakeComObject(round_trips=self._round_trips)
@@ -0,0 +1,183 @@
+import tempfile
+import threading
+import unittest
+from unittest import TestCase
+from youtube.adobe import ThumbnailJob
+from youtube.adobe import AdobeIllustrator
+from youtube.palette import FOREGROUND_WHITE
+from youtube.palette import HIGH_CONTRAST_PINK
+from youtube.palette import HIGH_CONTRAST_GREEN
+from tests.unit.fake_com import FakeIllustrator
+
+
+class AdobeIllustratorTest(TestCase):
+
+    """Will perform a unit test for the `AdobeIllustrator` object against a fake COM server."""
+
+    def setUp(self) -> None:
+        """Set up the `AdobeIllustrator` client with a fake Illustrator."""
+
+        self.adobe_app = FakeIllustrator()
+        self.adobe_illustrator = AdobeIllustrator(
+            file_name='thumbnail_help_me_grow.ai',
+            adobe_app=self.adobe_app,
+            dispatch=self.adobe_app.Dispatch
+        )
+
+    def round_trips(self) -> int:
+        return self.adobe_app._round_trips.count
+
+    def test_colors_are_cached(self):
+        """A color is only dispatched once."""
+
+        first = self.adobe_illustrator.high_contrast_pink
+        before = self.round_trips()
+        second = self.adobe_illustrator.high_contrast_pink
+
+        self.assertIs(first, second)
+        self.assertEqual(self.round_trips(), before)
+
+    def test_text_frames_are_cached(self):
+        """The layer and text frame are only looked up once."""
+
+        self.adobe_illustrator.current_subscriber_text_frame()
+        before = self.round_trips()
+        self.adobe_illustrator.current_subscriber_text_frame()
+
+        self.assertEqual(self.round_trips(), before)
+
+    def test_recolor_range(self):
+        """A range is recolored with a handful of round trips, whatever its length."""
+
+        self.adobe_illustrator.set_current_subscriber_text(text='25,400 SO FAR !!!')
+        text_range = self.adobe_illustrator.get_current_subscriber_text_range()
+
+        # Warm the color cache so only the recolor itself is counted.
+        self.adobe_illustrator.high_contrast_pink
+        self.adobe_illustrator.foreground_white
+
+        before = self.round_trips()
+        self.adobe_illustrator.recolor_range(text_range=text_range, color=HIGH_CONTRAST_PINK, end=-10)
+        self.adobe_illustrator.recolor_range(text_range=text_range, color=FOREGROUND_WHITE, start=-10)
+        batched = self.round_trips() - before
+
+        # The old way, one character at a time.
+        before = self.round_trips()
+        for character in list(text_range.Characters):
+            character.CharacterAttributes.FillColor = self.adobe_illustrator.foreground_white
+        looped = self.round_trips() - before
+
+        # At most six round trips per range.
+        self.assertLessEqual(batched, 12)
+        self.assertGreater(looped, 3 * batched)
+
+    def test_recolor_colors_the_right_characters(self):
+        """Ranges and matches land on the right characters."""
+
+        self.adobe_illustrator.set_goal_subscriber_text(text='HELP MY CHANNEL GROW TO\n100,000 SUBSCRIBERS !!!')
+        text_range = self.adobe_illustrator.get_goal_subscriber_text_range()
+
+        self.adobe_illustrator.recolor_range(text_range=text_range, color=FOREGROUND_WHITE)
+        self.adobe_illustrator.recolor_match(text_range=text_range, pattern='100,000', color=HIGH_CONTRAST_GREEN)
+
+        colors = self.adobe_illustrator.goal_subscriber_text_frame()._colors()
+        start = text_range.Contents.index('100,000')
+
+        self.assertEqual(colors[start:start + 7], [HIGH_CONTRAST_GREEN] * 7)
+        self.assertEqual(colors[:start], [FOREGROUND_WHITE] * start)
+        self.assertEqual(colors[start + 7:], [FOREGROUND_WHITE] * (len(colors) - start - 7))
+
+    def build_jobs(self) -> list:
+        return [
+            ThumbnailJob(
+                video_id=video_id,
+                texts={'CurrentSubscriber': '{:,} SO FAR !!!'.format(count)},
+                colors=[
+                    {'frame': 'CurrentSubscriber', 'color': HIGH_CONTRAST_PINK, 'end': -10},
+                    {'frame': 'CurrentSubscriber', 'color': FOREGROUND_WHITE, 'start': -10}
+                ]
+            )
+            for video_id, count in [('XEjaDFqImCk', 25400), ('Jd6q1AzNQvQ', 25500), ('b0c5xUqKEXk', 25600)]
+        ]
+
+    def test_export_batch(self):
+        """Every job is exported from the one open document, which is reverted after."""
+
+        document = self.adobe_app.ActiveDocument
+        original = self.adobe_illustrator.get_current_subscriber_text_range().Contents
+
+        with tempfile.TemporaryDirectory() as output_folder:
+            exported = self.adobe_illustrator.export_batch(jobs=self.build_jobs(), output_folder=output_folder)
+
+        self.assertEqual(len(self.adobe_app._documents), 1)
+        self.assertEqual(list(exported), ['XEjaDFqImCk', 'Jd6q1AzNQvQ', 'b0c5xUqKEXk'])
+        self.assertEqual(len(set(exported.values())), 3)
+        self.assertEqual(
+            [export['texts']['CurrentSubscriber'] for export in document._exports],
+            ['25,400 SO FAR !!!', '25,500 SO FAR !!!', '25,600 SO FAR !!!']
+        )
+        self.assertEqual(document._exports[0]['colors']['CurrentSubscriber'][-10:], [FOREGROUND_WHITE] * 10)
+        self.assertEqual(document._exports[0]['colors']['CurrentSubscriber'][:-10], [HIGH_CONTRAST_PINK] * 7)
+        self.assertEqual(self.adobe_illustrator.get_current_subscriber_text_range().Contents, original)
+
+    def test_export_batch_restores_colors(self):
+        """The frames get their original colors back, not just their text."""
+
+        self.adobe_illustrator.set_current_subscriber_text(text='25,300 SO FAR !!!')
+        text_range = self.adobe_illustrator.get_current_subscriber_text_range()
+        self.adobe_illustrator.recolor_range(text_range=text_range, color=HIGH_CONTRAST_GREEN, end=6)
+        self.adobe_illustrator.recolor_range(text_range=text_range, color=FOREGROUND_WHITE, start=6)
+
+        frame = self.adobe_illustrator.current_subscriber_text_frame()
+        original = frame._colors()
+
+        with tempfile.TemporaryDirectory() as output_folder:
+            self.adobe_illustrator.export_batch(jobs=self.build_jobs(), output_folder=output_folder)
+
+        self.assertEqual(frame._contents, '25,300 SO FAR !!!')
+        self.assertEqual(frame._colors(), original)
+
+        # Every read is a new proxy, the runs still come from the color values.
+        text_range = self.adobe_illustrator.get_current_subscriber_text_range()
+        runs = self.adobe_illustrator._save_fills(text_range=text_range)
+
+        self.assertEqual(runs, [(0, 6, HIGH_CONTRAST_GREEN), (6, 17, FOREGROUND_WHITE)])
+
+        # Restoring is a handful of round trips per run, not one per character.
+        before = self.round_trips()
+        self.adobe_illustrator._restore_fills(text_range=text_range, runs=runs)
+
+        self.assertLessEqual(self.round_trips() - before, 12)
+
+    def test_export_and_upload(self):
+        """Each export is handed to the upload queue."""
+
+        uploads = []
+        lock = threading.Lock()
+
+        class FakeSession():
+
+            def upload_thumbnail(self, video_id, thumbnail_path, thumbnail_index=None):
+                with lock:
+                    uploads.append((video_id, thumbnail_path))
+                return {'kind': 'youtube#thumbnailSetResponse', 'videoId': video_id}
+
+        with tempfile.TemporaryDirectory() as output_folder:
+            responses = self.adobe_illustrator.export_and_upload(
+                jobs=self.build_jobs(),
+                youtube_session=FakeSession(),
+                output_folder=output_folder
+            )
+
+        self.assertEqual(sorted(responses), sorted(['XEjaDFqImCk', 'Jd6q1AzNQvQ', 'b0c5xUqKEXk']))
+        self.assertEqual(len(uploads), 3)
+        self.assertTrue(all(path.endswith(video_id + '.png') for video_id, path in uploads))
+
+    def tearDown(self) -> None:
+        """Teardown the `AdobeIllustrator` client."""
+
+        del self.adobe_illustrator
+
+
+if __name__ == '__main__':
+    unittest.main()
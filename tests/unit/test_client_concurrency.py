@@ -0,0 +1,154 @@
+import json
+import pathlib
+import tempfile
+import threading
+import unittest
+from unittest import TestCase
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from youtube.mock_server import MockYouTubeServer
+
+try:
+    from google.oauth2.credentials import Credentials
+    from youtube.client import YouTubeClient
+except ImportError:
+    YouTubeClient = None
+
+
+class FakeCredentials():
+
+    def __init__(self, valid: bool = True, token: str = 'mock-token') -> None:
+        """Credentials that are only as valid as we say."""
+
+        self.valid = valid
+        self.token = token
+        self.client_id = 'client-id'
+        self.client_secret = 'client-secret'
+        self.refresh_token = 'refresh-token'
+
+
+@unittest.skipIf(YouTubeClient is None, 'requests and google-auth are needed for the client.')
+class YouTubeClientConcurrencyTest(TestCase):
+
+    """Will perform a unit test for sharing one client between worker threads."""
+
+    def setUp(self) -> None:
+        """Set up the Server and a Client pointed at it."""
+
+        self.mock_server = MockYouTubeServer(page_size=20).start()
+        self.temp_folder = tempfile.TemporaryDirectory()
+
+        self.youtube_session = YouTubeClient(
+            api_key='mock-key',
+            channel_id=self.mock_server.channel_id,
+            client_secret_path='client_secret.json',
+            state_path=pathlib.Path(self.temp_folder.name).joinpath('state.json'),
+            credentials=Credentials(token='mock-token')
+        )
+        self.youtube_session.api_url = self.mock_server.url
+
+    def tearDown(self) -> None:
+        """Tear down the Server."""
+
+        self.mock_server.stop()
+        self.temp_folder.cleanup()
+
+    def test_concurrent_inserts_and_reads(self):
+        """Insert and page through playlist items from 32 threads at once."""
+
+        playlist_id, items = max(self.mock_server.playlist_items.items(), key=lambda pair: len(pair[1]))
+        expected_ids = [item['id'] for item in items]
+        video_ids = list(self.mock_server.videos)
+
+        def insert(index: int) -> str:
+            response = self.youtube_session.insert_playlist_items(
+                part=['snippet'],
+                data={
+                    'snippet': {
+                        'playlistId': 'PLconcurrency',
+                        'resourceId': {'kind': 'youtube#video', 'videoId': video_ids[index % len(video_ids)]}
+                    }
+                }
+            )
+            return response['id']
+
+        def read(index: int) -> list:
+            pages = self.youtube_session.playlists_items(playlist_id=playlist_id, all_pages=True)
+            return [item['id'] for page in pages for item in page['items']]
+
+        with mock.patch('builtins.print'):
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                inserted = list(executor.map(insert, range(64)))
+                reads = list(executor.map(read, range(32)))
+
+        # No insert was lost or sent twice.
+        self.assertEqual(len(set(inserted)), 64)
+        self.assertEqual(len(self.mock_server.playlist_items['PLconcurrency']), 64)
+
+        # Every reader saw every page, in order.
+        for read_ids in reads:
+            self.assertEqual(read_ids, expected_ids)
+
+        # The client's counts agree with what the server saw.
+        self.assertEqual(self.youtube_session.quota_units_used, self.mock_server.quota_used)
+
+        snapshot = self.youtube_session.metrics.snapshot()
+        total_requests = sum(series['requests'] for series in snapshot.values())
+        self.assertEqual(total_requests, len(self.mock_server.request_log))
+
+    def test_token_is_refreshed_once(self):
+        """Expire the token and make sure only one thread refreshes it."""
+
+        self.youtube_session.credentials = FakeCredentials(valid=False)
+        refreshes = []
+        start = threading.Barrier(16)
+
+        def refresh_token():
+            refreshes.append(threading.get_ident())
+            return FakeCredentials(valid=True, token='fresh-token')
+
+        def validate(index: int) -> bool:
+            start.wait()
+            return self.youtube_session._validate_token()
+
+        with mock.patch.object(self.youtube_session, 'refresh_token', side_effect=refresh_token):
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(validate, range(16)))
+
+        self.assertTrue(all(results))
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(self.youtube_session.credentials.token, 'fresh-token')
+
+    def test_state_file_is_never_half_written(self):
+        """Save the state from many threads while reading it back."""
+
+        self.youtube_session.credentials = FakeCredentials()
+        self.youtube_session._save_state()
+
+        state_file = self.youtube_session.youtube_state_file
+        stop = threading.Event()
+        bad_reads = []
+
+        def reader():
+            while not stop.is_set():
+                try:
+                    with open(state_file, 'r') as state_content:
+                        json.load(state_content)
+                except ValueError:
+                    bad_reads.append(True)
+
+        reader_thread = threading.Thread(target=reader)
+        reader_thread.start()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda index: self.youtube_session._save_state(), range(200)))
+
+        stop.set()
+        reader_thread.join()
+
+        self.assertEqual(bad_reads, [])
+        self.assertEqual(list(state_file.parent.glob('*.tmp')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+from unittest import mock
+from youtube.daemon import round_count
+from youtube.daemon import display_step
+from youtube.daemon import SubscriberPoller
+
+
+class FakeChannelSession():
+
+    """Returns the next subscriber count from a list on every call."""
+
+    def __init__(self, counts: list) -> None:
+        self.counts = list(counts)
+        self.calls = []
+
+    def grab_my_channel(self, parts, fields=None):
+        self.calls.append({'parts': parts, 'fields': fields})
+        count = self.counts.pop(0)
+        if count is None:
+            return {'error': {'code': 500}}
+        return {'items': [{'statistics': {'subscriberCount': str(count)}}]}
+
+
+class SubscriberPollerTest(TestCase):
+
+    """Will perform a unit test for the subscriber polling daemon."""
+
+    def setUp(self) -> None:
+        """Set up a clock the test controls."""
+
+        self.now = 1000.0
+        self.clock = mock.patch('youtube.daemon.time.time', side_effect=lambda: self.now)
+        self.clock.start()
+        self.temp_folder = tempfile.TemporaryDirectory()
+
+    def build_poller(self, counts: list, changes: list) -> SubscriberPoller:
+        return SubscriberPoller(
+            youtube_session=FakeChannelSession(counts=counts),
+            on_change=lambda count, text: changes.append(text),
+            min_interval=60.0,
+            max_interval=3600.0,
+            state_path=os.path.join(self.temp_folder.name, 'poller_state.json')
+        )
+
+    def test_rounding(self):
+        """Counts round down to three significant figures."""
+
+        self.assertEqual(display_step(count=25432), 100)
+        self.assertEqual(round_count(count=25432), 25400)
+        self.assertEqual(round_count(count=999), 999)
+
+    def test_only_changed_text_triggers(self):
+        """Counts that round to the same text don't trigger a render."""
+
+        changes = []
+        poller = self.build_poller(counts=[25400, 25420, 25499, 25500], changes=changes)
+
+        for _ in range(4):
+            poller.poll_once()
+            self.now += 60
+
+        self.assertEqual(changes, ['25,400 SO FAR !!!', '25,500 SO FAR !!!'])
+        self.assertEqual(poller.youtube_session.calls[0], {'parts': ['statistics'], 'fields': 'items/statistics/subscriberCount'})
+
+    def test_interval_adapts(self):
+        """A still count backs off, a fast one polls sooner."""
+
+        poller = self.build_poller(counts=[25400, 25400, 25400], changes=[])
+
+        poller.poll_once()
+        self.now += 60
+        first = poller.poll_once()['interval']
+        self.now += 60
+        second = poller.poll_once()['interval']
+
+        self.assertGreater(second, first)
+
+        # 100 subscribers a minute means a new value every minute.
+        poller = self.build_poller(counts=[25400, 25500, 25600], changes=[])
+
+        poller.poll_once()
+        self.now += 600
+        self.assertEqual(poller.poll_once()['interval'], 300.0)
+
+    def test_errors_back_off_and_state_survives(self):
+        """A failed poll backs off, and a restart remembers the last text."""
+
+        changes = []
+        poller = self.build_poller(counts=[25400, None], changes=changes)
+
+        poller.poll_once()
+        before = poller.interval
+        result = poller.poll_once()
+
+        self.assertIn('error', result)
+        self.assertGreater(result['interval'], before)
+
+        restarted = self.build_poller(counts=[25400], changes=changes)
+        restarted.poll_once()
+
+        self.assertEqual(changes, ['25,400 SO FAR !!!'])
+
+    def tearDown(self) -> None:
+        """Teardown the clock and temporary folder."""
+
+        self.clock.stop()
+        self.temp_folder.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
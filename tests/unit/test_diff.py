@@ -0,0 +1,112 @@
+import os
+import copy
+import tempfile
+import unittest
+from unittest import TestCase
+from youtube.diff import diff_files
+from youtube.diff import diff_folders
+from youtube.diff import diff_snapshots
+from youtube.diff import changed_video_ids
+from youtube.storage import write_json
+
+
+def playlist_item(video_id: str, position: int, title: str = None) -> dict:
+    return {
+        'kind': 'youtube#playlistItem',
+        'id': 'item-' + video_id,
+        'snippet': {
+            'title': title or 'Video ' + video_id,
+            'playlistId': 'PL1',
+            'position': position,
+            'resourceId': {'kind': 'youtube#video', 'videoId': video_id}
+        }
+    }
+
+
+class DiffTest(TestCase):
+
+    """Will perform a unit test for the snapshot diffing."""
+
+    def setUp(self) -> None:
+        """Set up a snapshot of a playlist and its videos."""
+
+        self.old = [
+            {
+                'kind': 'youtube#playlistItemListResponse',
+                'items': [playlist_item(video_id=video_id, position=position) for position, video_id in enumerate('abcdef')]
+            },
+            {
+                'kind': 'youtube#videoListResponse',
+                'items': [
+                    {'kind': 'youtube#video', 'id': 'a', 'snippet': {'title': 'Video a'}, 'statistics': {'viewCount': '100', 'likeCount': '5'}}
+                ]
+            }
+        ]
+
+    def test_changeset(self):
+        """Adds, removals, moves, title changes and statistics deltas are all found."""
+
+        new = copy.deepcopy(self.old)
+
+        # Move `e` to the front, drop `b`, add `g` and rename `c`.
+        order = ['e', 'a', 'c', 'd', 'f', 'g']
+        new[0]['items'] = [
+            playlist_item(video_id=video_id, position=position, title='Renamed' if video_id == 'c' else None)
+            for position, video_id in enumerate(order)
+        ]
+        new[1]['items'][0]['statistics'] = {'viewCount': '150', 'likeCount': '5'}
+
+        changeset = diff_snapshots(old=self.old, new=new)
+
+        self.assertEqual([entry['video_id'] for entry in changeset['added']], ['g'])
+        self.assertEqual([entry['video_id'] for entry in changeset['removed']], ['b'])
+        self.assertEqual(changeset['moved'], [{
+            'kind': 'playlistItem', 'id': 'item-e', 'playlist_id': 'PL1', 'video_id': 'e', 'from': 4, 'to': 0
+        }])
+        self.assertEqual(changeset['title_changes'], [{
+            'kind': 'playlistItem', 'id': 'item-c', 'from': 'Video c', 'to': 'Renamed', 'video_id': 'c'
+        }])
+        self.assertEqual(changeset['statistics'], [{'kind': 'video', 'id': 'a', 'deltas': {'viewCount': 50}}])
+        self.assertEqual(sorted(changed_video_ids(changeset=changeset)), ['a', 'b', 'c', 'e', 'g'])
+
+    def test_identical_snapshots(self):
+        """Nothing changed, nothing reported."""
+
+        changeset = diff_snapshots(old=self.old, new=copy.deepcopy(self.old))
+
+        self.assertTrue(all(entries == [] for entries in changeset.values()))
+
+    def test_diff_files_and_folders(self):
+        """Saved files, compressed or not, can be compared."""
+
+        new = copy.deepcopy(self.old)
+        del new[0]['items'][0]
+
+        with tempfile.TemporaryDirectory() as temp_folder:
+
+            old_folder = os.path.join(temp_folder, 'old')
+            new_folder = os.path.join(temp_folder, 'new')
+            os.makedirs(old_folder)
+            os.makedirs(new_folder)
+
+            write_json(file_path=os.path.join(old_folder, 'channel_playlists_items_all.json'), content=self.old)
+            write_json(file_path=os.path.join(new_folder, 'channel_playlists_items_all.json.gz'), content=new, compression='gzip')
+
+            by_file = diff_files(
+                old_path=os.path.join(old_folder, 'channel_playlists_items_all.json'),
+                new_path=os.path.join(new_folder, 'channel_playlists_items_all.json')
+            )
+            by_folder = diff_folders(old_folder=old_folder, new_folder=new_folder)
+
+        self.assertEqual([entry['video_id'] for entry in by_file['removed']], ['a'])
+        self.assertEqual(by_file, by_folder)
+        self.assertEqual(by_file['moved'], [])
+
+    def tearDown(self) -> None:
+        """Teardown the snapshots."""
+
+        del self.old
+
+
+if __name__ == '__main__':
+    unittest.main()
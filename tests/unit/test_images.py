@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+from youtube import images
+
+
+@unittest.skipIf(images.Image is None, 'Pillow is not installed')
+class ThumbnailOptimizerTest(TestCase):
+
+    """Will perform a unit test for the thumbnail optimization pipeline."""
+
+    def setUp(self) -> None:
+        """Draw a stretched, transparent thumbnail like the Illustrator export."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.source_path = os.path.join(self.temp_folder.name, 'current_thumbnail.png')
+
+        image = images.Image.new('RGBA', (1293, 727), (0, 0, 0, 0))
+        image.paste((7, 255, 1, 255), (100, 100, 600, 300))
+        image.paste((248, 5, 254, 255), (700, 400, 1200, 600))
+        image.save(self.source_path, format='PNG')
+
+        self.optimizer = images.ThumbnailOptimizer(
+            cache_folder=os.path.join(self.temp_folder.name, 'cache')
+        )
+
+    def test_output_is_resized_and_smaller(self):
+        """The output is 1280x720, has no metadata and is no bigger than the source."""
+
+        optimized_path = self.optimizer.optimize(file_path=self.source_path)
+
+        with images.Image.open(optimized_path) as optimized:
+            self.assertEqual(optimized.size, (1280, 720))
+            self.assertEqual(optimized.mode, 'RGB')
+            self.assertNotIn('exif', optimized.info)
+
+        self.assertLessEqual(os.path.getsize(optimized_path), os.path.getsize(self.source_path))
+
+    def test_slight_stretch_keeps_the_edges(self):
+        """An image within the aspect tolerance is scaled, so a marker on its edge survives."""
+
+        image = images.Image.new('RGBA', (1290, 720), (255, 255, 255, 255))
+        image.paste((255, 0, 0, 255), (0, 0, 6, 720))
+
+        prepared = self.optimizer.prepare(image=image)
+
+        self.assertEqual(prepared.size, (1280, 720))
+        self.assertEqual(prepared.getpixel((1, 360)), (255, 0, 0))
+
+    def test_different_aspect_ratio_is_cropped(self):
+        """An image well outside the aspect tolerance is cropped around the center."""
+
+        image = images.Image.new('RGBA', (1280, 800), (255, 255, 255, 255))
+        image.paste((255, 0, 0, 255), (0, 0, 1280, 20))
+
+        prepared = self.optimizer.prepare(image=image)
+
+        self.assertEqual(prepared.size, (1280, 720))
+        self.assertEqual(prepared.getpixel((640, 0)), (255, 255, 255))
+
+    def test_result_is_cached(self):
+        """Optimizing the same source twice reuses the first result."""
+
+        first = self.optimizer.optimize(file_path=self.source_path)
+        modified = os.path.getmtime(first)
+
+        second = self.optimizer.optimize(file_path=self.source_path)
+
+        self.assertEqual(first, second)
+        self.assertEqual(os.path.getmtime(second), modified)
+
+    def tearDown(self) -> None:
+        """Teardown the temporary folder."""
+
+        self.temp_folder.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
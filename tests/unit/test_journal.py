@@ -0,0 +1,158 @@
+import tempfile
+import unittest
+from unittest import TestCase
+from youtube.journal import MutationJournal
+
+
+class FakeClient():
+
+    """A stand-in for the `YouTubeClient` that keeps playlists in memory."""
+
+    def __init__(self) -> None:
+        self.playlist = []
+        self.calls = []
+
+    def insert_playlist_items(self, part, data):
+        self.calls.append('insert_playlist_items')
+        self.playlist.append(data['snippet']['resourceId']['videoId'])
+        return {'id': 'item-{}'.format(len(self.playlist))}
+
+    def delete_playlist_items(self, playlist_item_id):
+        self.calls.append('delete_playlist_items')
+        return {'error': {'code': 404, 'errors': [{'reason': 'playlistItemNotFound'}]}}
+
+    def playlists_items(self, playlist_id, all_pages=False):
+        items = [{'snippet': {'resourceId': {'videoId': video_id}}} for video_id in self.playlist]
+        return [{'items': items}]
+
+
+class MutationJournalTest(TestCase):
+
+    """Will perform a unit test for the mutation journal."""
+
+    def setUp(self) -> None:
+        """Set up the Journal."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.journal = MutationJournal(
+            journal_path=self.temp_folder.name + '/mutations.jsonl'
+        )
+        self.client = FakeClient()
+
+    def insert_arguments(self, video_id: str) -> dict:
+        return {
+            'part': ['snippet'],
+            'data': {
+                'snippet': {
+                    'playlistId': 'PL1',
+                    'resourceId': {'kind': 'youtube#video', 'videoId': video_id}
+                }
+            }
+        }
+
+    def test_acknowledged_mutations_are_not_pending(self):
+        """Execute a mutation and make sure it's acknowledged."""
+
+        self.journal.execute(
+            client=self.client,
+            method='insert_playlist_items',
+            **self.insert_arguments(video_id='abc')
+        )
+
+        self.assertEqual(self.journal.pending(), [])
+
+    def test_resume_skips_inserts_already_on_server(self):
+        """Simulate a crash after the insert landed but before it was acknowledged."""
+
+        # The intent is written and the server has the video, but no result.
+        self.journal.record_intent(
+            method='insert_playlist_items',
+            arguments=self.insert_arguments(video_id='abc')
+        )
+        self.client.playlist.append('abc')
+
+        # And one that never made it.
+        self.journal.record_intent(
+            method='insert_playlist_items',
+            arguments=self.insert_arguments(video_id='xyz')
+        )
+
+        summaries = self.journal.resume(client=self.client)
+
+        self.assertEqual(
+            [summary['status'] for summary in summaries],
+            ['reconciled', 'acknowledged']
+        )
+        self.assertEqual(self.client.playlist, ['abc', 'xyz'])
+        self.assertEqual(self.journal.pending(), [])
+
+    def test_resume_treats_missing_delete_as_done(self):
+        """A delete for something that's already gone shouldn't stay pending."""
+
+        self.journal.record_intent(
+            method='delete_playlist_items',
+            arguments={'playlist_item_id': 'item-1'}
+        )
+
+        summaries = self.journal.resume(client=self.client)
+
+        self.assertEqual(summaries[0]['status'], 'reconciled')
+        self.assertEqual(self.journal.pending(), [])
+
+    def test_truncated_last_line_is_ignored(self):
+        """A half written entry left by a crash shouldn't break reading."""
+
+        self.journal.record_intent(
+            method='delete_playlist_items',
+            arguments={'playlist_item_id': 'item-1'}
+        )
+
+        with open(self.journal.journal_path, 'a') as journal_file:
+            journal_file.write('{"type": "res')
+
+        self.assertEqual(len(self.journal.pending()), 1)
+
+    def test_append_after_truncated_line(self):
+        """An entry written after a crash mid-write shouldn't be lost."""
+
+        self.journal.record_intent(
+            method='delete_playlist_items',
+            arguments={'playlist_item_id': 'item-1'}
+        )
+
+        # Cut the last entry off half way through its line.
+        content = self.journal.journal_path.read_bytes()
+        self.journal.journal_path.write_bytes(content[:len(content) // 2])
+
+        op_id = self.journal.record_intent(
+            method='delete_playlist_items',
+            arguments={'playlist_item_id': 'item-2'}
+        )
+
+        self.assertEqual([intent['op_id'] for intent in self.journal.pending()], [op_id])
+
+    def test_resume_sends_duplicate_intents_once(self):
+        """Two intents for the same video should only insert it once."""
+
+        for _ in range(2):
+            self.journal.record_intent(
+                method='insert_playlist_items',
+                arguments=self.insert_arguments(video_id='abc')
+            )
+
+        summaries = self.journal.resume(client=self.client)
+
+        self.assertEqual(
+            [summary['status'] for summary in summaries],
+            ['acknowledged', 'reconciled']
+        )
+        self.assertEqual(self.client.playlist, ['abc'])
+
+    def tearDown(self) -> None:
+        """Teardown the Journal."""
+
+        self.temp_folder.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
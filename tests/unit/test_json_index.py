@@ -0,0 +1,120 @@
+import gzip
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest import TestCase
+from youtube.storage import write_json
+from youtube.json_index import page_spans
+from youtube.json_index import build_index
+from youtube.json_index import index_path_for
+from youtube.json_index import IndexedJsonReader
+
+
+class IndexedJsonReaderTest(TestCase):
+
+    """Will perform a unit test for the memory mapped reader and its offset index."""
+
+    def setUp(self) -> None:
+        """Set up an export with a few playlists split into pages."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.folder = pathlib.Path(self.temp_folder.name)
+
+        self.pages = [
+            self.page(playlist_id=playlist_id, start=start)
+            for playlist_id in ['PLone', 'PLtwo', 'PLthree']
+            for start in range(0, 6, 2)
+        ]
+
+        self.file_path = write_json(file_path=self.folder.joinpath('items_all.json'), content=self.pages)
+
+    def tearDown(self) -> None:
+        """Tear down the folder."""
+
+        self.temp_folder.cleanup()
+
+    def page(self, playlist_id: str, start: int) -> dict:
+        """Builds a page of two playlist items, with text that looks like JSON."""
+
+        return {
+            'kind': 'youtube#playlistItemListResponse',
+            'items': [
+                {
+                    'kind': 'youtube#playlistItem',
+                    'id': '{}-{}'.format(playlist_id, position),
+                    'snippet': {
+                        'title': 'Brackets ]}[{ and "quotes" \\ in ' + str(position),
+                        'position': position,
+                        'playlistId': playlist_id
+                    }
+                }
+                for position in range(start, start + 2)
+            ]
+        }
+
+    def test_spans_cover_every_page(self):
+        """Find the pages in compact and pretty JSON."""
+
+        for content in [json.dumps(self.pages).encode('utf-8'), self.file_path.read_bytes()]:
+
+            spans = page_spans(content=content)
+
+            self.assertEqual(
+                [json.loads(content[offset:offset + length]) for offset, length in spans],
+                self.pages
+            )
+
+        with self.assertRaises(ValueError):
+            page_spans(content=b'{"items": []}')
+
+        with self.assertRaises(ValueError):
+            page_spans(content=b'[{"items": []}')
+
+    def test_playlist_pages(self):
+        """Read one playlist, and one page of it."""
+
+        with IndexedJsonReader(file_path=self.file_path) as reader:
+
+            self.assertEqual(len(reader), 9)
+            self.assertEqual(reader.playlist_ids(), ['PLone', 'PLtwo', 'PLthree'])
+            self.assertEqual(reader.playlist_pages(playlist_id='PLtwo'), self.pages[3:6])
+            self.assertEqual(reader.playlist_pages(playlist_id='PLthree', page_number=1), [self.pages[7]])
+            self.assertEqual(reader.page(position=0), self.pages[0])
+
+            with self.assertRaises(KeyError):
+                reader.playlist_pages(playlist_id='PLmissing')
+
+        self.assertTrue(index_path_for(file_path=self.file_path).exists())
+
+    def test_index_is_reused_and_rebuilt(self):
+        """Reuse the index until the file changes."""
+
+        build_index(file_path=self.file_path)
+        index_path = index_path_for(file_path=self.file_path)
+        built_at = index_path.stat().st_mtime_ns
+
+        with IndexedJsonReader(file_path=self.file_path) as reader:
+            self.assertEqual(len(reader), 9)
+
+        self.assertEqual(index_path.stat().st_mtime_ns, built_at)
+
+        # Rewrite the file with one playlist less.
+        write_json(file_path=self.file_path, content=self.pages[:6], compact=True)
+
+        with IndexedJsonReader(file_path=self.file_path) as reader:
+            self.assertEqual(reader.playlist_ids(), ['PLone', 'PLtwo'])
+            self.assertEqual(reader.playlist_pages(playlist_id='PLtwo'), self.pages[3:6])
+
+    def test_compressed_files_are_refused(self):
+        """Try to index a gzip file."""
+
+        gzip_path = self.folder.joinpath('compressed.json.gz')
+        gzip_path.write_bytes(gzip.compress(self.file_path.read_bytes()))
+
+        with self.assertRaises(ValueError):
+            build_index(file_path=gzip_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import pathlib
+import tempfile
+import unittest
+from unittest import TestCase
+from unittest import mock
+from youtube.membership import MembershipIndex
+from youtube.mock_server import MockYouTubeServer
+
+try:
+    from google.oauth2.credentials import Credentials
+    from youtube.client import YouTubeClient
+except ImportError:
+    YouTubeClient = None
+
+
+def playlist_page(playlist_id: str, video_ids: list, start: int = 0) -> dict:
+    """Builds a page of playlist items."""
+
+    return {
+        'kind': 'youtube#playlistItemListResponse',
+        'items': [
+            {
+                'kind': 'youtube#playlistItem',
+                'id': '{}-{}'.format(playlist_id, video_id),
+                'snippet': {
+                    'playlistId': playlist_id,
+                    'position': start + position,
+                    'resourceId': {'kind': 'youtube#video', 'videoId': video_id}
+                }
+            }
+            for position, video_id in enumerate(video_ids)
+        ]
+    }
+
+
+class MembershipIndexTest(TestCase):
+
+    """Will perform a unit test for the playlist membership index."""
+
+    def setUp(self) -> None:
+        """Set up an index with two playlists that share a video."""
+
+        self.membership_index = MembershipIndex()
+        self.membership_index.sync_playlist(
+            playlist_id='PLpandas',
+            pages=[playlist_page('PLpandas', ['v1', 'v2']), playlist_page('PLpandas', ['v3'], start=2)]
+        )
+        self.membership_index.sync_playlist(
+            playlist_id='PLexcel',
+            pages=[playlist_page('PLexcel', ['v4', 'v2'])]
+        )
+
+    def test_lookups_both_ways(self):
+        """Look up a shared video and a playlist's videos."""
+
+        self.assertEqual(len(self.membership_index), 5)
+        self.assertEqual(
+            self.membership_index.playlists_for(video_id='v2'),
+            [
+                {'playlist_id': 'PLpandas', 'position': 1, 'playlist_item_id': 'PLpandas-v2'},
+                {'playlist_id': 'PLexcel', 'position': 1, 'playlist_item_id': 'PLexcel-v2'}
+            ]
+        )
+        self.assertEqual(self.membership_index.videos_in(playlist_id='PLpandas'), ['v1', 'v2', 'v3'])
+        self.assertEqual(self.membership_index.video_ids(), ['v1', 'v2', 'v3', 'v4'])
+        self.assertEqual(self.membership_index.playlists_for(video_id='missing'), [])
+
+    def test_sync_drops_removed_items(self):
+        """Sync a playlist that lost a video and had another one moved."""
+
+        result = self.membership_index.sync_playlist(
+            playlist_id='PLpandas',
+            pages=[playlist_page('PLpandas', ['v3', 'v1'])]
+        )
+
+        self.assertEqual(result, {'items': 2, 'removed': 1})
+        self.assertEqual(self.membership_index.videos_in(playlist_id='PLpandas'), ['v3', 'v1'])
+        self.assertEqual([entry['playlist_id'] for entry in self.membership_index.playlists_for(video_id='v2')], ['PLexcel'])
+
+    def test_sync_with_errors_keeps_items(self):
+        """Sync a playlist whose second page failed."""
+
+        result = self.membership_index.sync_playlist(
+            playlist_id='PLpandas',
+            pages=[playlist_page('PLpandas', ['v1']), {'error': {'code': 500}}]
+        )
+
+        self.assertEqual(result, {'items': 3, 'removed': 0})
+
+    def test_remove_and_reload(self):
+        """Remove an item, save the index and load it back."""
+
+        self.assertTrue(self.membership_index.remove_item(item_id='PLexcel-v4'))
+        self.assertFalse(self.membership_index.remove_item(item_id='PLexcel-v4'))
+        self.assertNotIn('PLexcel-v4', [entry['playlist_item_id'] for entry in self.membership_index.playlists_for(video_id='v4')])
+
+        with tempfile.TemporaryDirectory() as temp_folder:
+            file_path = self.membership_index.save(file_path=pathlib.Path(temp_folder).joinpath('memberships.json'))
+            loaded = MembershipIndex.load(file_path=file_path)
+
+        self.assertEqual(loaded.video_ids(), self.membership_index.video_ids())
+        self.assertEqual(loaded.videos_in(playlist_id='PLexcel'), ['v2'])
+
+    def test_add_parsed_records(self):
+        """Build an index from parsed playlist items."""
+
+        membership_index = MembershipIndex()
+        membership_index.add_parsed(records=[
+            {
+                'playlist_item_id': 'item1',
+                'playlist_item_playlist_id': 'PLpandas',
+                'playlist_item_video_id': 'v1',
+                'playlist_item_position': 0
+            }
+        ])
+
+        self.assertEqual(membership_index.playlists_for(video_id='v1')[0]['playlist_id'], 'PLpandas')
+
+
+@unittest.skipIf(YouTubeClient is None, 'requests and google-auth are needed for the client.')
+class GrabVideosDedupTest(TestCase):
+
+    """Will perform a unit test for grabbing each video only once."""
+
+    def setUp(self) -> None:
+        """Set up the Server and a Client pointed at it."""
+
+        self.mock_server = MockYouTubeServer().start()
+
+        with mock.patch('builtins.print'):
+            self.youtube_session = YouTubeClient(
+                api_key='mock-key',
+                channel_id=self.mock_server.channel_id,
+                client_secret_path='client_secret.json',
+                state_path='state.json',
+                credentials=Credentials(token='mock-token')
+            )
+
+        self.youtube_session.api_url = self.mock_server.url
+
+    def tearDown(self) -> None:
+        """Tear down the Server."""
+
+        self.mock_server.stop()
+
+    def test_duplicates_are_grabbed_once(self):
+        """Grab 50 videos listed twice each, in one request."""
+
+        video_ids = list(self.mock_server.videos)[:50]
+
+        pages = self.youtube_session.grab_videos(video_ids=video_ids + video_ids, parts=['snippet'])
+
+        self.assertEqual([video['id'] for page in pages for video in page['items']], video_ids)
+        self.assertEqual(self.mock_server.request_log.count(('GET', 'videos')), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import threading
+import unittest
+from unittest import TestCase
+from youtube.metadata import MetadataEngine
+from youtube.metadata import CompiledTemplate
+
+
+class FakeVideoSession():
+
+    """Keeps a few videos in memory, and counts the API calls."""
+
+    def __init__(self, videos: dict) -> None:
+        self.videos = videos
+        self.grabs = 0
+        self.updates = []
+        self._lock = threading.Lock()
+
+    def grab_videos(self, video_ids, parts):
+        self.grabs += 1
+        return [{'items': [self.videos[video_id] for video_id in video_ids if video_id in self.videos]}]
+
+    def update_video(self, part, data):
+        with self._lock:
+            self.updates.append(data['id'])
+            self.videos[data['id']]['snippet'] = data['snippet']
+        return {'id': data['id'], 'snippet': data['snippet']}
+
+
+class MetadataEngineTest(TestCase):
+
+    """Will perform a unit test for the bulk metadata engine."""
+
+    def setUp(self) -> None:
+        """Set up videos, half of which already have the new footer."""
+
+        self.videos = {}
+
+        for number in range(6):
+
+            footer = 'Patreon: https://patreon.com/sigmacoding' if number % 2 else 'Patreon: old link'
+
+            self.videos['video{}'.format(number)] = {
+                'kind': 'youtube#video',
+                'id': 'video{}'.format(number),
+                'snippet': {
+                    'title': 'Video {}'.format(number),
+                    'description': 'About video {number}.\n\nSupport Sigma Coding:\n{footer}'.format(number=number, footer=footer),
+                    'tags': ['python'],
+                    'categoryId': '28',
+                    'publishedAt': '2020-07-19T02:10:09Z'
+                }
+            }
+
+        self.youtube_session = FakeVideoSession(videos=self.videos)
+        self.metadata_engine = MetadataEngine(
+            youtube_session=self.youtube_session,
+            description='{body}\n\nSupport Sigma Coding:\n{footer}',
+            description_marker='Support Sigma Coding:',
+            variables={'footer': 'Patreon: https://patreon.com/sigmacoding'}
+        )
+
+    def test_compiled_template(self):
+        """A template renders fields and escaped braces."""
+
+        template = CompiledTemplate('{title} | {{Sigma}} {views:,}')
+
+        self.assertEqual(template.render(context={'title': 'Pandas', 'views': 25400}), 'Pandas | {Sigma} 25,400')
+        self.assertEqual(template.fields, {'title', 'views'})
+
+    def test_only_changed_videos_are_updated(self):
+        """Videos that already match aren't updated."""
+
+        result = self.metadata_engine.run(video_ids=list(self.videos))
+
+        self.assertEqual(sorted(result['updated']), ['video0', 'video2', 'video4'])
+        self.assertEqual(len(result['plan']['unchanged']), 3)
+        self.assertEqual(result['quota_saved'], 150)
+        self.assertTrue(self.videos['video0']['snippet']['description'].endswith('sigmacoding'))
+        self.assertEqual(self.videos['video0']['snippet']['categoryId'], '28')
+
+        # A second run has nothing to do.
+        self.assertEqual(self.metadata_engine.run(video_ids=list(self.videos))['updated'], [])
+
+    def test_missing_and_empty_tags_match(self):
+        """A video without tags isn't updated just because it renders an empty list."""
+
+        for video in self.videos.values():
+            del video['snippet']['tags']
+
+        metadata_engine = MetadataEngine(youtube_session=self.youtube_session, tags=[])
+        plan = metadata_engine.plan(video_ids=list(self.videos))
+
+        self.assertEqual(plan['changes'], [])
+        self.assertEqual(len(plan['unchanged']), 6)
+
+    def test_dry_run_and_invalid(self):
+        """A dry run changes nothing, and a snippet over the limits isn't sent."""
+
+        engine = MetadataEngine(youtube_session=self.youtube_session, title='{title} ' + 'x' * 100)
+
+        result = engine.run(video_ids=['video0', 'missing'], dry_run=True)
+
+        self.assertEqual(self.youtube_session.updates, [])
+        self.assertEqual(result['plan']['missing'], ['missing'])
+        self.assertEqual(result['plan']['invalid'][0]['video_id'], 'video0')
+
+    def tearDown(self) -> None:
+        """Teardown the engine."""
+
+        del self.metadata_engine
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+from unittest import mock
+from youtube.metrics import RequestMetrics
+
+try:
+    from google.oauth2.credentials import Credentials
+    from youtube.client import YouTubeClient
+except ImportError:
+    YouTubeClient = None
+
+
+class RequestMetricsTest(TestCase):
+
+    """Will perform a unit test for the request metrics."""
+
+    def setUp(self) -> None:
+        """Set up the Metrics."""
+
+        self.metrics = RequestMetrics(latency_buckets=(0.1, 1.0))
+        self.request = {'endpoint': 'playlistItems', 'method': 'get', 'url': '', 'params': {}}
+
+    def test_snapshot_groups_by_endpoint_and_method(self):
+        """Record a few requests and make sure they're counted together."""
+
+        for latency in [0.05, 0.5, 2.0]:
+            self.metrics.after_request(
+                request=self.request,
+                response={'status_code': 200, 'latency': latency, 'response_bytes': 10, 'quota_units': 1}
+            )
+
+        self.metrics.record_cache_hit(endpoint='playlistItems', method='get')
+
+        series = self.metrics.snapshot()['GET playlistItems']
+
+        self.assertEqual(series['requests'], 3)
+        self.assertEqual(series['quota_units'], 3)
+        self.assertEqual(series['response_bytes'], 30)
+        self.assertEqual(series['cache_hits'], 1)
+        self.assertEqual(series['latency_buckets'], {'0.1': 1, '1.0': 1, '+Inf': 1})
+
+    def test_hooks_are_called(self):
+        """Both hooks should see the request."""
+
+        seen = []
+        self.metrics.add_pre_request_hook(hook=lambda request: seen.append('pre'))
+        self.metrics.add_post_request_hook(hook=lambda request, response: seen.append('post'))
+
+        self.metrics.before_request(request=self.request)
+        self.metrics.after_request(request=self.request, response={'status_code': 404, 'latency': 0.2})
+
+        self.assertEqual(seen, ['pre', 'post'])
+        self.assertEqual(self.metrics.snapshot()['GET playlistItems']['errors'], 1)
+
+    def test_prometheus_histogram_is_cumulative(self):
+        """Prometheus buckets count everything at or below the bound."""
+
+        for latency in [0.05, 0.5]:
+            self.metrics.after_request(request=self.request, response={'status_code': 200, 'latency': latency})
+
+        with tempfile.TemporaryDirectory() as temp_folder:
+            file_path = self.metrics.write_prometheus(file_path=temp_folder + '/youtube.prom')
+            content = file_path.read_text()
+
+        self.assertIn('youtube_request_latency_seconds_bucket{endpoint="playlistItems",method="get",le="1.0"} 2', content)
+        self.assertIn('youtube_requests_total{endpoint="playlistItems",method="get"} 2', content)
+
+
+
+class BrokenTransport():
+
+    """A transport whose connection always drops."""
+
+    def send(self, method, url, **kwargs):
+        raise ConnectionError('Connection reset by peer.')
+
+
+@unittest.skipIf(YouTubeClient is None, 'requests and google-auth are needed for the client.')
+class ClientMetricsTest(TestCase):
+
+    """Will perform a unit test for the metrics the client records."""
+
+    def test_failed_send_is_counted_as_an_error(self):
+        """A request that never got an answer still shows up as an error."""
+
+        with mock.patch('builtins.print'):
+            youtube_session = YouTubeClient(
+                api_key='mock-key',
+                channel_id='UCmock',
+                client_secret_path='client_secret.json',
+                state_path='state.json',
+                credentials=Credentials(token='mock-token'),
+                transport=BrokenTransport()
+            )
+
+        with self.assertRaises(ConnectionError):
+            youtube_session.playlists_items(playlist_id='PLmock')
+
+        series = youtube_session.metrics.snapshot()['GET playlistItems']
+
+        self.assertEqual(series['requests'], 1)
+        self.assertEqual(series['errors'], 1)
+
+    def test_failed_resumable_upload_is_counted_as_an_error(self):
+        """A resumable upload whose connection drops isn't recorded as a success."""
+
+        with mock.patch('builtins.print'):
+            youtube_session = YouTubeClient(
+                api_key='mock-key',
+                channel_id='UCmock',
+                client_secret_path='client_secret.json',
+                state_path='state.json',
+                credentials=Credentials(token='mock-token'),
+                transport=BrokenTransport()
+            )
+
+        with tempfile.TemporaryDirectory() as temp_folder:
+
+            thumbnail_path = os.path.join(temp_folder, 'current_thumbnail.png')
+
+            with open(thumbnail_path, 'wb') as thumbnail_file:
+                thumbnail_file.write(os.urandom(1024))
+
+            with self.assertRaises(ConnectionError):
+                youtube_session.upload_thumbnail(video_id='XEjaDFqImCk', thumbnail_path=thumbnail_path, resumable=True)
+
+        series = youtube_session.metrics.snapshot()['POST thumbnails/set']
+
+        self.assertEqual(series['requests'], 1)
+        self.assertEqual(series['errors'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import time
+import statistics
+import unittest
+import http.client
+import urllib.error
+import urllib.request
+from unittest import TestCase
+from youtube.mock_server import MockYouTubeServer
+
+
+class MockYouTubeServerTest(TestCase):
+
+    """Will perform a unit test for the offline mock server."""
+
+    def setUp(self) -> None:
+        """Set up the Server."""
+
+        self.mock_server = MockYouTubeServer(page_size=20).start()
+
+    def request(self, method: str, path: str, payload: dict = None) -> tuple:
+        """Sends a request to the mock server and decodes the answer."""
+
+        request = urllib.request.Request(
+            url=self.mock_server.url + path,
+            method=method,
+            data=json.dumps(payload).encode('utf-8') if payload else None,
+            headers={'Content-Type': 'application/json'}
+        )
+
+        try:
+            with urllib.request.urlopen(request) as response:
+                content = response.read()
+                return response.status, json.loads(content) if content else None
+        except urllib.error.HTTPError as error:
+            return error.code, json.loads(error.read())
+
+    def test_playlist_items_are_paged(self):
+        """Walk every page of a playlist and make sure nothing is missing."""
+
+        playlist_id, items = max(self.mock_server.playlist_items.items(), key=lambda pair: len(pair[1]))
+
+        seen = []
+        path = '/youtube/v3/playlistItems?maxResults=50&playlistId={}'.format(playlist_id)
+        status, page = self.request(method='GET', path=path)
+        seen += page['items']
+
+        while 'nextPageToken' in page:
+            status, page = self.request(method='GET', path=path + '&pageToken=' + page['nextPageToken'])
+            seen += page['items']
+
+        self.assertLessEqual(len(page['items']), 20)
+        self.assertEqual([item['id'] for item in seen], [item['id'] for item in items])
+
+    def test_insert_and_delete_playlist_item(self):
+        """Insert a playlist item and then delete it."""
+
+        playlist_id = next(iter(self.mock_server.playlists))
+        video_id = next(iter(self.mock_server.videos))
+
+        status, item = self.request(
+            method='POST',
+            path='/youtube/v3/playlistItems?part=snippet',
+            payload={'snippet': {'playlistId': playlist_id, 'position': 0, 'resourceId': {'videoId': video_id}}}
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(self.mock_server.playlist_items[playlist_id][0]['id'], item['id'])
+
+        status, _ = self.request(method='DELETE', path='/youtube/v3/playlistItems?id=' + item['id'])
+        self.assertEqual(status, 204)
+
+    def test_quota_errors_once_limit_is_hit(self):
+        """Once the quota is spent every request is refused."""
+
+        self.mock_server.quota_limit = 1
+
+        self.request(method='GET', path='/youtube/v3/channels?mine=true')
+        status, content = self.request(method='GET', path='/youtube/v3/channels?mine=true')
+
+        self.assertEqual(status, 403)
+        self.assertEqual(content['error']['errors'][0]['reason'], 'quotaExceeded')
+
+    def test_kept_alive_connection_is_fast(self):
+        """Reuse one connection and make sure no request waits on a delayed ACK."""
+
+        host, port = self.mock_server._server.server_address[:2]
+        connection = http.client.HTTPConnection(host, port)
+        latencies = []
+
+        for _ in range(20):
+            start = time.perf_counter()
+            connection.request('GET', '/youtube/v3/channels?part=statistics')
+            connection.getresponse().read()
+            latencies.append(time.perf_counter() - start)
+
+        connection.close()
+
+        # Nagle's algorithm and a delayed ACK add ~40 ms to every request.
+        self.assertLess(statistics.median(latencies), 0.02)
+
+    def tearDown(self) -> None:
+        """Teardown the Server."""
+
+        self.mock_server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import gzip
+import pathlib
+import tempfile
+import unittest
+from unittest import TestCase
+from youtube.storage import read_json
+from youtube.storage import write_json
+from youtube.parsing import plan_tasks
+from youtube.parsing import parse_files
+from youtube.parsing import parse_pages
+from youtube.parsing import parse_to_file
+from youtube.parsing import _parse_task
+
+
+class ParallelParsingTest(TestCase):
+
+    """Will perform a unit test for parsing exports across a process pool."""
+
+    def setUp(self) -> None:
+        """Set up a folder with a few exports."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.folder = pathlib.Path(self.temp_folder.name)
+
+        self.exports = []
+
+        for index in range(3):
+            pages = [self.page(playlist_id='PL{}'.format(index), start=start, size=5) for start in range(0, 40, 5)]
+            self.exports.append(pages)
+            write_json(file_path=self.folder.joinpath('export_{}.json'.format(index)), content=pages)
+
+        self.file_paths = [self.folder.joinpath('export_{}.json'.format(index)) for index in range(3)]
+
+    def tearDown(self) -> None:
+        """Tear down the folder."""
+
+        self.temp_folder.cleanup()
+
+    def page(self, playlist_id: str, start: int, size: int) -> dict:
+        """Builds a page of playlist items."""
+
+        return {
+            'kind': 'youtube#playlistItemListResponse',
+            'items': [
+                {
+                    'kind': 'youtube#playlistItem',
+                    'id': '{}-{}'.format(playlist_id, position),
+                    'snippet': {
+                        'title': 'Video {}'.format(position),
+                        'position': position,
+                        'publishedAt': '2020-07-19T02:10:09Z',
+                        'playlistId': playlist_id,
+                        'resourceId': {'kind': 'youtube#video', 'videoId': 'video{}'.format(position)}
+                    }
+                }
+                for position in range(start, start + size)
+            ]
+        }
+
+    def test_files_are_split_into_ranges(self):
+        """Split every file on its page boundaries, each range holds whole pages."""
+
+        tasks = plan_tasks(file_paths=self.file_paths, kind='playlist_items', split_bytes=1024)
+        ranges = [task for task in tasks if task[0].endswith('export_0.json')]
+
+        self.assertGreater(len(tasks), 3)
+        self.assertGreater(len(ranges), 1)
+
+        # Each range only decodes its own pages, and together they cover the file in order.
+        parsed = [record for task in ranges for record in _parse_task(task=task)]
+        self.assertEqual(parsed, parse_pages(pages=self.exports[0], kind='playlist_items'))
+
+        for (_, _, _, end), (_, _, start, _) in zip(ranges, ranges[1:]):
+            self.assertLess(end, start)
+
+    def test_small_and_compressed_files_are_not_split(self):
+        """A file under the split size or a compressed one is parsed by one worker."""
+
+        gzip_path = self.folder.joinpath('compressed.json.gz')
+        gzip_path.write_bytes(gzip.compress(self.file_paths[0].read_bytes()))
+
+        tasks = plan_tasks(file_paths=[self.file_paths[0], gzip_path], kind='playlist_items', split_bytes=1024 * 1024)
+        self.assertEqual([task[2:] for task in tasks], [(None, None), (None, None)])
+
+        tasks = plan_tasks(file_paths=[gzip_path], kind='playlist_items', split_bytes=1024)
+        self.assertEqual([task[2:] for task in tasks], [(None, None)])
+
+    def test_parallel_matches_sequential(self):
+        """Parse across processes and make sure the order is the same as one at a time."""
+
+        expected = [record for pages in self.exports for record in parse_pages(pages=pages, kind='playlist_items')]
+
+        parsed = parse_files(file_paths=self.file_paths, max_workers=3, split_bytes=1024)
+
+        self.assertEqual(parsed, expected)
+        self.assertEqual(len(parsed), 120)
+
+    def test_streamed_file_matches_saved_file(self):
+        """Stream the parsed file and compare it with one saved in one go."""
+
+        expected_path = write_json(
+            file_path=self.folder.joinpath('expected.json'),
+            content=parse_files(file_paths=self.file_paths, max_workers=2)
+        )
+
+        output_path = parse_to_file(
+            file_paths=self.file_paths,
+            output_path=self.folder.joinpath('parsed', 'export_parsed.json'),
+            max_workers=2,
+            split_bytes=1024
+        )
+
+        self.assertEqual(output_path.read_bytes(), expected_path.read_bytes())
+        self.assertEqual(list(output_path.parent.glob('*.tmp')), [])
+
+    def test_compressed_and_empty_exports(self):
+        """Parse a gzip export and an empty one."""
+
+        gzip_path = self.folder.joinpath('compressed.json.gz')
+        gzip_path.write_bytes(gzip.compress(self.file_paths[0].read_bytes()))
+
+        empty_path = write_json(file_path=self.folder.joinpath('empty.json'), content=[])
+
+        parsed = parse_files(file_paths=[self.folder.joinpath('compressed.json'), empty_path])
+        self.assertEqual(len(parsed), 40)
+
+        output_path = parse_to_file(file_paths=[empty_path], output_path=self.folder.joinpath('empty_parsed.json'))
+        self.assertEqual(read_json(file_path=output_path), [])
+
+    def test_unknown_kind(self):
+        """Ask for a kind that doesn't exist."""
+
+        with self.assertRaises(ValueError):
+            parse_files(file_paths=self.file_paths, kind='comments')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import time
+import threading
+import unittest
+from unittest import TestCase
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from youtube.pool import ClientPool
+from youtube.pool import PINNED_METHODS
+from youtube.pool import SHARED_READ_METHODS
+
+try:
+    from youtube.client import YouTubeClient
+except ImportError:
+    YouTubeClient = None
+
+
+QUOTA_EXCEEDED = {'error': {'code': 403, 'errors': [{'reason': 'quotaExceeded'}]}}
+
+
+class FakeClient():
+
+    """A stand-in for the `YouTubeClient` that counts quota like it does."""
+
+    def __init__(self, api_key: str, channel_id: str = 'UCchannel') -> None:
+        self.api_key = api_key
+        self.channel_id = channel_id
+        self.quota_units_used = 0
+        self.responses = []
+        self.calls = 0
+        self._quota_lock = threading.Lock()
+        self._thread_quota = threading.local()
+
+    @property
+    def thread_quota_units(self) -> int:
+        return getattr(self._thread_quota, 'units', 0)
+
+    def _add_quota(self, units: int) -> None:
+        with self._quota_lock:
+            self.quota_units_used += units
+        self._thread_quota.units = self.thread_quota_units + units
+
+    def grab_videos(self, video_ids, parts):
+        self.calls += 1
+        self._add_quota(units=1)
+
+        # Give the other threads a chance to spend quota on this client too.
+        time.sleep(0.001)
+
+        return [self.responses.pop(0) if self.responses else {'items': []}]
+
+    def insert_playlist_items(self, part, data):
+        self.calls += 1
+        self._add_quota(units=50)
+        return {'id': 'item'}
+
+    def upload_thumbnail(self, video_id, thumbnail_path):
+        self.calls += 1
+        self._add_quota(units=50)
+        return {'kind': 'youtube#thumbnailSetResponse'}
+
+
+class ClientPoolTest(TestCase):
+
+    """Will perform a unit test for the client pool."""
+
+    def setUp(self) -> None:
+        """Set up a pool of two projects."""
+
+        self.first = FakeClient(api_key='key-1', channel_id='UCfirst')
+        self.second = FakeClient(api_key='key-2', channel_id='UCsecond')
+        self.pool = ClientPool(clients=[self.first, self.second], daily_quota=100, failure_threshold=2)
+
+    def test_reads_rotate_to_the_key_with_most_quota(self):
+        """Spread shared reads over both keys."""
+
+        for _ in range(4):
+            self.pool.call('grab_videos', video_ids=['abc'], parts=['snippet'])
+
+        self.assertEqual((self.first.calls, self.second.calls), (2, 2))
+        self.assertEqual(self.pool.remaining_quota(self.first), 98)
+        self.assertEqual(self.pool.remaining_quota(self.second), 98)
+
+    def test_writes_are_pinned_to_the_owner(self):
+        """Send a write to the client that owns the channel, and charge it there."""
+
+        self.pool.call('insert_playlist_items', part=['snippet'], data={}, channel_id='UCsecond')
+
+        self.assertEqual((self.first.calls, self.second.calls), (0, 1))
+        self.assertEqual(self.pool.remaining_quota(self.second), 50)
+
+        with self.assertRaises(ValueError):
+            self.pool.call('insert_playlist_items', part=['snippet'], data={})
+
+        with self.assertRaises(KeyError):
+            self.pool.call('insert_playlist_items', part=['snippet'], data={}, channel_id='UCmissing')
+
+    def test_uploads_are_pinned_to_the_owner(self):
+        """Uploads need the owner's credentials, so they go through the pool like other writes."""
+
+        self.pool.call('upload_thumbnail', video_id='XEjaDFqImCk', thumbnail_path='current_thumbnail.png', channel_id='UCfirst')
+
+        self.assertEqual((self.first.calls, self.second.calls), (1, 0))
+        self.assertEqual(self.pool.remaining_quota(self.first), 50)
+
+    @unittest.skipIf(YouTubeClient is None, 'requests and google-auth are needed for the client.')
+    def test_every_api_method_is_routed(self):
+        """Every client method that calls the API is either a shared read or pinned."""
+
+        local_methods = [
+            'chunks', 'thread_quota_units', 'refresh_token', 'oauth_workflow', 'load_file',
+            'load_playlist_pages', 'parse_playlist_ids', 'parse_playlist_items', 'save_to_json_file'
+        ]
+        api_methods = [
+            name for name in vars(YouTubeClient)
+            if not name.startswith('_') and name not in local_methods
+        ]
+
+        self.assertEqual(sorted(api_methods), sorted(SHARED_READ_METHODS + PINNED_METHODS))
+
+    def test_quota_exceeded_takes_key_out_until_the_next_day(self):
+        """Exhaust one key and make sure reads move to the other until the day rolls."""
+
+        self.first.responses.append(QUOTA_EXCEEDED)
+
+        with mock.patch.object(self.pool, 'read_client', return_value=self.first):
+            self.pool.call('grab_videos', video_ids=['abc'], parts=['snippet'])
+
+        self.assertEqual(self.pool.remaining_quota(self.first), 0)
+
+        for _ in range(3):
+            self.pool.call('grab_videos', video_ids=['abc'], parts=['snippet'])
+
+        self.assertEqual(self.first.calls, 1)
+        self.assertEqual(self.second.calls, 3)
+
+        # The quota resets at midnight Pacific.
+        with mock.patch.object(self.pool, '_current_quota_day', return_value='2999-01-01'):
+            self.assertEqual(self.pool.remaining_quota(self.first), 100)
+
+    def test_failing_client_is_benched(self):
+        """Take a client out of rotation after failures in a row."""
+
+        self.first.responses.extend([{'error': {'code': 500}}, {'error': {'code': 500}}])
+
+        with mock.patch.object(self.pool, 'read_client', return_value=self.first):
+            for _ in range(2):
+                self.pool.call('grab_videos', video_ids=['abc'], parts=['snippet'])
+
+        self.assertFalse(self.pool.is_healthy(self.first))
+        self.assertIs(self.pool.read_client(), self.second)
+
+    def test_concurrent_calls_on_a_shared_client(self):
+        """Charge each call only for itself when threads share one client."""
+
+        pool = ClientPool(clients=[self.first], daily_quota=10000)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(
+                lambda index: pool.call('grab_videos', video_ids=['abc'], parts=['snippet']),
+                range(200)
+            ))
+
+        self.assertEqual(self.first.quota_units_used, 200)
+        self.assertEqual(pool.remaining_quota(self.first), 10000 - 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from unittest import TestCase
+from youtube.quota import quota_cost
+
+
+class QuotaCostTest(TestCase):
+
+    """Will perform a unit test for the quota cost table."""
+
+    def test_method_defaults(self):
+        """Reads cost 1 unit and writes cost 50."""
+
+        self.assertEqual(quota_cost(endpoint='playlistItems', method='get'), 1)
+        self.assertEqual(quota_cost(endpoint='playlistItems', method='POST'), 50)
+        self.assertEqual(quota_cost(endpoint='videos', method='put'), 50)
+        self.assertEqual(quota_cost(endpoint='playlistItems', method='delete'), 50)
+
+    def test_endpoint_overrides(self):
+        """Searches and video uploads have their own cost."""
+
+        self.assertEqual(quota_cost(endpoint='search', method='get'), 100)
+        self.assertEqual(quota_cost(endpoint='videos', method='post'), 1600)
+        self.assertEqual(quota_cost(endpoint='thumbnails/set', method='post'), 50)
+
+    def test_unknown_method(self):
+        """Anything else costs 1 unit."""
+
+        self.assertEqual(quota_cost(endpoint='playlists', method='patch'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
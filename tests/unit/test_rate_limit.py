@@ -0,0 +1,78 @@
+import time
+import tempfile
+import threading
+import unittest
+from unittest import TestCase
+from youtube.rate_limit import RateLimiter
+from youtube.rate_limit import FileLockBackend
+
+
+class RateLimiterTest(TestCase):
+
+    """Will perform a unit test for the token-bucket rate limiter."""
+
+    def test_burst_is_allowed_up_to_capacity(self):
+        """A full bucket shouldn't make the first requests wait."""
+
+        rate_limiter = RateLimiter(rate=1.0, capacity=5)
+
+        waited = sum(rate_limiter.acquire(endpoint='videos') for _ in range(5))
+
+        self.assertEqual(waited, 0.0)
+
+    def test_requests_past_capacity_wait_for_refill(self):
+        """Once the bucket is empty the next request waits for a token."""
+
+        rate_limiter = RateLimiter(rate=50.0, capacity=1)
+
+        start = time.monotonic()
+        for _ in range(6):
+            rate_limiter.acquire(endpoint='videos')
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_endpoint_bucket_is_separate(self):
+        """An endpoint limit applies on top of the global bucket."""
+
+        rate_limiter = RateLimiter(
+            rate=1000.0,
+            endpoint_limits={'thumbnails/set': (20.0, 1)}
+        )
+
+        rate_limiter.acquire(endpoint='thumbnails/set')
+
+        self.assertEqual(rate_limiter.acquire(endpoint='videos'), 0.0)
+        self.assertGreater(rate_limiter.acquire(endpoint='thumbnails/set'), 0.0)
+
+    def test_waiting_on_an_endpoint_does_not_hold_a_global_token(self):
+        """A caller waiting on a slow endpoint leaves the global bucket to the others."""
+
+        rate_limiter = RateLimiter(rate=2.0, capacity=1, endpoint_limits={'thumbnails/set': (1.0, 1)})
+        rate_limiter.acquire(endpoint='thumbnails/set')
+
+        # This one waits about a second for the endpoint bucket.
+        waiting = threading.Thread(target=rate_limiter.acquire, kwargs={'endpoint': 'thumbnails/set'})
+        waiting.start()
+
+        # By now the global bucket has refilled, and it's still there for another endpoint.
+        time.sleep(0.6)
+        waited = rate_limiter.acquire(endpoint='videos')
+        waiting.join()
+
+        self.assertLess(waited, 0.2)
+
+    def test_file_backend_shares_budget(self):
+        """Two limiters on the same state file draw from one budget."""
+
+        with tempfile.TemporaryDirectory() as temp_folder:
+
+            state_path = temp_folder + '/rate_limit.json'
+            first = RateLimiter(rate=20.0, capacity=1, backend=FileLockBackend(state_path=state_path))
+            second = RateLimiter(rate=20.0, capacity=1, backend=FileLockBackend(state_path=state_path))
+
+            self.assertEqual(first.acquire(endpoint='videos'), 0.0)
+            self.assertGreater(second.acquire(endpoint='videos'), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+from youtube import renderer
+from youtube.palette import BACKGROUND_BLACK
+from youtube.palette import FOREGROUND_WHITE
+from youtube.palette import HIGH_CONTRAST_GREEN
+
+
+@unittest.skipIf(renderer.Image is None, 'Pillow is not installed')
+class ThumbnailRendererTest(TestCase):
+
+    """Will perform a unit test for the headless thumbnail renderer."""
+
+    def setUp(self) -> None:
+        """Set up a temporary output folder."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+
+    def test_render_colors_character_ranges(self):
+        """Recolored characters show up in the rendered image."""
+
+        thumbnail_renderer = renderer.ThumbnailRenderer()
+        thumbnail_renderer.set_goal_subscriber_text(text='HELP MY CHANNEL GROW TO\n100,000 SUBSCRIBERS !!!')
+        thumbnail_renderer.recolor_match(frame='GoalSubscriber', pattern='100,000', color=HIGH_CONTRAST_GREEN)
+
+        thumbnail = thumbnail_renderer.render()
+        colors = {color for _, color in thumbnail.convert('RGB').getcolors(maxcolors=1280 * 720)}
+
+        self.assertEqual(thumbnail.size, (1280, 720))
+        self.assertIn(BACKGROUND_BLACK, colors)
+        self.assertIn(HIGH_CONTRAST_GREEN, colors)
+
+    def test_template_layers_are_cached(self):
+        """The static layers are only rasterized once."""
+
+        first = renderer.rasterize_base(template=renderer.DEFAULT_TEMPLATE)
+        second = renderer.rasterize_base(template=renderer.DEFAULT_TEMPLATE)
+
+        self.assertIs(first, second)
+
+    def test_render_batch(self):
+        """A batch renders one PNG per job, in order."""
+
+        jobs = [
+            {
+                'file_name': os.path.join(self.temp_folder.name, 'thumbnail_{}'.format(count)),
+                'texts': {'CurrentSubscriber': '{:,} SO FAR !!!'.format(count)},
+                'colors': [{'frame': 'CurrentSubscriber', 'start': -10, 'color': FOREGROUND_WHITE}]
+            }
+            for count in [25400, 25500]
+        ]
+
+        paths = renderer.render_batch(jobs=jobs, max_workers=2)
+
+        self.assertEqual(paths, [job['file_name'] + '.png' for job in jobs])
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+    def tearDown(self) -> None:
+        """Teardown the temporary folder."""
+
+        self.temp_folder.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
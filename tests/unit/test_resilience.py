@@ -0,0 +1,117 @@
+import time
+import unittest
+from unittest import TestCase
+from youtube.metrics import RequestMetrics
+from youtube.resilience import CircuitOpenError
+from youtube.resilience import CircuitBreakerTransport
+from youtube.resilience import HedgingTransport
+
+
+class FakeResponse():
+
+    def __init__(self, status_code: int, content: str = '') -> None:
+        self.status_code = status_code
+        self.content = content
+
+
+class FakeTransport():
+
+    """Answers with a list of scripted status codes and delays."""
+
+    def __init__(self, status_codes: list = None, delays: list = None) -> None:
+        self.status_codes = list(status_codes or [])
+        self.delays = list(delays or [])
+        self.calls = 0
+
+    def send(self, method, url, **kwargs):
+        self.calls += 1
+        call = self.calls
+        if self.delays:
+            time.sleep(self.delays.pop(0))
+        status_code = self.status_codes.pop(0) if self.status_codes else 200
+        return FakeResponse(status_code=status_code, content='call-{}'.format(call))
+
+
+URL = 'https://www.googleapis.com/youtube/v3/playlistItems'
+
+
+class CircuitBreakerTransportTest(TestCase):
+
+    """Will perform a unit test for the circuit breaker."""
+
+    def test_circuit_opens_and_fails_fast(self):
+        """After enough failures requests are refused without being sent."""
+
+        inner = FakeTransport(status_codes=[503] * 4)
+        transport = CircuitBreakerTransport(transport=inner, failure_rate=0.5, window=4, minimum_requests=4, cooldown=60)
+
+        for _ in range(4):
+            transport.send(method='get', url=URL)
+
+        with self.assertRaises(CircuitOpenError):
+            transport.send(method='get', url=URL)
+
+        self.assertEqual(inner.calls, 4)
+        self.assertEqual(transport.counters['playlistItems']['rejected'], 1)
+
+        # Other endpoints aren't affected.
+        transport.send(method='get', url=URL.replace('playlistItems', 'videos'))
+
+    def test_trial_request_closes_circuit(self):
+        """Once the cooldown passes a good trial request closes the circuit."""
+
+        inner = FakeTransport(status_codes=[500, 500])
+        transport = CircuitBreakerTransport(transport=inner, window=2, minimum_requests=2, cooldown=0.01)
+
+        transport.send(method='get', url=URL)
+        transport.send(method='get', url=URL)
+        self.assertEqual(transport.state('playlistItems'), 'open')
+
+        time.sleep(0.02)
+        transport.send(method='get', url=URL)
+
+        self.assertEqual(transport.state('playlistItems'), 'closed')
+
+
+class HedgingTransportTest(TestCase):
+
+    """Will perform a unit test for hedged requests."""
+
+    def test_slow_read_is_hedged(self):
+        """The hedge answers first when the primary is slow."""
+
+        inner = FakeTransport(delays=[0.5, 0.0])
+        transport = HedgingTransport(transport=inner, delay=0.05)
+
+        response = transport.send(method='get', url=URL)
+
+        self.assertEqual(response.content, 'call-2')
+        self.assertEqual(transport.counters['playlistItems']['hedge_wins'], 1)
+        transport.close()
+
+    def test_hedges_are_counted_as_retries(self):
+        """A hedge shows up as a retry in the request metrics."""
+
+        metrics = RequestMetrics()
+        inner = FakeTransport(delays=[0.5, 0.0])
+        transport = HedgingTransport(transport=inner, delay=0.05, metrics=metrics)
+
+        transport.send(method='get', url=URL)
+
+        self.assertEqual(metrics.snapshot()['GET playlistItems']['retries'], 1)
+        transport.close()
+
+    def test_writes_are_never_hedged(self):
+        """A slow write is only sent once."""
+
+        inner = FakeTransport(delays=[0.1])
+        transport = HedgingTransport(transport=inner, delay=0.01)
+
+        transport.send(method='post', url=URL)
+
+        self.assertEqual(inner.calls, 1)
+        transport.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
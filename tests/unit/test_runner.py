@@ -0,0 +1,155 @@
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest import TestCase
+from unittest import mock
+from youtube.mock_server import MockYouTubeServer
+from youtube.runner import SyncRunner
+from youtube.runner import sync_channel
+
+try:
+    from google.oauth2.credentials import Credentials
+    from youtube.client import YouTubeClient
+except ImportError:
+    YouTubeClient = None
+
+
+@unittest.skipIf(YouTubeClient is None, 'requests and google-auth are needed for the client.')
+class SyncChannelTest(TestCase):
+
+    """Will perform a unit test for syncing a channel against the mock server."""
+
+    def setUp(self) -> None:
+        """Set up the Server and a config pointed at it."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.folder = pathlib.Path(self.temp_folder.name)
+
+    def tearDown(self) -> None:
+        """Tear down the folder."""
+
+        self.temp_folder.cleanup()
+
+    def write_config(self, mock_server: MockYouTubeServer, state_path: str = 'state.json') -> str:
+        """Writes a config file in the `configs/config.ini` format."""
+
+        client_secret_path = self.folder.joinpath('client_secret.json')
+        client_secret_path.write_text('{}')
+
+        config_path = self.folder.joinpath('channel.ini')
+        config_path.write_text(
+            '[main]\n'
+            'api_key = mock-key\n'
+            'channel_id = {channel_id}\n'
+            'client_secret_path = {client_secret_path}\n'
+            'state_path = {state_path}\n'
+            'api_url = {api_url}\n'.format(
+                channel_id=mock_server.channel_id,
+                client_secret_path=client_secret_path,
+                state_path=self.folder.joinpath(state_path),
+                api_url=mock_server.url
+            )
+        )
+
+        return str(config_path)
+
+    def sync(self, mock_server: MockYouTubeServer) -> dict:
+        """Syncs the mock channel in this process, with made up credentials."""
+
+        with mock.patch.object(YouTubeClient, 'oauth_workflow', return_value=Credentials(token='mock-token')):
+            with mock.patch('builtins.print'):
+                return sync_channel(
+                    config_path=self.write_config(mock_server=mock_server),
+                    output_folder=str(self.folder.joinpath('channels'))
+                )
+
+    def test_sync_writes_every_file(self):
+        """Sync the channel and check the files and the video dedupe."""
+
+        with MockYouTubeServer(page_size=50) as mock_server:
+            summary = self.sync(mock_server=mock_server)
+            video_requests = mock_server.request_log.count(('GET', 'videos'))
+
+        channel_folder = self.folder.joinpath('channels', mock_server.channel_id)
+
+        self.assertEqual(summary['errors'], [])
+        self.assertEqual(
+            sorted(pathlib.Path(file_path).name for file_path in summary['files']),
+            ['channel_memberships.json', 'channel_playlists.json', 'channel_playlists_items_all.json', 'channel_videos.json']
+        )
+        self.assertTrue(all(pathlib.Path(file_path).parent == channel_folder for file_path in summary['files']))
+
+        # Videos in several playlists are grabbed once.
+        self.assertEqual(summary['playlists'], len(mock_server.playlists))
+        self.assertEqual(summary['videos'], len(mock_server.videos))
+        self.assertLess(summary['videos'], summary['playlist_items'])
+        self.assertEqual(video_requests, -(-summary['videos'] // 50))
+
+        with open(channel_folder.joinpath('channel_videos.json')) as videos_file:
+            video_ids = [video['id'] for page in json.load(videos_file) for video in page['items']]
+
+        self.assertEqual(len(video_ids), len(set(video_ids)))
+
+    def test_sync_collects_errors(self):
+        """Run out of quota half way and make sure the errors are reported."""
+
+        with MockYouTubeServer(page_size=50, quota_limit=20) as mock_server:
+            summary = self.sync(mock_server=mock_server)
+
+        self.assertTrue(summary['errors'])
+        self.assertTrue(all(error['code'] == 403 for error in summary['errors']))
+
+    def test_sync_starts_from_saved_memberships(self):
+        """A later sync loads the saved memberships, keeps them through errors and drops gone playlists."""
+
+        with MockYouTubeServer(page_size=50) as mock_server:
+            self.sync(mock_server=mock_server)
+
+        membership_path = self.folder.joinpath('channels', mock_server.channel_id, 'channel_memberships.json')
+
+        with open(membership_path) as membership_file:
+            saved = json.load(membership_file)
+
+        # A playlist that isn't on the channel anymore.
+        with open(membership_path, 'w') as membership_file:
+            json.dump(saved + [['item-gone', 'PLgone', 'video-gone', 0]], membership_file)
+
+        with MockYouTubeServer(page_size=50) as mock_server:
+            summary = self.sync(mock_server=mock_server)
+
+        with open(membership_path) as membership_file:
+            self.assertEqual(sorted(map(tuple, json.load(membership_file))), sorted(map(tuple, saved)))
+
+        self.assertEqual(summary['videos'], len(mock_server.videos))
+
+        # Out of quota half way, what the first sync found is kept.
+        with MockYouTubeServer(page_size=50, quota_limit=20) as mock_server:
+            summary = self.sync(mock_server=mock_server)
+
+        self.assertTrue(summary['errors'])
+
+        with open(membership_path) as membership_file:
+            self.assertEqual(sorted(map(tuple, json.load(membership_file))), sorted(map(tuple, saved)))
+
+    def test_worker_without_credentials_fails_fast(self):
+        """A channel that was never logged in fails instead of prompting."""
+
+        with MockYouTubeServer() as mock_server:
+
+            config_path = self.write_config(mock_server=mock_server, state_path='missing_state.json')
+
+            with mock.patch('builtins.print'):
+                summaries = SyncRunner(
+                    config_paths=[config_path],
+                    output_folder=self.folder.joinpath('channels'),
+                    max_workers=1
+                ).run()
+
+        self.assertEqual(summaries[0]['status'], 'failed')
+        self.assertIn('PermissionError', summaries[0]['errors'][0])
+        self.assertTrue(self.folder.joinpath('channels', 'sync_summary.json').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
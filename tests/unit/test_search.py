@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+from youtube.search import SearchIndex
+from youtube.storage import write_json
+
+
+class SearchIndexTest(TestCase):
+
+    """Will perform a unit test for the full text search index."""
+
+    def setUp(self) -> None:
+        """Set up an index with a couple of videos and a comment."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.search_index = SearchIndex(database_path=os.path.join(self.temp_folder.name, 'search.db'))
+
+        self.videos = {
+            'kind': 'youtube#videoListResponse',
+            'items': [
+                {
+                    'kind': 'youtube#video',
+                    'id': 'oVNeufjrx8M',
+                    'snippet': {
+                        'title': "How To Use Python's Pandas With The VBA Library",
+                        'description': 'We explore how to use pandas alongside VBA.',
+                        'tags': ['python', 'pandas', 'vba']
+                    }
+                },
+                {
+                    'kind': 'youtube#video',
+                    'id': 'wZjA6d2WDYk',
+                    'snippet': {
+                        'title': 'Using the Bureau of Economic Analysis Python API Library',
+                        'description': 'Grab economic data into a pandas dataframe.'
+                    }
+                }
+            ]
+        }
+
+        self.comment_thread = {
+            'kind': 'youtube#commentThread',
+            'id': 'UgzQ3kJ1fJ0',
+            'snippet': {
+                'videoId': 'oVNeufjrx8M',
+                'topLevelComment': {
+                    'kind': 'youtube#comment',
+                    'id': 'UgzQ3kJ1fJ0',
+                    'snippet': {
+                        'videoId': 'oVNeufjrx8M',
+                        'authorDisplayName': 'Viewer',
+                        'textOriginal': 'Does this work with Excel on a Mac?'
+                    }
+                }
+            }
+        }
+
+    def test_ranking_and_kinds(self):
+        """Title matches rank first, and results can be filtered by kind."""
+
+        self.search_index.add(resources=[self.videos, self.comment_thread])
+
+        results = self.search_index.search(query='pandas')
+
+        self.assertEqual([result['id'] for result in results], ['oVNeufjrx8M', 'wZjA6d2WDYk'])
+
+        comments = self.search_index.search(query='excel mac', kinds=['comment'])
+
+        self.assertEqual(len(comments), 1)
+        self.assertEqual(comments[0]['video_id'], 'oVNeufjrx8M')
+
+    def test_incremental_updates(self):
+        """Unchanged resources are skipped and changed ones are rewritten."""
+
+        self.assertEqual(self.search_index.add(resources=[self.videos])['added'], 2)
+        self.assertEqual(self.search_index.add(resources=[self.videos])['unchanged'], 2)
+
+        self.videos['items'][1]['snippet']['title'] = 'Grabbing GDP Data With Python'
+        counts = self.search_index.add(resources=[self.videos])
+
+        self.assertEqual(counts['updated'], 1)
+        self.assertEqual(self.search_index.count(), 2)
+        self.assertEqual(self.search_index.search(query='GDP')[0]['id'], 'wZjA6d2WDYk')
+        self.assertEqual(self.search_index.search(query='bureau'), [])
+
+        self.assertTrue(self.search_index.remove(kind='video', resource_id='wZjA6d2WDYk'))
+        self.assertEqual(self.search_index.search(query='GDP'), [])
+
+    def test_saved_playlist_items(self):
+        """The saved playlist items can be searched."""
+
+        data_file = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'channel_playlists_items_all.json')
+
+        self.search_index.add_file(file_path=data_file)
+        results = self.search_index.search(query='pandas', kinds=['playlistItem'], limit=5)
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result['parent_id'].startswith('PL') for result in results))
+
+    def test_comment_author_does_not_rank_like_a_title(self):
+        """A commenter named after the query doesn't outrank a video titled with it."""
+
+        self.comment_thread['snippet']['topLevelComment']['snippet']['authorDisplayName'] = 'Pandas Fan'
+        self.search_index.add(resources=[self.videos, self.comment_thread])
+
+        results = self.search_index.search(query='pandas')
+
+        self.assertEqual((results[0]['kind'], results[0]['id']), ('video', 'oVNeufjrx8M'))
+        self.assertIn('comment', [result['kind'] for result in results])
+
+    def test_grabbed_comments(self):
+        """The `{video_id: [pages]}` shape from `grab_comments` is indexed, passed in or saved."""
+
+        video_comments = {
+            'oVNeufjrx8M': [
+                {'kind': 'youtube#commentThreadListResponse', 'nextPageToken': 'next', 'items': [self.comment_thread]},
+                {'kind': 'youtube#commentThreadListResponse', 'items': []}
+            ],
+            'wZjA6d2WDYk': [
+                {'error': {'code': 403, 'message': 'The video has disabled comments.'}}
+            ]
+        }
+
+        counts = self.search_index.add(resources=video_comments)
+
+        self.assertEqual(counts['added'], 1)
+        self.assertEqual(self.search_index.search(query='excel mac')[0]['video_id'], 'oVNeufjrx8M')
+
+        file_path = write_json(file_path=os.path.join(self.temp_folder.name, 'video_comments.json'), content=video_comments)
+
+        self.assertEqual(self.search_index.add_file(file_path=file_path)['unchanged'], 1)
+
+    def tearDown(self) -> None:
+        """Teardown the index."""
+
+        self.search_index.close()
+        self.temp_folder.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
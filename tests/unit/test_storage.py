@@ -0,0 +1,108 @@
+import pathlib
+import tempfile
+import unittest
+from unittest import TestCase
+from youtube import storage
+from youtube import json_backend
+
+
+class StorageTest(TestCase):
+
+    """Will perform a unit test for the data file storage helpers."""
+
+    def setUp(self) -> None:
+        """Set up a temporary data folder."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.folder = pathlib.Path(self.temp_folder.name)
+        self.content = [{'kind': 'youtube#playlistItemListResponse', 'items': [{'id': 'abc', 'title': 'Café'}]}]
+
+    def test_gzip_round_trip(self):
+        """A gzip file is written with a suffix and read back transparently."""
+
+        file_path = storage.data_file_path(folder=self.folder, file_name='items', compression='gzip')
+        storage.write_json(file_path=file_path, content=self.content, compression='gzip', compact=True)
+
+        self.assertEqual(file_path.name, 'items.json.gz')
+        self.assertEqual(storage.read_json(file_path=file_path), self.content)
+
+    def test_find_falls_back_to_compressed_file(self):
+        """Asking for the plain file finds its compressed version."""
+
+        file_path = storage.data_file_path(folder=self.folder, file_name='items', compression='gzip')
+        storage.write_json(file_path=file_path, content=self.content, compression='gzip')
+
+        found = storage.find_data_file(file_path=self.folder.joinpath('items.json'))
+
+        self.assertEqual(found, file_path)
+
+        with self.assertRaises(FileNotFoundError):
+            storage.find_data_file(file_path=self.folder.joinpath('missing.json'))
+
+    def test_compact_is_smaller_than_pretty(self):
+        """Compact JSON drops the indentation."""
+
+        pretty = storage.write_json(file_path=self.folder.joinpath('pretty.json'), content=self.content)
+        compact = storage.write_json(file_path=self.folder.joinpath('compact.json'), content=self.content, compact=True)
+
+        self.assertLess(compact.stat().st_size, pretty.stat().st_size)
+        self.assertEqual(storage.read_json(file_path=compact), self.content)
+
+    @unittest.skipIf(storage.zstandard is None, 'zstandard is not installed')
+    def test_zstd_round_trip(self):
+        """A zstd file is read back transparently."""
+
+        file_path = storage.data_file_path(folder=self.folder, file_name='items', compression='zstd')
+        storage.write_json(file_path=file_path, content=self.content, compression='zstd')
+
+        self.assertEqual(storage.read_json(file_path=file_path), self.content)
+
+    def test_backends_read_each_others_files(self):
+        """A file written with one JSON backend reads back the same with the other."""
+
+        default_backend = json_backend.backend()
+        backends = [name for name in json_backend.BACKENDS if name != 'orjson' or json_backend.orjson]
+
+        try:
+            for writer in backends:
+                for reader in backends:
+
+                    json_backend.use_backend(name=writer)
+                    file_path = storage.write_json(file_path=self.folder.joinpath('items.json'), content=self.content)
+
+                    json_backend.use_backend(name=reader)
+                    self.assertEqual(storage.read_json(file_path=file_path), self.content)
+        finally:
+            json_backend.use_backend(name=default_backend)
+
+    def test_backends_encode_the_same_bytes(self):
+        """Both JSON backends encode non-ASCII content to the same bytes."""
+
+        if json_backend.orjson is None:
+            self.skipTest('orjson is needed to compare the backends.')
+
+        default_backend = json_backend.backend()
+        encoded = {}
+
+        try:
+            for name in json_backend.BACKENDS:
+                json_backend.use_backend(name=name)
+                encoded[name] = [
+                    json_backend.dumps(self.content),
+                    json_backend.dumps(self.content, sort_keys=True),
+                    json_backend.dumps(self.content, pretty=True)
+                ]
+        finally:
+            json_backend.use_backend(name=default_backend)
+
+        self.assertEqual(encoded['orjson'], encoded['json'])
+        self.assertIn('Café'.encode('utf-8'), encoded['json'][0])
+
+    def tearDown(self) -> None:
+        """Teardown the data folder."""
+
+        self.temp_folder.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import os
+import time
+import tempfile
+import threading
+import unittest
+from unittest import TestCase
+from unittest import mock
+from youtube.thumbnails import file_hash
+from youtube.thumbnails import ThumbnailIndex
+
+try:
+    from google.oauth2.credentials import Credentials
+    from youtube.client import YouTubeClient
+except ImportError:
+    YouTubeClient = None
+
+
+class ThumbnailIndexTest(TestCase):
+
+    """Will perform a unit test for the thumbnail upload index."""
+
+    def setUp(self) -> None:
+        """Write a thumbnail and set up the index path."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.index_path = os.path.join(self.temp_folder.name, 'thumbnail_index.json')
+        self.thumbnail_path = os.path.join(self.temp_folder.name, 'current_thumbnail.png')
+
+        with open(self.thumbnail_path, 'wb') as thumbnail_file:
+            thumbnail_file.write(os.urandom(4096))
+
+    def test_unchanged_after_record(self):
+        """A recorded hash is unchanged, a different one isn't."""
+
+        thumbnail_index = ThumbnailIndex(index_path=self.index_path)
+        content_hash = file_hash(file_path=self.thumbnail_path)
+
+        self.assertFalse(thumbnail_index.is_unchanged(video_id='XEjaDFqImCk', content_hash=content_hash))
+
+        thumbnail_index.record(video_id='XEjaDFqImCk', content_hash=content_hash)
+
+        self.assertTrue(thumbnail_index.is_unchanged(video_id='XEjaDFqImCk', content_hash=content_hash))
+        self.assertFalse(thumbnail_index.is_unchanged(video_id='XEjaDFqImCk', content_hash='0' * 64))
+        self.assertFalse(thumbnail_index.is_unchanged(video_id='Jd6q1AzNQvQ', content_hash=content_hash))
+
+    def test_index_survives_a_restart(self):
+        """The index is read back from disk, and forgetting a video clears it."""
+
+        content_hash = file_hash(file_path=self.thumbnail_path)
+        ThumbnailIndex(index_path=self.index_path).record(video_id='XEjaDFqImCk', content_hash=content_hash)
+
+        thumbnail_index = ThumbnailIndex(index_path=self.index_path)
+        self.assertEqual(thumbnail_index.last_hash(video_id='XEjaDFqImCk'), content_hash)
+
+        thumbnail_index.forget(video_id='XEjaDFqImCk')
+        self.assertIsNone(ThumbnailIndex(index_path=self.index_path).last_hash(video_id='XEjaDFqImCk'))
+
+    def tearDown(self) -> None:
+        """Teardown the temporary folder."""
+
+        self.temp_folder.cleanup()
+
+
+@unittest.skipIf(YouTubeClient is None, 'requests and google-auth are needed for the client.')
+class UploadThumbnailsTest(TestCase):
+
+    """Will perform a unit test for uploading thumbnails through the client."""
+
+    def setUp(self) -> None:
+        """Write a thumbnail and set up a Client."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.thumbnail_path = os.path.join(self.temp_folder.name, 'current_thumbnail.png')
+        self.thumbnail_index = ThumbnailIndex(index_path=os.path.join(self.temp_folder.name, 'thumbnail_index.json'))
+
+        with open(self.thumbnail_path, 'wb') as thumbnail_file:
+            thumbnail_file.write(os.urandom(4096))
+
+        with mock.patch('builtins.print'):
+            self.youtube_session = YouTubeClient(
+                api_key='mock-key',
+                channel_id='UCmock',
+                client_secret_path='client_secret.json',
+                state_path=os.path.join(self.temp_folder.name, 'state.json'),
+                credentials=Credentials(token='mock-token')
+            )
+
+    def test_unchanged_image_is_not_uploaded_again(self):
+        """The second upload of the same image to the same video is skipped."""
+
+        set_thumbnail = mock.Mock(return_value={'kind': 'youtube#thumbnailSetResponse', 'items': []})
+
+        with mock.patch.object(self.youtube_session, '_set_thumbnail', set_thumbnail):
+
+            first = self.youtube_session.upload_thumbnail(
+                video_id='XEjaDFqImCk',
+                thumbnail_path=self.thumbnail_path,
+                thumbnail_index=self.thumbnail_index
+            )
+            second = self.youtube_session.upload_thumbnail(
+                video_id='XEjaDFqImCk',
+                thumbnail_path=self.thumbnail_path,
+                thumbnail_index=self.thumbnail_index
+            )
+
+        self.assertNotIn('skipped', first)
+        self.assertTrue(second['skipped'])
+        self.assertEqual(set_thumbnail.call_count, 1)
+        self.assertEqual(self.youtube_session.metrics.snapshot()['POST thumbnails/set']['cache_hits'], 1)
+
+    def test_failed_upload_is_not_recorded(self):
+        """An error response doesn't mark the image as uploaded, so it's tried again."""
+
+        set_thumbnail = mock.Mock(return_value={'error': {'code': 500, 'message': 'Backend Error'}})
+
+        with mock.patch.object(self.youtube_session, '_set_thumbnail', set_thumbnail):
+            for _ in range(2):
+                self.youtube_session.upload_thumbnail(
+                    video_id='XEjaDFqImCk',
+                    thumbnail_path=self.thumbnail_path,
+                    thumbnail_index=self.thumbnail_index
+                )
+
+        self.assertEqual(set_thumbnail.call_count, 2)
+        self.assertIsNone(self.thumbnail_index.last_hash(video_id='XEjaDFqImCk'))
+
+    def test_bulk_upload_is_bounded_and_reports_failures(self):
+        """No more than `max_workers` uploads run at once, and a failure doesn't stop the rest."""
+
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def set_thumbnail(video_id, thumbnail_path, **kwargs):
+
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+
+            try:
+                time.sleep(0.02)
+
+                if video_id == 'broken':
+                    raise OSError('The connection dropped.')
+
+                return {'kind': 'youtube#thumbnailSetResponse', 'videoId': video_id}
+            finally:
+                with lock:
+                    running[0] -= 1
+
+        assignments = {'video-{}'.format(index): self.thumbnail_path for index in range(12)}
+        assignments['broken'] = self.thumbnail_path
+
+        with mock.patch.object(self.youtube_session, '_set_thumbnail', side_effect=set_thumbnail):
+            responses = self.youtube_session.upload_thumbnails(assignments=assignments, max_workers=3)
+
+        self.assertLessEqual(peak[0], 3)
+        self.assertGreater(peak[0], 1)
+        self.assertEqual(set(responses), set(assignments))
+        self.assertEqual(responses['broken'], {'error': {'message': 'The connection dropped.'}})
+        self.assertEqual(responses['video-0'], {'kind': 'youtube#thumbnailSetResponse', 'videoId': 'video-0'})
+
+    def tearDown(self) -> None:
+        """Teardown the temporary folder."""
+
+        self.temp_folder.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import pathlib
+import tempfile
+import unittest
+from unittest import TestCase
+from unittest import mock
+from youtube import json_backend
+
+try:
+    from youtube.transport import TransportResponse
+    from youtube.transport import RecordingTransport
+    from youtube.transport import ReplayTransport
+except ImportError:
+    TransportResponse = None
+
+try:
+    from google.oauth2.credentials import Credentials
+    from youtube.client import YouTubeClient
+except ImportError:
+    YouTubeClient = None
+
+
+class ScriptedTransport():
+
+    """Answers each request with the next scripted response."""
+
+    def __init__(self, responses: list) -> None:
+        self.responses = list(responses)
+        self.calls = []
+
+    def send(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+URL = 'https://www.googleapis.com/youtube/v3/playlistItems'
+
+
+@unittest.skipIf(TransportResponse is None, 'requests is needed for the transports.')
+class RecordReplayTest(TestCase):
+
+    """Will perform a unit test for recording a cassette and playing it back."""
+
+    def setUp(self) -> None:
+        """Set up a temporary cassette."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.cassette_path = pathlib.Path(self.temp_folder.name).joinpath('cassettes', 'crawl.jsonl')
+
+    def tearDown(self) -> None:
+        """Tear down the temporary cassette."""
+
+        self.temp_folder.cleanup()
+
+    def test_round_trip(self):
+        """Record a few requests, then replay them without the network."""
+
+        inner = ScriptedTransport(
+            responses=[
+                TransportResponse(status_code=200, headers={'Content-Type': 'application/json', 'Set-Cookie': 'secret'}, content=b'{"items": [1]}', elapsed=0.25),
+                TransportResponse(status_code=200, headers={}, content=b'{"items": [2]}'),
+                TransportResponse(status_code=201, headers={}, content=b'\x89PNG\x00\xff'),
+                TransportResponse(status_code=204, headers={}, content=b'')
+            ]
+        )
+        recorder = RecordingTransport(transport=inner, cassette_path=self.cassette_path)
+
+        recorder.send(method='get', url=URL, params={'key': 'mock-key', 'part': ['snippet', 'id'], 'playlistId': 'PL1'})
+        recorder.send(method='get', url=URL, params={'key': 'mock-key', 'part': ['snippet', 'id'], 'playlistId': 'PL1'})
+        recorder.send(method='post', url=URL, data=b'binary')
+        recorder.send(method='delete', url=URL, params={'id': 'item-1'})
+
+        # Secrets never reach the cassette.
+        cassette = self.cassette_path.read_text(encoding='utf-8')
+        self.assertNotIn('mock-key', cassette)
+        self.assertNotIn('Set-Cookie', cassette)
+
+        replay = ReplayTransport(cassette_path=self.cassette_path)
+        self.assertEqual(replay.remaining(), 4)
+
+        # Params are matched in any order and without the API key, repeats play back in order.
+        first = replay.send(method='get', url=URL, params={'playlistId': 'PL1', 'part': ['snippet', 'id'], 'key': 'other-key'})
+        second = replay.send(method='get', url=URL, params={'playlistId': 'PL1', 'part': ['snippet', 'id']})
+
+        self.assertEqual(first.json(), {'items': [1]})
+        self.assertEqual(first.headers, {'Content-Type': 'application/json'})
+        self.assertEqual(first.elapsed, 0.25)
+        self.assertEqual(second.json(), {'items': [2]})
+
+        # The last recording of a request is kept, so it can be replayed again.
+        self.assertEqual(replay.send(method='get', url=URL, params={'playlistId': 'PL1', 'part': ['snippet', 'id']}).json(), {'items': [2]})
+
+        binary = replay.send(method='post', url=URL, data=b'binary')
+        self.assertEqual((binary.status_code, binary.content), (201, b'\x89PNG\x00\xff'))
+
+        empty = replay.send(method='delete', url=URL, params={'id': 'item-1'})
+        self.assertEqual((empty.status_code, empty.content), (204, b''))
+
+        self.assertEqual(len(inner.calls), 4)
+
+    def test_unknown_request(self):
+        """A request that was never recorded is an error, not a network call."""
+
+        inner = ScriptedTransport(responses=[TransportResponse(status_code=200, headers={}, content=b'{}')])
+        recorder = RecordingTransport(transport=inner, cassette_path=self.cassette_path)
+        recorder.send(method='get', url=URL, params={'playlistId': 'PL1'})
+
+        replay = ReplayTransport(cassette_path=self.cassette_path)
+
+        with self.assertRaisesRegex(LookupError, 'playlistId=PL2'):
+            replay.send(method='get', url=URL, params={'playlistId': 'PL2'})
+
+        # The body is part of the match too.
+        with self.assertRaises(LookupError):
+            replay.send(method='post', url=URL, json={'playlistId': 'PL1'})
+
+    def test_non_ascii_body_replays_with_either_backend(self):
+        """A cassette recorded with one JSON backend matches requests hashed by the other."""
+
+        if json_backend.orjson is None:
+            self.skipTest('orjson is needed to compare the backends.')
+
+        default_backend = json_backend.backend()
+        payload = {'snippet': {'title': 'Café — ダンス', 'playlistId': 'PL1'}}
+
+        try:
+            json_backend.use_backend(name='orjson')
+            inner = ScriptedTransport(responses=[TransportResponse(status_code=200, headers={}, content='{"title": "Café"}'.encode('utf-8'))])
+            RecordingTransport(transport=inner, cassette_path=self.cassette_path).send(method='post', url=URL, json=payload)
+
+            json_backend.use_backend(name='json')
+            response = ReplayTransport(cassette_path=self.cassette_path).send(method='post', url=URL, json=payload)
+        finally:
+            json_backend.use_backend(name=default_backend)
+
+        self.assertEqual(response.json(), {'title': 'Café'})
+
+
+@unittest.skipIf(YouTubeClient is None, 'requests and google-auth are needed for the client.')
+class ClientResponseTest(TestCase):
+
+    """Will perform a unit test for how the client reads transport responses."""
+
+    def make_client(self, responses: list) -> 'YouTubeClient':
+        """Builds a client answered by a scripted transport."""
+
+        with mock.patch('builtins.print'):
+            return YouTubeClient(
+                api_key='mock-key',
+                channel_id='UCmock',
+                client_secret_path='client_secret.json',
+                state_path='state.json',
+                credentials=Credentials(token='mock-token'),
+                transport=ScriptedTransport(responses=responses)
+            )
+
+    def test_empty_success_is_an_empty_dict(self):
+        """A `204` from a delete is a success with nothing in it."""
+
+        youtube_session = self.make_client(responses=[TransportResponse(status_code=204, headers={}, content=b'')])
+
+        self.assertEqual(youtube_session._make_request(endpoint='playlistItems', method='delete', params={'id': 'item-1'}), {})
+
+    def test_empty_error_is_still_an_error(self):
+        """An error status with no body comes back as an error, not as a success."""
+
+        youtube_session = self.make_client(responses=[TransportResponse(status_code=503, headers={}, content=b'')])
+
+        with mock.patch('builtins.print'):
+            response = youtube_session._make_request(endpoint='playlistItems', method='delete', params={'id': 'item-1'})
+
+        self.assertIn('error', response)
+        self.assertEqual(response['error']['code'], 503)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+from unittest import mock
+from youtube.upload import UploadError
+from youtube.upload import ResumableUpload
+from youtube.upload import CHUNK_ALIGNMENT
+
+
+class FakeResponse():
+
+    def __init__(self, status_code: int, headers: dict = None, content: bytes = b'') -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+
+class FakeUploadServer():
+
+    """Speaks just enough of the resumable upload protocol, and can drop chunks."""
+
+    def __init__(self, drop_chunks: list = None) -> None:
+        self.received = b''
+        self.total = None
+        self.chunk_requests = 0
+        self.drop_chunks = list(drop_chunks or [])
+
+    def _incomplete(self) -> FakeResponse:
+        headers = {'range': 'bytes=0-{}'.format(len(self.received) - 1)} if self.received else {}
+        return FakeResponse(status_code=308, headers=headers)
+
+    def send(self, method, url, headers=None, params=None, json=None, data=None, files=None):
+
+        if method == 'post':
+            self.total = int(headers['X-Upload-Content-Length'])
+            return FakeResponse(status_code=200, headers={'Location': 'https://upload/session/1'})
+
+        # A status query.
+        if headers['Content-Range'].startswith('bytes */'):
+            if len(self.received) == self.total:
+                return FakeResponse(status_code=200, content=b'{"id": "abc"}')
+            return self._incomplete()
+
+        self.chunk_requests += 1
+
+        # Simulate the connection dropping mid chunk, after half of it landed.
+        if self.chunk_requests in self.drop_chunks:
+            self.received += data[:len(data) // 2]
+            raise ConnectionError('connection reset')
+
+        self.received += data
+
+        if len(self.received) == self.total:
+            return FakeResponse(status_code=200, content=b'{"id": "abc"}')
+
+        return self._incomplete()
+
+
+class ResumableUploadTest(TestCase):
+
+    """Will perform a unit test for the resumable upload engine."""
+
+    def setUp(self) -> None:
+        """Write a file a bit over two chunks long."""
+
+        self.temp_folder = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_folder.name, 'thumbnail.png')
+        self.content = os.urandom(2 * CHUNK_ALIGNMENT + 1000)
+
+        with open(self.file_path, 'wb') as media_file:
+            media_file.write(self.content)
+
+    def build_upload(self, server: FakeUploadServer, progress: list) -> ResumableUpload:
+        upload = ResumableUpload(
+            transport=server,
+            url='https://www.googleapis.com/upload/youtube/v3/thumbnails/set',
+            headers=lambda: {'Authorization': 'Bearer token'},
+            file_path=self.file_path,
+            chunk_size=CHUNK_ALIGNMENT,
+            progress_callback=progress.append
+        )
+        return upload
+
+    def test_upload_in_chunks(self):
+        """The file arrives whole, one chunk at a time."""
+
+        server = FakeUploadServer()
+        progress = []
+
+        response = self.build_upload(server=server, progress=progress).upload()
+
+        self.assertEqual(response, {'id': 'abc'})
+        self.assertEqual(server.received, self.content)
+        self.assertEqual(server.chunk_requests, 3)
+        self.assertEqual(progress[-1]['progress'], 1.0)
+
+    def test_resume_from_server_offset(self):
+        """A dropped chunk is resent from what the server reports, not from scratch."""
+
+        server = FakeUploadServer(drop_chunks=[2])
+        upload = self.build_upload(server=server, progress=[])
+
+        # Don't wait on the backoff in the test.
+        with mock.patch('youtube.upload.time.sleep'):
+            upload.upload()
+
+        self.assertEqual(server.received, self.content)
+
+    def test_retries_are_reported(self):
+        """Every resent chunk is reported as a retry."""
+
+        server = FakeUploadServer(drop_chunks=[2])
+        retries = []
+        upload = self.build_upload(server=server, progress=[])
+        upload.on_retry = lambda: retries.append(True)
+
+        with mock.patch('youtube.upload.time.sleep'):
+            upload.upload()
+
+        self.assertEqual(len(retries), 1)
+
+    def test_client_errors_are_not_retried(self):
+        """A 4xx on a chunk ends the upload."""
+
+        server = FakeUploadServer()
+        server.send = lambda method, url, **kwargs: (
+            FakeResponse(status_code=200, headers={'Location': 'x'}) if method == 'post' else FakeResponse(status_code=403)
+        )
+
+        with self.assertRaises(UploadError):
+            self.build_upload(server=server, progress=[]).upload()
+
+    def tearDown(self) -> None:
+        """Teardown the temporary folder."""
+
+        self.temp_folder.cleanup()
+
+
+if __name__ == '__main__':
+    unittest.main()
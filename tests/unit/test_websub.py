@@ -0,0 +1,164 @@
+import threading
+import unittest
+from unittest import TestCase
+from youtube.websub import sign
+from youtube.websub import subscribe
+from youtube.websub import topic_url
+from youtube.websub import parse_feed
+from youtube.websub import LocalHub
+from youtube.websub import FeedRefresher
+from youtube.websub import WebSubReceiver
+
+
+class FakeVideoSession():
+
+    """Records the targeted refreshes."""
+
+    def __init__(self) -> None:
+        self.grabbed = []
+        self.inserted = []
+        self.failed_inserts = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def grab_videos(self, video_ids, parts):
+        self.release.wait(timeout=5)
+        self.grabbed.append(list(video_ids))
+        return [{'items': [{'id': video_id, 'kind': 'youtube#video'} for video_id in video_ids]}]
+
+    def insert_playlist_items(self, part, data):
+        if self.failed_inserts:
+            self.failed_inserts -= 1
+            return {'error': {'code': 500, 'message': 'Backend Error'}}
+        self.inserted.append(data['snippet']['resourceId']['videoId'])
+        return {'id': 'item-' + data['snippet']['resourceId']['videoId']}
+
+
+class WebSubTest(TestCase):
+
+    """Will perform a unit test for the WebSub receiver, against a local hub."""
+
+    def setUp(self) -> None:
+        """Start a hub and a receiver wired to a refresher."""
+
+        self.channel_id = 'UCBsTB02yO0QGwtlfiv5m25Q'
+        self.topic = topic_url(channel_id=self.channel_id)
+        self.youtube_session = FakeVideoSession()
+        self.notified = threading.Event()
+
+        self.refresher = FeedRefresher(
+            youtube_session=self.youtube_session,
+            playlist_id='PLcFcktZ0wnNnKvxFkJ5B7pvGaGa81Ny0F',
+            on_videos=lambda videos: self.notified.set()
+        )
+
+        self.hub = LocalHub().start()
+        self.receiver = WebSubReceiver(on_notification=self.refresher, secret='s3cret', topics=[self.topic]).start()
+
+    def test_parse_feed(self):
+        """New and deleted videos are parsed."""
+
+        entries = parse_feed(body=LocalHub.video_feed(video_id='XEjaDFqImCk', channel_id=self.channel_id, title='Café'))
+        deleted = parse_feed(body=LocalHub.deleted_feed(video_id='Jd6q1AzNQvQ', channel_id=self.channel_id))
+
+        self.assertEqual(entries[0]['video_id'], 'XEjaDFqImCk')
+        self.assertEqual(entries[0]['channel_id'], self.channel_id)
+        self.assertEqual(entries[0]['title'], 'Café')
+        self.assertFalse(entries[0]['deleted'])
+        self.assertEqual(deleted, [{'video_id': 'Jd6q1AzNQvQ', 'updated': '2020-10-02T12:00:00+00:00', 'deleted': True}])
+
+    def test_subscribe_and_push(self):
+        """A verified subscription turns pushes into targeted refreshes."""
+
+        status = subscribe(callback_url=self.receiver.url, topic=self.topic, hub_url=self.hub.url, secret='s3cret')
+
+        self.assertEqual(status, 202)
+        self.assertEqual(self.receiver.verified, [('subscribe', self.topic)])
+
+        feed = LocalHub.video_feed(video_id='XEjaDFqImCk', channel_id=self.channel_id)
+
+        # The same video pushed twice, like after a title change.
+        self.assertEqual(self.hub.publish(topic=self.topic, body=feed), [204])
+        self.assertEqual(self.hub.publish(topic=self.topic, body=feed), [204])
+
+        self.assertTrue(self.notified.wait(timeout=5))
+        self.refresher.close()
+
+        self.assertEqual(self.youtube_session.grabbed, [['XEjaDFqImCk'], ['XEjaDFqImCk']])
+        self.assertEqual(self.youtube_session.inserted, ['XEjaDFqImCk'])
+
+    def test_edit_to_an_old_video_is_not_inserted(self):
+        """A push for an old video's new title refreshes it but doesn't add it to the playlist."""
+
+        feed = LocalHub.video_feed(
+            video_id='Jd6q1AzNQvQ',
+            channel_id=self.channel_id,
+            published='2019-01-01T12:00:00+00:00',
+            updated='2020-10-01T12:00:00+00:00'
+        )
+
+        self.refresher(parse_feed(body=feed)).result(timeout=5)
+
+        self.assertEqual(self.youtube_session.grabbed, [['Jd6q1AzNQvQ']])
+        self.assertEqual(self.youtube_session.inserted, [])
+
+    def test_failed_insert_is_tried_again(self):
+        """A video is only marked as inserted once the insert goes through."""
+
+        self.youtube_session.failed_inserts = 1
+        entries = parse_feed(body=LocalHub.video_feed(video_id='XEjaDFqImCk', channel_id=self.channel_id))
+
+        self.refresher(entries).result(timeout=5)
+        self.assertEqual(self.refresher.inserted, set())
+        self.assertEqual(len(self.refresher.errors), 1)
+
+        self.refresher(entries).result(timeout=5)
+        self.assertEqual(self.refresher.inserted, {'XEjaDFqImCk'})
+        self.assertEqual(self.youtube_session.inserted, ['XEjaDFqImCk'])
+
+    def test_hub_is_answered_before_the_refresh(self):
+        """The receiver doesn't hold the hub's request while the API is slow."""
+
+        self.youtube_session.release.clear()
+        body = LocalHub.video_feed(video_id='XEjaDFqImCk', channel_id=self.channel_id)
+
+        status, _ = self.receiver.handle(method='POST', query={}, body=body, signature=sign(secret='s3cret', body=body))
+
+        self.assertEqual(status, 204)
+        self.assertEqual(self.youtube_session.grabbed, [])
+
+        self.youtube_session.release.set()
+        self.assertTrue(self.notified.wait(timeout=5))
+
+    def test_unknown_topic_is_refused(self):
+        """The receiver doesn't confirm topics it didn't ask for."""
+
+        status = subscribe(
+            callback_url=self.receiver.url,
+            topic=topic_url(channel_id='UC_someone_else'),
+            hub_url=self.hub.url
+        )
+
+        self.assertEqual(status, 409)
+
+    def test_bad_signature_is_ignored(self):
+        """A notification signed with the wrong secret is acknowledged but dropped."""
+
+        body = LocalHub.video_feed(video_id='XEjaDFqImCk', channel_id=self.channel_id)
+
+        status, _ = self.receiver.handle(method='POST', query={}, body=body, signature=sign(secret='wrong', body=body))
+
+        self.assertEqual(status, 202)
+        self.assertEqual(self.receiver.rejected, 1)
+        self.assertEqual(self.youtube_session.grabbed, [])
+
+    def tearDown(self) -> None:
+        """Stop the hub and receiver."""
+
+        self.receiver.stop()
+        self.hub.stop()
+        self.refresher.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
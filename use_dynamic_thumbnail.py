@@ -1,10 +1,10 @@
-import re
 import json
 import textwrap
 from pprint import pprint
 from configparser import ConfigParser
 from youtube.client import YouTubeClient
 from youtube.adobe import AdobeIllustrator
+from youtube.thumbnails import ThumbnailIndex
 
 # Grab configuration values.
 config = ConfigParser()
@@ -62,33 +62,38 @@ current_text_range = adobe_illustrator.get_current_subscriber_text_range()
 # Grab the Text Range for Goal Subscribers.
 goal_text_range = adobe_illustrator.get_goal_subscriber_text_range()
 
-# Make sure the last 10 characters are White.
-for character in list(current_text_range.Characters)[-10:]:
-    character.CharacterAttributes.FillColor = adobe_illustrator.foreground_white
-
-# Make sure everything else is Pink.
-for character in list(current_text_range.Characters)[:-10]:
-    character.CharacterAttributes.FillColor = adobe_illustrator.high_contrast_pink
+# Make sure the last 10 characters are White, and everything else is Pink.
+adobe_illustrator.recolor_range(
+    text_range=current_text_range,
+    color=adobe_illustrator.high_contrast_pink,
+    end=-10
+)
+adobe_illustrator.recolor_range(
+    text_range=current_text_range,
+    color=adobe_illustrator.foreground_white,
+    start=-10
+)
 
-# Search for the Text we want to change colors.
-location = re.search(
+# Make the goal Green.
+adobe_illustrator.recolor_match(
+    text_range=goal_text_range,
     pattern="100,000",
-    string=goal_text_range.Contents
-).span()
-
-# Make sure everything else is Green.
-for character in list(goal_text_range.Characters)[location[0]:location[1]]:
-    character.CharacterAttributes.FillColor = adobe_illustrator.high_contrast_green
+    color=adobe_illustrator.high_contrast_green
+)
 
 # Export the artboard to a PNG.
 adobe_illustrator.export_to_png(
     file_name=r'C:\Users\alex.reed1192\Desktop\youtube-python-client\thumbnails\current_thumbnail'
 )
 
+# Keep track of the last thumbnail each video got, so an unchanged one isn't uploaded again.
+thumbnail_index = ThumbnailIndex(index_path='data/thumbnail_index.json')
+
 # Update the thumbnail.
 thumbnail_response = youtube_session.upload_thumbnail(
     video_id='XEjaDFqImCk',
-    thumbnail_path=r'C:\Users\alex.reed1192\Desktop\youtube-python-client\thumbnails\current_thumbnail.png'
+    thumbnail_path=r'C:\Users\alex.reed1192\Desktop\youtube-python-client\thumbnails\current_thumbnail.png',
+    thumbnail_index=thumbnail_index
 )
 pprint(thumbnail_response)
 
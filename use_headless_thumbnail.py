@@ -0,0 +1,90 @@
+import sys
+import pathlib
+from pprint import pprint
+from configparser import ConfigParser
+from youtube.client import YouTubeClient
+from youtube.renderer import DEFAULT_TEMPLATE
+from youtube.renderer import ThumbnailRenderer
+from youtube.thumbnails import ThumbnailIndex
+from youtube.palette import FOREGROUND_WHITE
+from youtube.palette import HIGH_CONTRAST_GREEN
+
+# The default template is a placeholder with only the text frames, so put the
+# artwork exported once from `thumbnail_help_me_grow.ai` (without its text) under them.
+ARTWORK_PATH = pathlib.Path('thumbnails/thumbnail_help_me_grow_artwork.png')
+
+if not ARTWORK_PATH.exists():
+    sys.exit(
+        "{artwork_path} is missing. Hide the text layers of thumbnail_help_me_grow.ai, "
+        "export it from Illustrator as a 1280x720 PNG to that path, then run this again.".format(
+            artwork_path=ARTWORK_PATH
+        )
+    )
+
+template = dict(
+    DEFAULT_TEMPLATE,
+    layers=[
+        {'image': str(ARTWORK_PATH), 'position': [0, 0]}
+    ]
+)
+
+# Grab configuration values.
+config = ConfigParser()
+config.read('configs/config.ini')
+
+# Grab the values.
+api_key = config.get('main', 'api_key')
+state_path = config.get('main', 'state_path')
+channel_id = config.get('main', 'channel_id')
+client_secret_path = config.get('main', 'client_secret_path')
+
+# Create a new instance of the Client.
+youtube_session = YouTubeClient(
+    api_key=api_key,
+    channel_id=channel_id,
+    client_secret_path=client_secret_path,
+    state_path=state_path
+)
+
+# Grab the current subscriber count.
+my_channel_data = youtube_session.grab_my_channel(
+    parts=['statistics']
+)
+current_subscriber_count = int(
+    my_channel_data['items'][0]['statistics']['subscriberCount'])
+
+# Create a new Renderer, no Illustrator needed.
+thumbnail_renderer = ThumbnailRenderer(template=template)
+
+# Set the Text for Goal Subscriber Text, with the goal in Green.
+thumbnail_renderer.set_goal_subscriber_text(
+    text="HELP MY CHANNEL GROW TO\n100,000 SUBSCRIBERS !!!"
+)
+thumbnail_renderer.recolor_match(
+    frame='GoalSubscriber',
+    pattern='100,000',
+    color=HIGH_CONTRAST_GREEN
+)
+
+# Set the Text for Current Subscriber Text, with the last 10 characters in White.
+thumbnail_renderer.set_current_subscriber_text(
+    text="{:,} SO FAR !!!".format(current_subscriber_count)
+)
+thumbnail_renderer.recolor(
+    frame='CurrentSubscriber',
+    start=-10,
+    color=FOREGROUND_WHITE
+)
+
+# Export the thumbnail to a PNG.
+thumbnail_path = thumbnail_renderer.export_to_png(
+    file_name='thumbnails/current_thumbnail'
+)
+
+# Update the thumbnail, if it changed.
+thumbnail_response = youtube_session.upload_thumbnail(
+    video_id='XEjaDFqImCk',
+    thumbnail_path=thumbnail_path,
+    thumbnail_index=ThumbnailIndex(index_path='data/thumbnail_index.json')
+)
+pprint(thumbnail_response)
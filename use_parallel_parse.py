@@ -0,0 +1,28 @@
+import pathlib
+
+from youtube.parsing import parse_to_file
+
+# The exports to re-parse, and what each one is.
+DATA_FOLDER = pathlib.Path('data')
+EXPORTS = {
+    'channel_playlists': 'playlists',
+    'channel_playlists_items': 'playlist_items',
+    'channel_playlists_items_all': 'playlist_items'
+}
+
+# Worker processes are started by re-importing this file, so guard the run.
+if __name__ == '__main__':
+
+    for file_name, kind in EXPORTS.items():
+
+        # Parse it across every core, and stream it into the `_parsed` file.
+        parsed_path = parse_to_file(
+            file_paths=[DATA_FOLDER.joinpath(file_name + '.json')],
+            output_path=DATA_FOLDER.joinpath(file_name + '_parsed.json'),
+            kind=kind
+        )
+
+        print('Parsed {file_name} into {parsed_path}'.format(
+            file_name=file_name,
+            parsed_path=parsed_path
+        ))
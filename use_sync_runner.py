@@ -0,0 +1,25 @@
+import pathlib
+
+from pprint import pprint
+from youtube.runner import SyncRunner
+
+# Every channel has its own config file in the `configs` folder.
+CONFIG_FOLDER = 'configs'
+MAX_WORKERS = 4
+
+# Windows starts worker processes by re-importing this file, so guard the run.
+if __name__ == '__main__':
+
+    # Grab all the channel configs.
+    config_paths = sorted(pathlib.Path(CONFIG_FOLDER).glob('*.ini'))
+
+    # Create a new instance of the Runner.
+    sync_runner = SyncRunner(
+        config_paths=config_paths,
+        output_folder='data/channels',
+        max_workers=MAX_WORKERS
+    )
+
+    # Sync every channel.
+    summaries = sync_runner.run()
+    pprint(summaries)
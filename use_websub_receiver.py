@@ -0,0 +1,53 @@
+import time
+from configparser import ConfigParser
+from youtube.client import YouTubeClient
+from youtube.websub import subscribe
+from youtube.websub import topic_url
+from youtube.websub import FeedRefresher
+from youtube.websub import WebSubReceiver
+
+# The public URL the hub can reach the receiver on, like a reverse proxy to port 8085.
+CALLBACK_URL = 'https://<YOUR_DOMAIN>/websub'
+SECRET = '<A_RANDOM_SECRET>'
+LEASE_SECONDS = 432000
+
+# Grab configuration values.
+config = ConfigParser()
+config.read('configs/config.ini')
+
+# Grab the values.
+api_key = config.get('main', 'api_key')
+state_path = config.get('main', 'state_path')
+channel_id = config.get('main', 'channel_id')
+playlist_id = config.get('main', 'playlist_id')
+client_secret_path = config.get('main', 'client_secret_path')
+
+# Create a new instance of the Client.
+youtube_session = YouTubeClient(
+    api_key=api_key,
+    channel_id=channel_id,
+    client_secret_path=client_secret_path,
+    state_path=state_path
+)
+
+# Grab only the notified videos, and add new ones to the playlist.
+feed_refresher = FeedRefresher(
+    youtube_session=youtube_session,
+    playlist_id=playlist_id,
+    on_videos=lambda videos: print('Refreshed {} videos.'.format(len(videos)))
+)
+
+# Listen for pushes, and renew the subscription before the lease runs out.
+with WebSubReceiver(on_notification=feed_refresher, secret=SECRET, topics=[topic_url(channel_id)], host='0.0.0.0', port=8085):
+
+    while True:
+
+        status = subscribe(
+            callback_url=CALLBACK_URL,
+            topic=topic_url(channel_id),
+            secret=SECRET,
+            lease_seconds=LEASE_SECONDS
+        )
+        print('Subscription request sent, status {}.'.format(status))
+
+        time.sleep(LEASE_SECONDS * 0.9)
@@ -1,31 +1,75 @@
+import re
 import json
 import pathlib
-import win32com.client as win32
-
-from win32com.client import CDispatch
 
 from pprint import pprint
 from typing import List
 from typing import Dict
+from typing import Tuple
+from typing import Union
+from typing import Callable
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from youtube.palette import HIGH_CONTRAST_GREEN
+from youtube.palette import HIGH_CONTRAST_PINK
+from youtube.palette import BACKGROUND_BLACK
+from youtube.palette import FOREGROUND_WHITE
+from youtube.upload import UploadError
+
+# Illustrator is only scriptable on Windows, so COM is optional everywhere else.
+try:
+    import win32com.client as win32
+    from win32com.client import CDispatch
+except ImportError:
+    win32 = None
+    CDispatch = object
+
+# A thumbnail to render in a batch. `texts` maps a text frame name to its text,
+# `colors` is a list of `recolor_range` or `recolor_match` arguments plus the
+# `frame` they apply to.
+ThumbnailJob = namedtuple('ThumbnailJob', ['video_id', 'texts', 'colors'])
 
 
 class AdobeIllustrator():
 
-    def __init__(self, file_name: str = None) -> None:
+    def __init__(self, file_name: str = None, adobe_app: CDispatch = None, dispatch: Callable[[str], CDispatch] = None) -> None:
         """Initializes the `Win32Adobe` client.
 
         ## Parameters
         ----
         file_name : str, optional
             The name of the Thumbnail file to load, by default None
+
+        adobe_app : CDispatch, optional
+            An `Illustrator.Application` to use instead of connecting
+            to one, by default None
+
+        dispatch : Callable[[str], CDispatch], optional
+            Creates new COM objects like `Illustrator.RGBColor`, by
+            default `win32com.client.Dispatch`.
         """
 
+        if win32 is None and (adobe_app is None or dispatch is None):
+            raise ImportError(
+                "Driving Illustrator needs the `pywin32` package on Windows, or pass `adobe_app` and `dispatch`."
+            )
+
+        # Everything we create or look up over COM is kept, every access is a round trip.
+        self.dispatch = dispatch or win32.Dispatch
+        self._colors: Dict[Tuple[int, int, int], CDispatch] = {}
+        self._text_frames: Dict[str, CDispatch] = {}
+        self._thumbnail_layer = None
+        self._export_options = None
+
         # Grab the Adobe Application if it's open.
-        try:
-            self.adobe_app = win32.GetActiveObject("Illustrator.Application")
-        except:
-            self.adobe_app = win32.dynamic.Dispatch("Illustrator.Application")
+        if adobe_app is not None:
+            self.adobe_app = adobe_app
+        else:
+            try:
+                self.adobe_app = win32.GetActiveObject("Illustrator.Application")
+            except:
+                self.adobe_app = win32.dynamic.Dispatch("Illustrator.Application")
 
         # Define the Thumbnail folder.
         self.thumbnail_folder = pathlib.Path("thumbnails").absolute()
@@ -41,6 +85,37 @@ class AdobeIllustrator():
         
         self.active_document = self.adobe_app.ActiveDocument
 
+    def rgb_color(self, color: Union[Tuple[int, int, int], CDispatch]) -> CDispatch:
+        """Grabs the `Illustrator.RGBColor` for a color, creating it only once.
+
+        ## Parameters
+        ----
+        color : Union[Tuple[int, int, int], CDispatch]
+            A `(Red, Green, Blue)` tuple, see `youtube.palette`. An
+            existing COM color is returned as is.
+
+        ## Returns
+        ----
+        (CDispatch):
+            An `Illustrator.RGBColor` Object with the `Red`, `Blue` and `Green`
+            property set.
+        """
+
+        if not isinstance(color, tuple):
+            return color
+
+        if color not in self._colors:
+
+            # Define the Color Object.
+            rgb_color = self.dispatch("Illustrator.RGBColor")
+            rgb_color.Red = color[0]
+            rgb_color.Green = color[1]
+            rgb_color.Blue = color[2]
+
+            self._colors[color] = rgb_color
+
+        return self._colors[color]
+
     @property
     def high_contrast_green(self) -> CDispatch:
         """Sets the Series color based on the series name.
@@ -52,13 +127,7 @@ class AdobeIllustrator():
             property set.
         """
 
-        # Define the Background Color Object.
-        series_color = win32.Dispatch("Illustrator.RGBColor")
-        series_color.Red = 7
-        series_color.Green = 255
-        series_color.Blue = 1
-
-        return series_color
+        return self.rgb_color(color=HIGH_CONTRAST_GREEN)
 
     @property
     def high_contrast_pink(self) -> CDispatch:
@@ -71,13 +140,7 @@ class AdobeIllustrator():
             property set.
         """
 
-        # Define the Background Color Object.
-        series_color = win32.Dispatch("Illustrator.RGBColor")
-        series_color.Red = 248
-        series_color.Green = 5
-        series_color.Blue = 254
-
-        return series_color
+        return self.rgb_color(color=HIGH_CONTRAST_PINK)
 
     def add_character_style(self, name: str) -> CDispatch:
         """Either grabs the existing CharacterStyle or creates a new one.
@@ -144,13 +207,7 @@ class AdobeIllustrator():
             property set.
         """
 
-        # Define the Background Color Object.
-        black_background_color = win32.Dispatch("Illustrator.RGBColor")
-        black_background_color.Red = 25
-        black_background_color.Green = 24
-        black_background_color.Blue = 24
-
-        return black_background_color
+        return self.rgb_color(color=BACKGROUND_BLACK)
 
     @property
     def foreground_white(self) -> CDispatch:
@@ -163,13 +220,7 @@ class AdobeIllustrator():
             property set.
         """
 
-        # Define the Text Font White Color.
-        white_color = win32.Dispatch("Illustrator.RGBColor")
-        white_color.Red = 255
-        white_color.Green = 255
-        white_color.Blue = 255
-
-        return white_color
+        return self.rgb_color(color=FOREGROUND_WHITE)
 
     def export_to_png(self, file_name: str) -> None:
         """Exports the Artboard as a PNG Image using the default settings.
@@ -198,14 +249,18 @@ class AdobeIllustrator():
             `Transparency`, and `MatteColor` property set.
         """
 
-        # Define the Export PNG24 Options.
-        png_export_options = win32.Dispatch("Illustrator.ExportOptionsPNG24")
-        png_export_options.AntiAliasing = True
-        png_export_options.Transparency = True
-        png_export_options.MatteColor = self.background_black
-        png_export_options.VerticalScale = 101.0
+        if self._export_options is None:
 
-        return png_export_options
+            # Define the Export PNG24 Options.
+            png_export_options = self.dispatch("Illustrator.ExportOptionsPNG24")
+            png_export_options.AntiAliasing = True
+            png_export_options.Transparency = True
+            png_export_options.MatteColor = self.background_black
+            png_export_options.VerticalScale = 101.0
+
+            self._export_options = png_export_options
+
+        return self._export_options
 
     def thumbnail_layer(self) -> CDispatch:
         """Grabs the Thumbnail Layer from the Artboard.
@@ -218,9 +273,29 @@ class AdobeIllustrator():
         """
 
         # Grab the Thumbnail Layer.
-        thumbnail_layer = self.active_document.Layers("ThumbnailVideo")
+        if self._thumbnail_layer is None:
+            self._thumbnail_layer = self.active_document.Layers("ThumbnailVideo")
 
-        return thumbnail_layer
+        return self._thumbnail_layer
+
+    def text_frame(self, name: str) -> CDispatch:
+        """Grabs a Text Frame from the Thumbnail Layer, looking it up only once.
+
+        ## Parameters
+        ----
+        name : str
+            The name of the Text Frame, like `GoalSubscriber`.
+
+        ## Returns
+        ----
+        (CDispatch):
+            An `Illustrator.TextFrame` Object.
+        """
+
+        if name not in self._text_frames:
+            self._text_frames[name] = self.thumbnail_layer().TextFrames(name)
+
+        return self._text_frames[name]
 
     def thumbnail_path(self) -> CDispatch:
         """Grabs the PathItem representing thumbnail background.
@@ -245,8 +320,8 @@ class AdobeIllustrator():
             GoalSubscriber Text Frame.
         """
 
-        # Grab the Background.
-        return self.thumbnail_layer().TextFrames("GoalSubscriber")
+        # Grab the Text Frame.
+        return self.text_frame(name="GoalSubscriber")
 
     def get_goal_subscriber_text_range(self) -> CDispatch:
         """Grabs the Text string inside of the TextRange belonging to the
@@ -277,8 +352,8 @@ class AdobeIllustrator():
             CurrentSubscriber Text Frame.
         """
 
-        # Grab the Background.
-        return self.thumbnail_layer().TextFrames("CurrentSubscriber")
+        # Grab the Text Frame.
+        return self.text_frame(name="CurrentSubscriber")
 
     def get_current_subscriber_text_range(self) -> CDispatch:
         """Grabs the Text string inside of the TextRange belonging to the
@@ -298,3 +373,245 @@ class AdobeIllustrator():
 
         # Set the Current Text.
         self.current_subscriber_text_frame().TextRange.Contents = text
+
+    def recolor_range(self, text_range: CDispatch, color: Union[Tuple[int, int, int], CDispatch], start: int = 0, end: int = None) -> None:
+        """Colors a span of characters in one go, instead of one character at a time.
+
+        ## Parameters
+        ----
+        text_range : CDispatch
+            The `Illustrator.TextRange` to recolor, like the one from
+            `get_current_subscriber_text_range`.
+
+        color : Union[Tuple[int, int, int], CDispatch]
+            The new color, a `youtube.palette` tuple or an `Illustrator.RGBColor`.
+
+        start : int, optional
+            The first character, negative counts from the end, by default 0
+
+        end : int, optional
+            One past the last character, negative counts from the end,
+            by default None which means the end of the text.
+        """
+
+        # Only look up the length when the offsets depend on it.
+        if start < 0 or end is None or end < 0:
+            start, end, _ = slice(start, end).indices(text_range.Length)
+
+        if end <= start:
+            return
+
+        # Grab the first character as a range and stretch it over the span, Characters is 1-based.
+        span = text_range.Characters(start + 1)
+        span.Length = end - start
+        span.CharacterAttributes.FillColor = self.rgb_color(color=color)
+
+    def recolor_match(self, text_range: CDispatch, pattern: str, color: Union[Tuple[int, int, int], CDispatch]) -> None:
+        """Colors every match of a pattern, like `100,000` in the goal text.
+
+        ## Parameters
+        ----
+        text_range : CDispatch
+            The `Illustrator.TextRange` to search.
+
+        pattern : str
+            The regular expression to search for.
+
+        color : Union[Tuple[int, int, int], CDispatch]
+            The new color.
+        """
+
+        for match in re.finditer(pattern, text_range.Contents):
+            self.recolor_range(text_range=text_range, color=color, start=match.start(), end=match.end())
+
+    def _apply_job(self, job: ThumbnailJob) -> None:
+        """Sets the text and colors of a job on the open document."""
+
+        for frame, text in job.texts.items():
+            self.text_frame(name=frame).TextRange.Contents = text
+
+        for color in job.colors:
+
+            color = dict(color)
+            text_range = self.text_frame(name=color.pop('frame')).TextRange
+
+            if 'pattern' in color:
+                self.recolor_match(text_range=text_range, **color)
+            else:
+                self.recolor_range(text_range=text_range, **color)
+
+    def _save_fills(self, text_range: CDispatch) -> List[Tuple[int, int, Union[Tuple[int, int, int], CDispatch]]]:
+        """Reads the fill colors of a range as runs of the same color, see `_restore_fills`.
+
+        COM hands back a new proxy on every read, so characters are compared
+        on their `Red`, `Green` and `Blue` values, not on the objects.
+
+        ## Parameters
+        ----
+        text_range : CDispatch
+            The `Illustrator.TextRange` to read.
+
+        ## Returns
+        ----
+        List[Tuple[int, int, Union[Tuple[int, int, int], CDispatch]]]:
+            The `(start, end, color)` of each run. The color is a `(Red, Green, Blue)`
+            tuple, or the COM color itself when it isn't an RGB color.
+        """
+
+        runs = []
+
+        for offset, character in enumerate(text_range.Characters):
+
+            fill = character.CharacterAttributes.FillColor
+
+            if fill is None:
+                continue
+
+            # Any other kind of color, like a spot color, is kept as is and never merged.
+            try:
+                color = (fill.Red, fill.Green, fill.Blue)
+            except AttributeError:
+                runs.append((offset, offset + 1, fill))
+                continue
+
+            if runs and runs[-1][1] == offset and runs[-1][2] == color:
+                runs[-1] = (runs[-1][0], offset + 1, color)
+            else:
+                runs.append((offset, offset + 1, color))
+
+        return runs
+
+    def _restore_fills(self, text_range: CDispatch, runs: List[Tuple[int, int, Union[Tuple[int, int, int], CDispatch]]]) -> None:
+        """Puts back the fill colors read with `_save_fills`, one span per run."""
+
+        for start, end, color in runs:
+            self.recolor_range(text_range=text_range, color=color, start=start, end=end)
+
+    def export_batch(self, jobs: List[ThumbnailJob], output_folder: str,
+                     on_export: Callable[[ThumbnailJob, str], None] = None) -> Dict[str, str]:
+        """Renders a thumbnail for each job without reopening the document.
+
+        Every job is applied to the open document and exported to its own file.
+        The text frames go back to the text and colors they had once the batch
+        is done, and the document is left open for the next batch.
+
+        ## Parameters
+        ----
+        jobs : List[ThumbnailJob]
+            The thumbnails to render.
+
+        output_folder : str
+            The folder the PNGs are exported to, each one is named
+            after its video ID.
+
+        on_export : Callable[[ThumbnailJob, str], None], optional
+            Called with each job and its PNG path as soon as it's
+            exported, by default None
+
+        ## Returns
+        ----
+        Dict[str, str]:
+            The PNG path for each video ID.
+        """
+
+        output_folder = pathlib.Path(output_folder).absolute()
+        output_folder.mkdir(parents=True, exist_ok=True)
+
+        # Remember the text and colors of every frame a job touches, so we can put them back.
+        frames = {frame for job in jobs for frame in job.texts}
+        frames.update(color['frame'] for job in jobs for color in job.colors)
+
+        original_texts = {}
+        original_fills = {}
+
+        for frame in frames:
+            text_range = self.text_frame(name=frame).TextRange
+            original_texts[frame] = text_range.Contents
+            original_fills[frame] = self._save_fills(text_range=text_range)
+
+        exported = {}
+
+        try:
+
+            for job in jobs:
+
+                self._apply_job(job=job)
+
+                # Illustrator adds the extension itself.
+                file_name = output_folder.joinpath(job.video_id)
+                self.export_to_png(file_name=str(file_name))
+
+                exported[job.video_id] = str(file_name) + '.png'
+
+                if on_export:
+                    on_export(job, exported[job.video_id])
+
+        finally:
+
+            # Revert the document, the text first since setting it resets the colors.
+            for frame, text in original_texts.items():
+
+                text_range = self.text_frame(name=frame).TextRange
+                text_range.Contents = text
+
+                self._restore_fills(text_range=text_range, runs=original_fills[frame])
+
+        return exported
+
+    def export_and_upload(self, jobs: List[ThumbnailJob], youtube_session: object, output_folder: str,
+                          thumbnail_index: object = None, max_workers: int = 4) -> Dict[str, Dict]:
+        """Renders a batch of thumbnails and uploads each one while the next renders.
+
+        COM calls stay on this thread, the uploads run on a pool of threads.
+
+        ## Parameters
+        ----
+        jobs : List[ThumbnailJob]
+            The thumbnails to render.
+
+        youtube_session : YouTubeClient
+            The client used to upload the thumbnails.
+
+        output_folder : str
+            The folder the PNGs are exported to.
+
+        thumbnail_index : ThumbnailIndex, optional
+            Skips the uploads that wouldn't change anything, by default None
+
+        max_workers : int, optional
+            The number of uploads running at the same time, by default 4
+
+        ## Returns
+        ----
+        Dict[str, Dict]:
+            The upload response for each video ID, a failed upload maps
+            to `{'error': {'message': ...}}`.
+        """
+
+        futures = {}
+
+        def upload(video_id: str, thumbnail_path: str) -> Dict:
+
+            try:
+                return youtube_session.upload_thumbnail(
+                    video_id=video_id,
+                    thumbnail_path=thumbnail_path,
+                    thumbnail_index=thumbnail_index
+                )
+            except (OSError, ValueError, UploadError) as upload_error:
+                return {'error': {'message': str(upload_error)}}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            self.export_batch(
+                jobs=jobs,
+                output_folder=output_folder,
+                on_export=lambda job, thumbnail_path: futures.update(
+                    {job.video_id: executor.submit(upload, job.video_id, thumbnail_path)}
+                )
+            )
+
+            return {
+                video_id: future.result()
+                for video_id, future in futures.items()
+            }
@@ -1,24 +1,48 @@
 
 import os
 import json
+import time
+import tempfile
+import threading
 import pathlib
-import requests
+import mimetypes
 import urllib.parse
 
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+
 from typing import Dict
 from typing import List
 from typing import Union
 from typing import Tuple
+from typing import Callable
 
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from googleapiclient.http import MediaFileUpload
+
+from youtube.quota import quota_cost
+from youtube.metrics import RequestMetrics
+from youtube.rate_limit import RateLimiter
+from youtube.storage import read_json
+from youtube.storage import write_json
+from youtube.storage import data_file_path
+from youtube.storage import find_data_file
+from youtube.parsing import parse_pages
+from youtube.json_index import IndexedJsonReader
+from youtube.transport import HttpTransport
+from youtube.transport import TransportResponse
+from youtube.upload import UploadError
+from youtube.upload import ResumableUpload
+from youtube.upload import DEFAULT_CHUNK_SIZE
+from youtube.thumbnails import file_hash
+from youtube.thumbnails import ThumbnailIndex
+from youtube.images import ThumbnailOptimizer
 
 
 class YouTubeClient():
 
-    def __init__(self, api_key: str, channel_id: str, client_secret_path: str, state_path: str) -> None:
+    def __init__(self, api_key: str, channel_id: str, client_secret_path: str, state_path: str, rate_limiter: RateLimiter = None, metrics: RequestMetrics = None, credentials: Credentials = None, transport: object = None, interactive: bool = True) -> None:
         """Initalizes a new instance of the YouTube Client Manager.
 
         Arguments:
@@ -28,6 +52,21 @@ class YouTubeClient():
 
         channel_id {str} -- Your YouTube Channel Id.
 
+        rate_limiter {RateLimiter} -- An optional token-bucket limiter that every
+            request waits on before it's sent. (default: {None})
+
+        metrics {RequestMetrics} -- Where per-endpoint request metrics and hooks
+            live, a new one is created if not provided. (default: {None})
+
+        credentials {Credentials} -- Credentials to use instead of running the
+            OAuth workflow, handy for offline runs against a mock server. (default: {None})
+
+        transport {object} -- Sends the requests, like a `RecordingTransport` or a
+            `ReplayTransport`. (default: {HttpTransport()})
+
+        interactive {bool} -- If `False` the client fails instead of asking for
+            a console login, for worker processes nobody is watching. (default: {True})
+
         Usage:
         ----
             >>> youtube_session(
@@ -48,16 +87,34 @@ class YouTubeClient():
         self.api_version = "v3"
         self.api_upload = "/upload/youtube"
 
+        # Request pacing and quota usage.
+        self.rate_limiter = rate_limiter
+        self.quota_units_used = 0
+        self._quota_lock = threading.Lock()
+        self._thread_quota = threading.local()
+
+        # Guards the credentials and the state file, so only one thread refreshes the token.
+        self._credentials_lock = threading.RLock()
+
+        self.metrics = metrics or RequestMetrics()
+        self.transport = transport or HttpTransport()
+
         # Session properties.
         self.client_secret_file = pathlib.Path(client_secret_path).absolute()
         print(self.client_secret_file)
         self.youtube_state_file = pathlib.Path(state_path).absolute()
         self.data_folder_path: pathlib.Path = pathlib.Path(__file__).parents[1].joinpath('data')
-        self.credentials = self.oauth_workflow()
+        self.interactive = interactive
+
+        # Use the credentials we were given, otherwise go through oAuth.
+        if credentials:
+            self.credentials = credentials
+        else:
+            self.credentials = self.oauth_workflow()
 
-        # If we don't have a state file, then create it.
-        if self.youtube_state_file.exists() == False:
-            self._save_state()
+            # If we don't have a state file, then create it.
+            if self.youtube_state_file.exists() == False:
+                self._save_state()
     
     def chunks(self, content_list: List, chunk_size: int) -> List[List]:
         """Yield successive n-sized chunks from lst."""
@@ -65,24 +122,56 @@ class YouTubeClient():
         for i in range(0, len(content_list), chunk_size):
             yield content_list[i:i + chunk_size]
 
+    def _add_quota(self, units: int) -> None:
+        """Adds to the quota used, safe to call from many threads."""
+
+        with self._quota_lock:
+            self.quota_units_used += units
+
+        # Each thread also keeps its own count, see `thread_quota_units`.
+        self._thread_quota.units = self.thread_quota_units + units
+
+    @property
+    def thread_quota_units(self) -> int:
+        """The quota units spent by the requests the calling thread sent.
+
+        Unlike `quota_units_used` this doesn't move when other threads share
+        the client, so the difference before and after a call is what that
+        call cost.
+        """
+
+        return getattr(self._thread_quota, 'units', 0)
+
     def _save_state(self) -> Dict:
         """Saves the Credential State.
 
+        The state is written to a temporary file first and then moved into
+        place, so a crash or another thread never sees a half written file.
+
         Returns:
         ----
         Dict -- A dictionary containing state info.
         """
 
-        # Define the state dict.
-        state_dict = {
-            'client_id': self.credentials.client_id,
-            'client_secret': self.credentials.client_secret,
-            'refresh_token': self.credentials.refresh_token
-        }
+        with self._credentials_lock:
+
+            # Define the state dict.
+            state_dict = {
+                'client_id': self.credentials.client_id,
+                'client_secret': self.credentials.client_secret,
+                'refresh_token': self.credentials.refresh_token
+            }
+
+            # Write it next to the state file, then swap it in.
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=self.youtube_state_file.parent,
+                suffix='.tmp'
+            )
+
+            with os.fdopen(file_descriptor, 'w') as state_file:
+                json.dump(obj=state_dict, fp=state_file)
 
-        # Open the JSON file and save it.
-        with open(self.youtube_state_file, 'w+') as state_file:
-            json.dump(obj=state_dict, fp=state_file)
+            os.replace(temp_path, self.youtube_state_file)
 
         return state_dict
 
@@ -120,9 +209,14 @@ class YouTubeClient():
 
         if self.credentials.valid:
             return True
-        else:
-            self.refresh_token()
-            return True
+
+        with self._credentials_lock:
+
+            # Another thread may have refreshed it while we waited.
+            if not self.credentials.valid:
+                self.credentials = self.refresh_token()
+
+        return True
 
     def oauth_workflow(self) -> Credentials:
         """Handles oAuth workflow.
@@ -136,6 +230,14 @@ class YouTubeClient():
         if self.youtube_state_file.exists():
             return self.refresh_token()
 
+        # Nobody is there to log in, so don't wait on a prompt.
+        elif not self.interactive:
+            raise PermissionError(
+                "No saved credentials at {state_file}, log in once interactively to create them.".format(
+                    state_file=self.youtube_state_file
+                )
+            )
+
         # Otherwise grab the Client Secret file.
         elif self.client_secret_file.exists():
 
@@ -168,9 +270,11 @@ class YouTubeClient():
         {Dict} -- A headers dictionary used in requests.
         """
 
-        # initalize the headers.
+        # initalize the headers, Google only sends gzip when the User-Agent asks for it too.
         headers = {
-            'Authorization': 'Bearer {}'.format(self.credentials.token)
+            'Authorization': 'Bearer {}'.format(self.credentials.token),
+            'Accept-Encoding': 'gzip',
+            'User-Agent': 'youtube-python-client (gzip)'
         }
 
         # add content type if needed.
@@ -179,7 +283,7 @@ class YouTubeClient():
             headers['Content-Type'] = 'application/json'
 
         if mode == 'image':
-            headers['Accepted Media MIME types'] = 'image/png'
+            headers['Accepted Media MIME types'] = 'image/png, image/jpeg'
 
         return headers
 
@@ -240,31 +344,89 @@ class YouTubeClient():
         # Grab the headers.
         headers = self._headers(mode=headers)
 
-        # Define a new session.
-        new_session = requests.Session()
-        new_session.verify = True
+        # Wait for our turn if we're being rate limited.
+        if self.rate_limiter:
+            self.rate_limiter.acquire(endpoint=endpoint)
 
-        # Prepare the request.
-        new_request = requests.Request(
-            method=method.upper(),
-            headers=headers,
-            params=params,
-            data=data,
-            json=json,
-            url=url
-        ).prepare()
-
-        # Send the request.
-        response: requests.Response = new_session.send(
-            request=new_request
+        # Keep track of how much quota we've spent.
+        units = quota_cost(endpoint=endpoint, method=method)
+        self._add_quota(units=units)
+
+        # Let the hooks see the request.
+        request_info = {
+            'endpoint': endpoint,
+            'method': method.lower(),
+            'url': url,
+            'params': dict(params) if params else params
+        }
+        self.metrics.before_request(request=request_info)
+
+        # Send the request, a connection error or timeout still counts as a failed request.
+        start = time.perf_counter()
+
+        try:
+            response: TransportResponse = self.transport.send(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                data=data,
+                json=json
+            )
+        except Exception:
+            self._record_failure(request_info=request_info, start=start, units=units)
+            raise
+
+        # Record how it went.
+        self.metrics.after_request(
+            request=request_info,
+            response={
+                'status_code': response.status_code,
+                'latency': time.perf_counter() - start,
+                'response_bytes': len(response.content),
+                'quota_units': units
+            }
         )
 
-        # If it was okay return the data.
+        # If it was okay return the data, deletes come back as a `204` with no content.
         if response.ok:
-            return response.json()
-        else:
-            print('Invalid Request')
-            return response.json()
+            return response.json() if response.content else {}
+
+        print('Invalid Request')
+
+        # An error without a body still has to look like an error to the caller.
+        if not response.content:
+            return {
+                'error': {
+                    'code': response.status_code,
+                    'message': 'The request failed with an empty response.',
+                    'errors': []
+                }
+            }
+
+        return response.json()
+
+    def _record_failure(self, request_info: Dict, start: float, units: int) -> None:
+        """Records a request that never got an answer, like a connection error or a timeout.
+
+        Arguments:
+        ----
+        request_info {Dict} -- The request dictionary passed to the hooks.
+
+        start {float} -- The `time.perf_counter()` when the request was sent.
+
+        units {int} -- The quota units charged for the request.
+        """
+
+        self.metrics.after_request(
+            request=request_info,
+            response={
+                'status_code': 599,
+                'latency': time.perf_counter() - start,
+                'response_bytes': 0,
+                'quota_units': units
+            }
+        )
 
     def _load_playlists(self) -> Dict:
         """Loads a playlist file.
@@ -281,15 +443,17 @@ class YouTubeClient():
         playlist_path = self.data_folder_path.joinpath('playlists.json')
 
         # Load the JSON file if it exists.
-        if playlist_path.exists():
-            with open(playlist_path.absolute(), 'r') as file:
-                return json.load(file)
-        else:
+        try:
+            return read_json(file_path=find_data_file(file_path=playlist_path))
+        except FileNotFoundError:
             raise FileNotFoundError("Playlist content file doesn't exist.")
 
     def load_file(self, file_name: str) -> Dict:
         """Loads a JSON file from the data folder.
 
+        Gzip and zstd compressed files are decompressed transparently, and if
+        `file_name` doesn't exist its `.gz` or `.zst` version is loaded instead.
+
         Arguments:
         ----
         file_name (str): The name of the file, along with it's extension, that
@@ -307,15 +471,33 @@ class YouTubeClient():
         playlist_path = self.data_folder_path.joinpath(file_name)
 
         # Load the JSON file if it exists.
-        if playlist_path.exists():
-            with open(file=playlist_path.absolute(), mode='r') as file:
-                return json.load(fp=file)
-        else:
-            raise FileNotFoundError(
-                "File {file_name} doesn't exist.".format(
-                    file_name=playlist_path.as_posix()
-                )
-            )
+        return read_json(file_path=find_data_file(file_path=playlist_path))
+
+    def load_playlist_pages(self, file_name: str, playlist_id: str) -> List[Dict]:
+        """Loads one playlist's pages from a data file without decoding the rest.
+
+        The file is memory mapped and read through an offset index kept next to
+        it, see `youtube.json_index.IndexedJsonReader`, so the file has to be
+        uncompressed.
+
+        Arguments:
+        ----
+        file_name (str): The name of the file, along with it's extension, like
+            `channel_playlists_items_all.json`.
+
+        playlist_id (str): The ID of the playlist.
+
+        Raises:
+        ----
+        KeyError: The playlist isn't in the file.
+
+        Returns:
+        ----
+        {List[Dict]} -- The playlist's pages.
+        """
+
+        with IndexedJsonReader(file_path=self.data_folder_path.joinpath(file_name)) as reader:
+            return reader.playlist_pages(playlist_id=playlist_id)
 
     def _load_desc(self) -> Dict:
         """Loads description files used for videos.
@@ -337,10 +519,9 @@ class YouTubeClient():
         )
 
         # laod the previous state if it exists and then refresh the token.
-        if desc_path.exists():
-            with open(desc_path.absolute(), 'r') as file:
-                return json.load(file)
-        else:
+        try:
+            return read_json(file_path=find_data_file(file_path=desc_path))
+        except FileNotFoundError:
             raise FileNotFoundError("Description templates do not exist.")
 
     def playlists_items(self, playlist_id: str, all_pages: bool = False) -> List[Dict]:
@@ -405,8 +586,8 @@ class YouTubeClient():
                     url=playlist_data['nextPageToken'])
                 )
 
-                # Add the next page token.
-                params['pageToken'] = playlist_data['nextPageToken']
+                # Add the next page token, on a copy so the last request isn't changed under it.
+                params = dict(params, pageToken=playlist_data['nextPageToken'])
 
                 # Grab the data.
                 playlist_data = self._make_request(
@@ -623,7 +804,116 @@ class YouTubeClient():
 
         return response
 
-    def upload_thumbnail(self, video_id: str, thumbnail_path: str) -> Dict:
+    def _upload_url(self, endpoint: str) -> str:
+        """Builds a full url to a media upload endpoint.
+
+        Arguments:
+        ----
+        endpoint {str} -- The endpoint, like `thumbnails/set` or `videos`.
+
+        Returns:
+        ----
+        {str} -- A full upload url.
+        """
+
+        return "{api_url}{api_upload}/{api_version}/{endpoint}".format(
+            api_url=self.api_url,
+            api_upload=self.api_upload,
+            api_version=self.api_version,
+            endpoint=endpoint
+        )
+
+    def _upload_media(self, endpoint: str, file_path: str, params: dict, metadata: dict = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      progress_callback: Callable[[Dict], None] = None, session_uri: str = None) -> Dict:
+        """Uploads a file with the resumable upload protocol.
+
+        Arguments:
+        ----
+        endpoint {str} -- The upload endpoint, like `thumbnails/set` or `videos`.
+
+        file_path {str} -- The path of the file to upload.
+
+        params {dict} -- The URL params for the upload.
+
+        Keyword Arguments:
+        ----
+        metadata {dict} -- The JSON resource sent along with the media. (default: {None})
+
+        chunk_size {int} -- The number of bytes sent per request. (default: {2 MB})
+
+        progress_callback {Callable[[Dict], None]} -- Called after every chunk. (default: {None})
+
+        session_uri {str} -- Resumes an interrupted upload session. (default: {None})
+
+        Returns:
+        ----
+        {Dict} -- The JSON resource returned once the upload is done.
+        """
+
+        # validate the token.
+        self._validate_token()
+
+        url = self._upload_url(endpoint=endpoint)
+
+        # Wait for our turn if we're being rate limited.
+        if self.rate_limiter:
+            self.rate_limiter.acquire(endpoint=endpoint)
+
+        # Keep track of how much quota we've spent.
+        units = quota_cost(endpoint=endpoint, method='post')
+        self._add_quota(units=units)
+
+        # Let the hooks see the request.
+        request_info = {
+            'endpoint': endpoint,
+            'method': 'post',
+            'url': url,
+            'params': params
+        }
+        self.metrics.before_request(request=request_info)
+
+        media_upload = ResumableUpload(
+            transport=self.transport,
+            url=url,
+            headers=lambda: self._headers(mode='upload'),
+            file_path=file_path,
+            params=params,
+            metadata=metadata,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            on_retry=lambda: self.metrics.record_retry(endpoint=endpoint, method='post')
+        )
+
+        # Upload the Media.
+        start = time.perf_counter()
+        status_code = 200
+
+        try:
+            response = media_upload.upload(session_uri=session_uri)
+        except UploadError as upload_error:
+            status_code = upload_error.response.status_code if upload_error.response is not None else 599
+            raise
+        except Exception:
+            status_code = 599
+            raise
+        finally:
+
+            # Record how it went.
+            self.metrics.after_request(
+                request=request_info,
+                response={
+                    'status_code': status_code,
+                    'latency': time.perf_counter() - start,
+                    'response_bytes': 0,
+                    'quota_units': units
+                }
+            )
+
+        return response
+
+    def upload_thumbnail(self, video_id: str, thumbnail_path: str, resumable: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         progress_callback: Callable[[Dict], None] = None, thumbnail_index: ThumbnailIndex = None,
+                         optimizer: ThumbnailOptimizer = None) -> Dict:
         """Uploads the specified file to the specific video as a thumbnail.
 
         Arguments:
@@ -632,41 +922,242 @@ class YouTubeClient():
 
         thumbnail_path {str} -- The file path of the thumbnail image.
 
+        resumable {bool} -- If `True` the image is streamed in chunks with the resumable
+            upload protocol, instead of one multipart request. (default: {False})
+
+        chunk_size {int} -- The number of bytes sent per request when resumable. (default: {2 MB})
+
+        progress_callback {Callable[[Dict], None]} -- Called after every chunk when
+            resumable. (default: {None})
+
+        thumbnail_index {ThumbnailIndex} -- If given, the upload is skipped when the video's
+            last successful upload had the exact same content, and the index is updated
+            after a successful one. (default: {None})
+
+        optimizer {ThumbnailOptimizer} -- If given, the image is resized, stripped and
+            re-encoded before it's uploaded, see `youtube.images`. (default: {None})
+
         Returns:
         ----
-        {Dict} -- Message specifying the result of Insert operation.
+        {Dict} -- Message specifying the result of Insert operation. A skipped upload
+            returns `{'videoId': ..., 'contentHash': ..., 'skipped': True}`.
         """
 
-        # validate the token.
-        if self._validate_token():
+        # Shrink the image first, the result is cached so this is cheap when nothing changed.
+        if optimizer:
+            thumbnail_path = optimizer.optimize(file_path=thumbnail_path)
 
-            # Define video parameters.
-            params = {
-                'videoId': video_id,
-                'key': self.api_key
-            }
+        # Skip the upload if the video already has this exact image.
+        if thumbnail_index:
 
-            # define the file media content.
-            files = {
-                'media': open(thumbnail_path, 'rb')
-            }
+            content_hash = file_hash(file_path=thumbnail_path)
+
+            if thumbnail_index.is_unchanged(video_id=video_id, content_hash=content_hash):
+                self.metrics.record_cache_hit(endpoint='thumbnails/set', method='post')
+                return {'videoId': video_id, 'contentHash': content_hash, 'skipped': True}
+
+        response = self._set_thumbnail(
+            video_id=video_id,
+            thumbnail_path=thumbnail_path,
+            resumable=resumable,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback
+        )
+
+        # Remember what the video has now.
+        if thumbnail_index and response and 'error' not in response:
+            thumbnail_index.record(video_id=video_id, content_hash=content_hash)
+
+        return response
+
+    def _set_thumbnail(self, video_id: str, thumbnail_path: str, resumable: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       progress_callback: Callable[[Dict], None] = None) -> Dict:
+        """Sends a thumbnail to the `thumbnails/set` endpoint, see `upload_thumbnail`."""
+
+        # Define video parameters.
+        params = {
+            'videoId': video_id,
+            'key': self.api_key
+        }
+
+        if resumable:
+            return self._upload_media(
+                endpoint='thumbnails/set',
+                file_path=thumbnail_path,
+                params=params,
+                chunk_size=chunk_size,
+                progress_callback=progress_callback
+            )
+
+        # validate the token.
+        if self._validate_token():
 
             # Defin the headers.
             headers = self._headers(mode='image')
 
             # Define the URL.
-            url = "https://www.googleapis.com/upload/youtube/v3/thumbnails/set"
+            url = self._upload_url(endpoint='thumbnails/set')
+
+            # Wait for our turn if we're being rate limited.
+            if self.rate_limiter:
+                self.rate_limiter.acquire(endpoint='thumbnails/set')
+
+            # Keep track of how much quota we've spent.
+            units = quota_cost(endpoint='thumbnails/set', method='post')
+            self._add_quota(units=units)
+
+            # Let the hooks see the request.
+            request_info = {
+                'endpoint': 'thumbnails/set',
+                'method': 'post',
+                'url': url,
+                'params': params
+            }
+            self.metrics.before_request(request=request_info)
+
+            # Upload the Media, and close the file once it's sent.
+            start = time.perf_counter()
+            with open(thumbnail_path, 'rb') as thumbnail_file:
+                try:
+                    upload_response: TransportResponse = self.transport.send(
+                        method='post',
+                        url=url,
+                        headers=headers,
+                        params=params,
+                        files={
+                            'media': (
+                                os.path.basename(thumbnail_path),
+                                thumbnail_file,
+                                mimetypes.guess_type(str(thumbnail_path))[0] or 'image/png'
+                            )
+                        }
+                    )
+                except Exception:
+                    self._record_failure(request_info=request_info, start=start, units=units)
+                    raise
+
+            # Record how it went.
+            self.metrics.after_request(
+                request=request_info,
+                response={
+                    'status_code': upload_response.status_code,
+                    'latency': time.perf_counter() - start,
+                    'response_bytes': len(upload_response.content),
+                    'quota_units': units
+                }
+            )
 
-            # Upload the Media
-            response = requests.post(
-                url=url,
-                headers=headers,
-                files=files,
-                params=params
-            ).json()
+            response = upload_response.json()
 
             return response
 
+    def upload_thumbnails(self, assignments: Dict[str, str], thumbnail_index: ThumbnailIndex = None, max_workers: int = 4,
+                          resumable: bool = False, optimizer: ThumbnailOptimizer = None) -> Dict[str, Dict]:
+        """Uploads thumbnails to many videos at once.
+
+        Arguments:
+        ----
+        assignments {Dict[str, str]} -- Maps a video ID to the file path of its new thumbnail,
+            the same image can be assigned to as many videos as you want.
+
+        Keyword Arguments:
+        ----
+        thumbnail_index {ThumbnailIndex} -- Skips the videos that already have their
+            image, see `upload_thumbnail`. (default: {None})
+
+        max_workers {int} -- The number of uploads running at the same time. (default: {4})
+
+        resumable {bool} -- If `True` each image is sent with the resumable upload protocol. (default: {False})
+
+        optimizer {ThumbnailOptimizer} -- Shrinks each image before it's uploaded. (default: {None})
+
+        Returns:
+        ----
+        {Dict[str, Dict]} -- Maps each video ID to its upload response, a failed upload
+            maps to `{'error': {'message': ...}}` so one bad video doesn't stop the rest.
+
+        Usage:
+        ----
+            >>> thumbnail_index = ThumbnailIndex(index_path='data/thumbnail_index.json')
+            >>> youtube_session.upload_thumbnails(
+                assignments={
+                    'XEjaDFqImCk': 'thumbnails/current_thumbnail.png',
+                    'Jd6q1AzNQvQ': 'thumbnails/current_thumbnail.png'
+                },
+                thumbnail_index=thumbnail_index
+            )
+        """
+
+        responses = {}
+
+        def upload(video_id: str) -> Dict:
+
+            try:
+                return self.upload_thumbnail(
+                    video_id=video_id,
+                    thumbnail_path=assignments[video_id],
+                    resumable=resumable,
+                    thumbnail_index=thumbnail_index,
+                    optimizer=optimizer
+                )
+            except (OSError, ValueError, UploadError) as upload_error:
+                return {'error': {'message': str(upload_error)}}
+
+        # Run the uploads side by side, the rate limiter still applies to each one.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            futures = {
+                executor.submit(upload, video_id): video_id
+                for video_id in assignments
+            }
+
+            for future in as_completed(futures):
+                responses[futures[future]] = future.result()
+
+        return responses
+
+    def upload_video(self, part: List[str], data: dict, video_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     progress_callback: Callable[[Dict], None] = None, session_uri: str = None) -> Dict:
+        """Uploads a new video with the resumable upload protocol.
+
+        Arguments:
+        ----
+        part {List[str]} -- The parts of the video resource you're setting.
+
+        data {dict} -- The video resource, like its `snippet` and `status`.
+
+        video_path {str} -- The file path of the video.
+
+        Keyword Arguments:
+        ----
+        chunk_size {int} -- The number of bytes sent per request. (default: {2 MB})
+
+        progress_callback {Callable[[Dict], None]} -- Called after every chunk with the
+            `bytes_sent`, `total_bytes` and `progress`. (default: {None})
+
+        session_uri {str} -- The session URI of an interrupted upload to resume. (default: {None})
+
+        Returns:
+        ----
+        {Dict} -- The newly inserted Video resource.
+        """
+
+        # Define the arguments.
+        params = {
+            'key': self.api_key,
+            'part': ','.join(part)
+        }
+
+        return self._upload_media(
+            endpoint='videos',
+            file_path=video_path,
+            params=params,
+            metadata=data,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            session_uri=session_uri
+        )
+
     def grab_playlist(self, parts: List[str], playlist_id: str) -> Dict:
         """Grabs a specified playlist.
 
@@ -702,7 +1193,7 @@ class YouTubeClient():
 
         return response
 
-    def grab_my_channel(self, parts: List[str]) -> Dict:
+    def grab_my_channel(self, parts: List[str], fields: str = None) -> Dict:
         """Grabs a specified playlist.
 
         Arguments:
@@ -710,6 +1201,11 @@ class YouTubeClient():
         part {List[str]} -- The part details you want returned
             for the endpoint.
 
+        Keyword Arguments:
+        ----
+        fields {str} -- Trims the response down to these fields, like
+            `items/statistics/subscriberCount`. (default: {None})
+
         Returns:
         ----
         {Dict} -- A Channel resource object.
@@ -722,6 +1218,9 @@ class YouTubeClient():
             'part': ",".join(parts)
         }
 
+        if fields:
+            params['fields'] = fields
+
         # Define the endpoint.
         endpoint = 'channels'
 
@@ -802,7 +1301,7 @@ class YouTubeClient():
         while 'nextPageToken' in data.keys():
 
             # Add the next page.
-            params['pageToken'] = data['nextPageToken']
+            params = dict(params, pageToken=data['nextPageToken'])
 
             # Grab the data.
             data = self._make_request(
@@ -858,7 +1357,7 @@ class YouTubeClient():
         while 'nextPageToken' in data.keys():
 
             # Add the next page.
-            params['pageToken'] = data['nextPageToken']
+            params = dict(params, pageToken=data['nextPageToken'])
 
             # Grab the data.
             data = self._make_request(
@@ -876,6 +1375,10 @@ class YouTubeClient():
     def grab_videos(self, video_ids: List[str], parts: List[str]) -> Dict:
         """Grabs all the specified videos and parts requested
 
+        A video that's listed more than once in `video_ids`, like one that's in
+        several playlists, is only grabbed once. That only holds within one
+        call, nothing is remembered between calls.
+
         Arguments:
         ----
         video_id {List[str]} -- A list of video IDs you want to pull.
@@ -890,6 +1393,9 @@ class YouTubeClient():
         # Initialize a list to store the Video IDs.
         video_ids_list = []
 
+        # Drop the duplicates but keep the order.
+        video_ids = list(dict.fromkeys(video_ids))
+
         # Chunk the Video List.
         for chunk in self.chunks(content_list=video_ids, chunk_size=50):
 
@@ -919,7 +1425,7 @@ class YouTubeClient():
             while 'nextPageToken' in data.keys():
 
                 # Add the next page.
-                params['pageToken'] = data['nextPageToken']
+                params = dict(params, pageToken=data['nextPageToken'])
 
                 # Grab the data.
                 data = self._make_request(
@@ -983,7 +1489,7 @@ class YouTubeClient():
             while 'nextPageToken' in data.keys():
 
                 # Add the next page.
-                params['pageToken'] = data['nextPageToken']
+                params = dict(params, pageToken=data['nextPageToken'])
 
                 # Grab the data.
                 data = self._make_request(
@@ -1010,39 +1516,17 @@ class YouTubeClient():
         List[Dict]: A list of playlist objects.
         """
 
-        # Initial the playlist list.
-        playlists = []
-
         # Open the file.
-        with open(playlist_json_path, 'r') as playlist_json_file:
-            playlists_resources = json.load(fp=playlist_json_file)
+        playlists_resources = read_json(file_path=find_data_file(file_path=playlist_json_path))
 
-        # Loop through each playlist.
-        for playlist_resource in playlists_resources:
-
-            # Then each Item.
-            for playlist in playlist_resource['items']:
-
-                # Grab the items we want.
-                playlist_id = playlist['id']
-                playlist_title = playlist['snippet']['title']
-                playlist_item_count = playlist['contentDetails']['itemCount']
-
-                # Assign it.
-                playlist_dict = {
-                    'playlist_id': playlist_id,
-                    'playlist_title': playlist_title,
-                    'playlist_item_count': playlist_item_count
-                }
-
-                # Store it.
-                playlists.append(playlist_dict)
-
-        return playlists
+        return parse_pages(pages=playlists_resources, kind='playlists')
 
     def parse_playlist_items(self, playlist_items_json_path: str) -> List[Dict]:
         """Simplifies the PlaylistItem Objects to a more simplified object.
 
+        To parse many exports, or a big one, across every core use
+        `youtube.parsing.parse_to_file` instead.
+
         Arguments:
         ----
         playlist_items_json_path (str): The path to the JSON file.
@@ -1052,43 +1536,12 @@ class YouTubeClient():
         List[Dict]: A list of playlist item objects.
         """
 
-        # Initialize the list.
-        playlists_items = []
-
         # Open the file.
-        with open(playlist_items_json_path, 'r') as playlist_json_file:
-            playlists = json.load(fp=playlist_json_file)
-
-        # Loop through each playlist.
-        for playlist_resource in playlists:
-
-            # Then each video.
-            for playlist in playlist_resource['items']:
-
-                # Grab the items we want.
-                playlist_item_id = playlist['id']
-                playlist_item_title = playlist['snippet']['title']
-                playlist_item_position = playlist['snippet']['position']
-                playlist_item_playlist_id = playlist['snippet']['playlistId']
-                playlist_item_publish_time = playlist['snippet']['publishedAt']
-                playlist_item_video_id = playlist['snippet']['resourceId']['videoId']
-
-                # Assign it.
-                playlist_item_dict = {
-                    'playlist_item_id': playlist_item_id,
-                    'playlist_item_title': playlist_item_title,
-                    'playlist_item_position': playlist_item_position,
-                    'playlist_item_publish_time': playlist_item_publish_time,
-                    'playlist_item_video_id': playlist_item_video_id,
-                    'playlist_item_playlist_id': playlist_item_playlist_id
-                }
-
-                # Store it.
-                playlists_items.append(playlist_item_dict)
+        playlists = read_json(file_path=find_data_file(file_path=playlist_items_json_path))
 
-        return playlists_items
+        return parse_pages(pages=playlists, kind='playlist_items')
 
-    def save_to_json_file(self, file_name: str, youtube_content: dict, append: bool = False) -> str:
+    def save_to_json_file(self, file_name: str, youtube_content: dict, append: bool = False, compression: str = None, compact: bool = False) -> str:
         """Saves the content to a JSON file in the Data Folder.
 
         Arguments:
@@ -1100,28 +1553,35 @@ class YouTubeClient():
         append {bool} -- If `True` will merge the original file with the new content. `False` will
             overwrite the existing file.
 
+        compression {str} -- Compresses the file, one of [None, 'gzip', 'zstd']. The
+            file gets a `.gz` or `.zst` suffix. (default: {None})
+
+        compact {bool} -- If `True` the JSON is written without indentation, which is
+            a lot smaller than the pretty printed default. (default: {False})
+
         Returns:
         ----
         str -- The file path of the new file.
         """
 
         # Create a Path object.
-        file_path = self.data_folder_path.joinpath(
-            '{file_name}.json'.format(file_name=file_name)
+        file_path = data_file_path(
+            folder=self.data_folder_path,
+            file_name=file_name,
+            compression=compression
         )
 
-        # Open the JSON file and save it
-        if not append:
-            with open(file_path, 'w+') as content_file:
-                json.dump(obj=youtube_content, fp=content_file, indent=2)
-
         # If in append mode, merge the two files.
-        else:
-            with open(file_path, 'r') as content_file:
-                content = json.load(fp=content_file)
-                youtube_content = youtube_content + content
+        if append:
+            content = read_json(file_path=file_path)
+            youtube_content = youtube_content + content
 
-            with open(file_path, 'w+') as content_file:
-                json.dump(obj=youtube_content, fp=content_file, indent=2)
+        # Open the JSON file and save it
+        write_json(
+            file_path=file_path,
+            content=youtube_content,
+            compression=compression,
+            compact=compact
+        )
 
         return file_path.resolve()
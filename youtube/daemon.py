@@ -0,0 +1,242 @@
+import time
+import pathlib
+
+from typing import Dict
+from typing import Callable
+
+from youtube.storage import read_json
+from youtube.storage import write_json
+
+
+# Only the one number we need, the rest of the channel resource is dropped.
+SUBSCRIBER_FIELDS = 'items/statistics/subscriberCount'
+
+
+def display_step(count: int, significant: int = 3) -> int:
+    """Works out how much a count has to move before its rounded value changes.
+
+    Arguments:
+    ----
+    count {int} -- The subscriber count.
+
+    Keyword Arguments:
+    ----
+    significant {int} -- The significant figures shown. (default: {3})
+
+    Returns:
+    ----
+    {int} -- The size of one step, `100` for a count like `25,400`.
+    """
+
+    return 10 ** max(0, len(str(abs(count))) - significant)
+
+
+def round_count(count: int, significant: int = 3) -> int:
+    """Rounds a count down to its significant figures, like YouTube does publicly."""
+
+    step = display_step(count=count, significant=significant)
+
+    return count // step * step
+
+
+def subscriber_text(count: int) -> str:
+    """The text shown on the thumbnail, like `25,400 SO FAR !!!`."""
+
+    return "{curr_subs} SO FAR !!!".format(
+        curr_subs='{:,}'.format(count)
+    )
+
+
+class SubscriberPoller():
+
+    def __init__(self, youtube_session: object, on_change: Callable[[int, str], None],
+                 display: Callable[[int], str] = subscriber_text, significant: int = 3,
+                 min_interval: float = 60.0, max_interval: float = 3600.0, smoothing: float = 0.3,
+                 state_path: str = None) -> None:
+        """Initalizes a daemon that polls the subscriber count and reacts when it changes.
+
+        Each poll asks for `part=statistics` trimmed to the subscriber count, 1 quota
+        unit. The count is rounded to its significant figures and turned into the
+        displayed text, and `on_change` only runs when that text differs from the
+        last one. The wait between polls follows how fast the count moves: about
+        half the expected time until the next displayed change, clamped between
+        the minimum and maximum interval.
+
+        Arguments:
+        ----
+        youtube_session {YouTubeClient} -- The client used to grab the channel.
+
+        on_change {Callable[[int, str], None]} -- Called with the rounded count and its
+            text when the displayed text changes, like a render and upload.
+
+        Keyword Arguments:
+        ----
+        display {Callable[[int], str]} -- Turns a rounded count into the displayed text. (default: {subscriber_text})
+
+        significant {int} -- The significant figures displayed. (default: {3})
+
+        min_interval {float} -- The shortest wait between polls in seconds. (default: {60.0})
+
+        max_interval {float} -- The longest wait between polls in seconds. (default: {3600.0})
+
+        smoothing {float} -- How much a new rate sample counts against the old estimate. (default: {0.3})
+
+        state_path {str} -- A JSON file the last displayed text is kept in, so a restart
+            doesn't render again. (default: {None})
+
+        Usage:
+        ----
+            >>> poller = SubscriberPoller(
+                youtube_session=youtube_session,
+                on_change=lambda count, text: print(text)
+            )
+            >>> poller.run()
+        """
+
+        self.youtube_session = youtube_session
+        self.on_change = on_change
+        self.display = display
+        self.significant = significant
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.smoothing = smoothing
+        self.state_path = pathlib.Path(state_path).absolute() if state_path else None
+
+        self.interval = min_interval
+        self.rate = None
+        self.last_count = None
+        self.last_poll = None
+        self.last_text = None
+        self.polls = 0
+        self.changes = 0
+
+        if self.state_path and self.state_path.exists():
+            self.last_text = read_json(file_path=self.state_path).get('last_text')
+
+    def fetch_count(self) -> int:
+        """Grabs the raw subscriber count.
+
+        Raises:
+        ----
+        ValueError: The API returned an error or no channel.
+
+        Returns:
+        ----
+        {int} -- The subscriber count.
+        """
+
+        response = self.youtube_session.grab_my_channel(
+            parts=['statistics'],
+            fields=SUBSCRIBER_FIELDS
+        )
+
+        if not response or 'error' in response or not response.get('items'):
+            raise ValueError(
+                "Couldn't grab the subscriber count: {response}".format(response=response)
+            )
+
+        return int(response['items'][0]['statistics']['subscriberCount'])
+
+    def _update_rate(self, count: int, now: float) -> None:
+        """Blends the latest subscribers per second into the running estimate."""
+
+        if self.last_count is not None and now > self.last_poll:
+
+            sample = abs(count - self.last_count) / (now - self.last_poll)
+
+            if self.rate is None:
+                self.rate = sample
+            else:
+                self.rate = self.smoothing * sample + (1 - self.smoothing) * self.rate
+
+        self.last_count = count
+        self.last_poll = now
+
+    def next_interval(self, count: int) -> float:
+        """Works out how long to wait before the next poll.
+
+        Arguments:
+        ----
+        count {int} -- The latest subscriber count.
+
+        Returns:
+        ----
+        {float} -- The wait in seconds.
+        """
+
+        # Nothing's moving, back off.
+        if not self.rate:
+            return min(self.max_interval, self.interval * 2)
+
+        # Poll twice for each displayed change we expect.
+        expected = display_step(count=count, significant=self.significant) / self.rate / 2
+
+        return min(self.max_interval, max(self.min_interval, expected))
+
+    def _save_state(self) -> None:
+        """Saves the last displayed text."""
+
+        if self.state_path:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            write_json(file_path=self.state_path, content={'last_text': self.last_text})
+
+    def poll_once(self) -> Dict:
+        """Polls the count once and runs `on_change` if the displayed text changed.
+
+        Returns:
+        ----
+        {Dict} -- The `count`, `text`, whether it `changed` and the next `interval`,
+            or the `error` if the poll failed.
+        """
+
+        self.polls += 1
+
+        try:
+            count = self.fetch_count()
+        except (OSError, ValueError, KeyError) as poll_error:
+            self.interval = min(self.max_interval, self.interval * 2)
+            return {'error': str(poll_error), 'interval': self.interval}
+
+        self._update_rate(count=count, now=time.time())
+        self.interval = self.next_interval(count=count)
+
+        rounded = round_count(count=count, significant=self.significant)
+        text = self.display(rounded)
+        changed = text != self.last_text
+
+        if changed:
+
+            # Only remember the text once it's on the thumbnail, a failure tries again next poll.
+            try:
+                self.on_change(rounded, text)
+            except Exception as change_error:
+                return {'count': count, 'text': text, 'changed': False, 'error': str(change_error), 'interval': self.interval}
+
+            self.last_text = text
+            self.changes += 1
+            self._save_state()
+
+        return {'count': count, 'text': text, 'changed': changed, 'interval': self.interval}
+
+    def run(self, max_polls: int = None) -> None:
+        """Polls until stopped.
+
+        Keyword Arguments:
+        ----
+        max_polls {int} -- Stops after this many polls, runs forever if not set. (default: {None})
+        """
+
+        while max_polls is None or self.polls < max_polls:
+
+            result = self.poll_once()
+
+            print('Poll {polls}: {result}, next poll in {interval:.0f}s.'.format(
+                polls=self.polls,
+                result=result.get('error', result.get('text')),
+                interval=result['interval']
+            ))
+
+            if max_polls is not None and self.polls >= max_polls:
+                break
+
+            time.sleep(result['interval'])
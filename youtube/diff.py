@@ -0,0 +1,324 @@
+import bisect
+import pathlib
+
+from typing import Dict
+from typing import List
+from typing import Union
+from typing import Iterable
+
+from youtube.storage import read_json
+from youtube.storage import find_data_file
+
+
+# The short name each resource kind is reported under.
+KINDS = {
+    'youtube#playlistItem': 'playlistItem',
+    'youtube#playlist': 'playlist',
+    'youtube#video': 'video',
+    'youtube#channel': 'channel'
+}
+
+# The data files a sync writes, see `youtube.runner`.
+SNAPSHOT_FILES = ['channel_playlists', 'channel_playlists_items_all', 'channel_videos']
+
+
+def empty_changeset() -> Dict[str, List[Dict]]:
+    """Builds a changeset with nothing in it."""
+
+    return {
+        'added': [],
+        'removed': [],
+        'moved': [],
+        'title_changes': [],
+        'statistics': []
+    }
+
+
+def index_resources(snapshot: Union[Dict, Iterable[Dict]]) -> Dict[str, Dict]:
+    """Indexes the resources in a snapshot by kind and ID.
+
+    Arguments:
+    ----
+    snapshot {Union[Dict, Iterable[Dict]]} -- A list response, a list of them like
+        `save_to_json_file` writes, or a list of resources.
+
+    Returns:
+    ----
+    {Dict[str, Dict]} -- The resources keyed by `<kind>:<id>`.
+    """
+
+    if isinstance(snapshot, dict):
+        snapshot = [snapshot]
+
+    index = {}
+
+    for resource in snapshot:
+
+        # Unwrap list responses.
+        resources = resource.get('items', []) if resource.get('kind') not in KINDS else [resource]
+
+        for item in resources:
+            kind = KINDS.get(item.get('kind'))
+            if kind and item.get('id'):
+                index['{kind}:{id}'.format(kind=kind, id=item['id'])] = item
+
+    return index
+
+
+def _describe(kind: str, resource: Dict) -> Dict:
+    """The fields every entry in a changeset starts with."""
+
+    snippet = resource.get('snippet', {})
+
+    entry = {
+        'kind': kind,
+        'id': resource['id'],
+        'title': snippet.get('title')
+    }
+
+    if kind == 'playlistItem':
+        entry['playlist_id'] = snippet.get('playlistId')
+        entry['video_id'] = snippet.get('resourceId', {}).get('videoId')
+        entry['position'] = snippet.get('position')
+
+    return entry
+
+
+def _numbers(kind: str, resource: Dict) -> Dict[str, int]:
+    """Pulls the counts out of a resource, its `statistics` or a playlist's `itemCount`."""
+
+    if kind == 'playlist':
+        values = {'itemCount': resource.get('contentDetails', {}).get('itemCount')}
+    else:
+        values = resource.get('statistics', {})
+
+    numbers = {}
+
+    for name, value in values.items():
+        try:
+            numbers[name] = int(value)
+        except (TypeError, ValueError):
+            continue
+
+    return numbers
+
+
+def _moved(old_positions: Dict[str, int], new_positions: Dict[str, int]) -> List[str]:
+    """Finds the items that were really reordered in a playlist.
+
+    Inserting or removing an item shifts everything after it, which isn't a
+    move. The items kept in the longest run whose old order matches the new
+    order stayed put, everything else moved.
+    """
+
+    common = sorted(
+        (position, key) for key, position in new_positions.items()
+        if position is not None and old_positions.get(key) is not None
+    )
+    sequence = [old_positions[key] for _, key in common]
+
+    # Longest increasing subsequence, remembering the predecessor of each item.
+    tails = []
+    tail_indexes = []
+    previous = [-1] * len(sequence)
+
+    for index, value in enumerate(sequence):
+
+        slot = bisect.bisect_left(tails, value)
+
+        if slot > 0:
+            previous[index] = tail_indexes[slot - 1]
+
+        if slot == len(tails):
+            tails.append(value)
+            tail_indexes.append(index)
+        else:
+            tails[slot] = value
+            tail_indexes[slot] = index
+
+    stayed = set()
+    index = tail_indexes[-1] if tail_indexes else -1
+
+    while index != -1:
+        stayed.add(common[index][1])
+        index = previous[index]
+
+    return [key for _, key in common if key not in stayed]
+
+
+def diff_snapshots(old: Union[Dict, Iterable[Dict]], new: Union[Dict, Iterable[Dict]]) -> Dict[str, List[Dict]]:
+    """Compares two snapshots of channel state.
+
+    Both snapshots are indexed by ID once, so the comparison is linear in their
+    size instead of comparing every resource with every other one.
+
+    Arguments:
+    ----
+    old {Union[Dict, Iterable[Dict]]} -- The earlier snapshot, see `index_resources`.
+
+    new {Union[Dict, Iterable[Dict]]} -- The later snapshot.
+
+    Returns:
+    ----
+    {Dict[str, List[Dict]]} -- The `added` and `removed` resources, the playlist items
+        `moved` to a new spot, the `title_changes` and the `statistics` deltas of videos,
+        channels and playlist item counts.
+
+    Usage:
+    ----
+        >>> changeset = diff_snapshots(
+                old=read_json('data/channels/<CHANNEL_ID>/channel_playlists_items_all.json'),
+                new=youtube_session.playlists_items(playlist_id='<PLAYLIST_ID>', all_pages=True)
+            )
+    """
+
+    old_index = index_resources(snapshot=old)
+    new_index = index_resources(snapshot=new)
+
+    changeset = empty_changeset()
+
+    # The positions of the items in each playlist, to work out the moves.
+    old_positions: Dict[str, Dict[str, int]] = {}
+    new_positions: Dict[str, Dict[str, int]] = {}
+
+    for key, resource in new_index.items():
+
+        kind = key.split(':', 1)[0]
+        entry = _describe(kind=kind, resource=resource)
+
+        if key not in old_index:
+            changeset['added'].append(entry)
+            continue
+
+        old_resource = old_index[key]
+        old_snippet = old_resource.get('snippet', {})
+
+        if old_snippet.get('title') != entry['title']:
+
+            title_change = {
+                'kind': kind,
+                'id': entry['id'],
+                'from': old_snippet.get('title'),
+                'to': entry['title']
+            }
+
+            if kind == 'playlistItem':
+                title_change['video_id'] = entry['video_id']
+
+            changeset['title_changes'].append(title_change)
+
+        if kind == 'playlistItem':
+            old_positions.setdefault(old_snippet.get('playlistId'), {})[key] = old_snippet.get('position')
+            new_positions.setdefault(entry['playlist_id'], {})[key] = entry['position']
+
+        # Counts that went up or down.
+        old_numbers = _numbers(kind=kind, resource=old_resource)
+        new_numbers = _numbers(kind=kind, resource=resource)
+
+        deltas = {
+            name: value - old_numbers[name]
+            for name, value in new_numbers.items()
+            if name in old_numbers and value != old_numbers[name]
+        }
+
+        if deltas:
+            changeset['statistics'].append({'kind': kind, 'id': entry['id'], 'deltas': deltas})
+
+    for key, resource in old_index.items():
+        if key not in new_index:
+            changeset['removed'].append(_describe(kind=key.split(':', 1)[0], resource=resource))
+
+    for playlist_id, positions in new_positions.items():
+        for key in _moved(old_positions=old_positions.get(playlist_id, {}), new_positions=positions):
+            changeset['moved'].append({
+                'kind': 'playlistItem',
+                'id': new_index[key]['id'],
+                'playlist_id': playlist_id,
+                'video_id': new_index[key].get('snippet', {}).get('resourceId', {}).get('videoId'),
+                'from': old_positions[playlist_id][key],
+                'to': positions[key]
+            })
+
+    return changeset
+
+
+def diff_files(old_path: Union[str, pathlib.Path], new_path: Union[str, pathlib.Path]) -> Dict[str, List[Dict]]:
+    """Compares two files saved with `save_to_json_file`, compressed or not.
+
+    Arguments:
+    ----
+    old_path {Union[str, pathlib.Path]} -- The earlier file.
+
+    new_path {Union[str, pathlib.Path]} -- The later file.
+
+    Returns:
+    ----
+    {Dict[str, List[Dict]]} -- The changeset, see `diff_snapshots`.
+    """
+
+    return diff_snapshots(
+        old=read_json(file_path=find_data_file(file_path=old_path)),
+        new=read_json(file_path=find_data_file(file_path=new_path))
+    )
+
+
+def diff_folders(old_folder: Union[str, pathlib.Path], new_folder: Union[str, pathlib.Path],
+                 file_names: List[str] = None) -> Dict[str, List[Dict]]:
+    """Compares two sync folders, like two copies of `data/channels/<channel_id>`.
+
+    Arguments:
+    ----
+    old_folder {Union[str, pathlib.Path]} -- The earlier sync.
+
+    new_folder {Union[str, pathlib.Path]} -- The later sync.
+
+    Keyword Arguments:
+    ----
+    file_names {List[str]} -- The data files to compare, without extensions. (default: {SNAPSHOT_FILES})
+
+    Returns:
+    ----
+    {Dict[str, List[Dict]]} -- One changeset covering every file found in both folders.
+    """
+
+    changeset = empty_changeset()
+
+    for file_name in file_names or SNAPSHOT_FILES:
+
+        try:
+            file_changes = diff_files(
+                old_path=pathlib.Path(old_folder).joinpath(file_name + '.json'),
+                new_path=pathlib.Path(new_folder).joinpath(file_name + '.json')
+            )
+        except FileNotFoundError:
+            continue
+
+        for section, entries in file_changes.items():
+            changeset[section].extend(entries)
+
+    return changeset
+
+
+def changed_video_ids(changeset: Dict[str, List[Dict]]) -> List[str]:
+    """Lists the videos a changeset touches, for incremental processing downstream.
+
+    Arguments:
+    ----
+    changeset {Dict[str, List[Dict]]} -- The changeset from `diff_snapshots`.
+
+    Returns:
+    ----
+    {List[str]} -- The video IDs, in the order they first show up.
+    """
+
+    video_ids = {}
+
+    for entries in changeset.values():
+        for entry in entries:
+
+            video_id = entry.get('video_id') or (entry['id'] if entry.get('kind') == 'video' else None)
+
+            if video_id:
+                video_ids[video_id] = True
+
+    return list(video_ids)
@@ -0,0 +1,279 @@
+import io
+import os
+import math
+import pathlib
+import hashlib
+import tempfile
+
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+from youtube.thumbnails import file_hash
+
+try:
+    from PIL import Image
+    from PIL import ImageOps
+    from PIL import ImageChops
+    from PIL import ImageStat
+except ImportError:
+    Image = None
+
+
+# The thumbnail size YouTube recommends.
+THUMBNAIL_SIZE = (1280, 720)
+
+# The largest thumbnail the API accepts.
+MAX_THUMBNAIL_BYTES = 2 * 1024 * 1024
+
+# Images whose aspect ratio is off by less than this are stretched to fit instead of cropped.
+ASPECT_TOLERANCE = 0.01
+
+
+def _require_pillow() -> None:
+    """Raises a helpful error if the optional `Pillow` package is missing."""
+
+    if Image is None:
+        raise ImportError(
+            "Optimizing thumbnails needs the `Pillow` package, install it with `pip install Pillow`."
+        )
+
+
+def psnr(original: 'Image.Image', encoded: 'Image.Image') -> float:
+    """Measures how close an encoded image is to the original.
+
+    Arguments:
+    ----
+    original {Image.Image} -- The reference image.
+
+    encoded {Image.Image} -- The image after a round trip through an encoder.
+
+    Returns:
+    ----
+    {float} -- The peak signal to noise ratio in decibels, `inf` if the images are identical.
+    """
+
+    difference = ImageChops.difference(original.convert('RGB'), encoded.convert('RGB'))
+    mean_squared_error = sum(value ** 2 for value in ImageStat.Stat(difference).rms) / 3
+
+    if mean_squared_error == 0:
+        return math.inf
+
+    return 10 * math.log10(255 ** 2 / mean_squared_error)
+
+
+class ThumbnailOptimizer():
+
+    def __init__(self, cache_folder: str = 'data/thumbnail_cache', size: Tuple[int, int] = THUMBNAIL_SIZE,
+                 max_bytes: int = MAX_THUMBNAIL_BYTES, min_psnr: float = 40.0, min_jpeg_quality: int = 70,
+                 max_jpeg_quality: int = 95, background: Tuple[int, int, int] = (25, 24, 24)) -> None:
+        """Initalizes a pipeline that shrinks thumbnails before they're uploaded.
+
+        Every image is fit to the thumbnail size, flattened onto the background
+        and stripped of its metadata. It's then encoded as an optimized PNG and as
+        the lowest quality JPEG that still meets the quality bar, and the smallest
+        of the two that fits under the size limit wins.
+
+        Arguments:
+        ----
+        cache_folder {str} -- Where the optimized images are kept, keyed by the hash
+            of the source image and the settings. (default: {'data/thumbnail_cache'})
+
+        size {Tuple[int, int]} -- The width and height of the output. (default: {(1280, 720)})
+
+        max_bytes {int} -- The largest output allowed. (default: {2 MB})
+
+        min_psnr {float} -- The quality bar, the lowest peak signal to noise ratio in
+            decibels a JPEG can have compared to the resized image. (default: {40.0})
+
+        min_jpeg_quality {int} -- The lowest JPEG quality ever tried. (default: {70})
+
+        max_jpeg_quality {int} -- The highest JPEG quality ever tried. (default: {95})
+
+        background {Tuple[int, int, int]} -- The color transparent pixels are flattened
+            onto, the thumbnail's black by default. (default: {(25, 24, 24)})
+
+        Usage:
+        ----
+            >>> optimizer = ThumbnailOptimizer()
+            >>> youtube_session.upload_thumbnail(
+                video_id='XEjaDFqImCk',
+                thumbnail_path='thumbnails/current_thumbnail.png',
+                optimizer=optimizer
+            )
+        """
+
+        _require_pillow()
+
+        self.cache_folder = pathlib.Path(cache_folder).absolute()
+        self.size = tuple(size)
+        self.max_bytes = max_bytes
+        self.min_psnr = min_psnr
+        self.min_jpeg_quality = min_jpeg_quality
+        self.max_jpeg_quality = max_jpeg_quality
+        self.background = tuple(background)
+
+    @property
+    def settings_hash(self) -> str:
+        """A short hash of the settings, so changing them doesn't reuse old results."""
+
+        settings = '{size}|{max_bytes}|{min_psnr}|{min_jpeg_quality}|{max_jpeg_quality}|{background}'.format(
+            size=self.size,
+            max_bytes=self.max_bytes,
+            min_psnr=self.min_psnr,
+            min_jpeg_quality=self.min_jpeg_quality,
+            max_jpeg_quality=self.max_jpeg_quality,
+            background=self.background
+        )
+
+        return hashlib.sha256(settings.encode('utf-8')).hexdigest()[:12]
+
+    def prepare(self, image: 'Image.Image') -> 'Image.Image':
+        """Fits, flattens and strips an image.
+
+        Arguments:
+        ----
+        image {Image.Image} -- The source image.
+
+        Returns:
+        ----
+        {Image.Image} -- A fresh RGB image of the thumbnail size, with no metadata.
+        """
+
+        image = ImageOps.exif_transpose(image).convert('RGBA')
+
+        # A slightly off export is scaled as is, so nothing at its edges is lost, only
+        # an image with a really different aspect ratio is cropped around the center.
+        width, height = image.size
+        target_ratio = self.size[0] / self.size[1]
+
+        if abs((width / height) / target_ratio - 1) <= ASPECT_TOLERANCE:
+            image = image.resize(self.size, Image.LANCZOS)
+        else:
+            image = ImageOps.fit(image, self.size, method=Image.LANCZOS)
+
+        # Flatten the transparency, a new image carries none of the old metadata.
+        flattened = Image.new('RGB', self.size, self.background)
+        flattened.paste(image, mask=image.split()[-1])
+
+        return flattened
+
+    def _encode_png(self, image: 'Image.Image') -> bytes:
+        """Encodes an optimized PNG."""
+
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG', optimize=True)
+
+        return buffer.getvalue()
+
+    def _encode_jpeg(self, image: 'Image.Image', quality: int) -> bytes:
+        """Encodes an optimized progressive JPEG."""
+
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=quality, optimize=True, progressive=True, subsampling=0)
+
+        return buffer.getvalue()
+
+    def _encode_best_jpeg(self, image: 'Image.Image') -> Tuple[int, bytes]:
+        """Searches for the lowest JPEG quality that still meets the quality bar.
+
+        Returns:
+        ----
+        {Tuple[int, bytes]} -- The quality and the encoded image, or `(None, None)`
+            if even the highest quality misses the bar.
+        """
+
+        best = (None, None)
+        low = self.min_jpeg_quality
+        high = self.max_jpeg_quality
+
+        # Quality and PSNR go up together, so a binary search finds the lowest one that passes.
+        while low <= high:
+
+            quality = (low + high) // 2
+            encoded = self._encode_jpeg(image=image, quality=quality)
+
+            if psnr(original=image, encoded=Image.open(io.BytesIO(encoded))) >= self.min_psnr:
+                best = (quality, encoded)
+                high = quality - 1
+            else:
+                low = quality + 1
+
+        return best
+
+    def encode(self, image: 'Image.Image') -> Dict:
+        """Picks the smallest encoding of an image that meets the quality bar and size limit.
+
+        Arguments:
+        ----
+        image {Image.Image} -- The source image.
+
+        Raises:
+        ----
+        ValueError: No encoding fits under the size limit.
+
+        Returns:
+        ----
+        {Dict} -- The `format`, `content` and JPEG `quality` of the winner.
+        """
+
+        prepared = self.prepare(image=image)
+
+        candidates = [{'format': 'png', 'content': self._encode_png(image=prepared), 'quality': None}]
+
+        quality, encoded = self._encode_best_jpeg(image=prepared)
+
+        if encoded is not None:
+            candidates.append({'format': 'jpg', 'content': encoded, 'quality': quality})
+
+        candidates = [
+            candidate for candidate in candidates
+            if len(candidate['content']) <= self.max_bytes
+        ]
+
+        if not candidates:
+            raise ValueError(
+                "No encoding of the thumbnail fits under {max_bytes} bytes at the quality bar.".format(
+                    max_bytes=self.max_bytes
+                )
+            )
+
+        return min(candidates, key=lambda candidate: len(candidate['content']))
+
+    def optimize(self, file_path: Union[str, pathlib.Path]) -> pathlib.Path:
+        """Optimizes a thumbnail, reusing the cached result if the source hasn't changed.
+
+        Arguments:
+        ----
+        file_path {Union[str, pathlib.Path]} -- The path of the source image.
+
+        Returns:
+        ----
+        {pathlib.Path} -- The path of the optimized image in the cache folder.
+        """
+
+        cache_key = '{source_hash}-{settings_hash}'.format(
+            source_hash=file_hash(file_path=file_path),
+            settings_hash=self.settings_hash
+        )
+
+        # The same source with the same settings always gives the same output.
+        for cached_path in self.cache_folder.glob(cache_key + '.*'):
+            if cached_path.suffix in ['.png', '.jpg']:
+                return cached_path
+
+        with Image.open(file_path) as image:
+            best = self.encode(image=image)
+
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary name first so a half written file is never picked up.
+        cached_path = self.cache_folder.joinpath(cache_key + '.' + best['format'])
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_folder, suffix='.tmp')
+
+        with os.fdopen(file_descriptor, 'wb') as temp_file:
+            temp_file.write(best['content'])
+
+        os.replace(temp_path, cached_path)
+
+        return cached_path
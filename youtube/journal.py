@@ -0,0 +1,441 @@
+import os
+import json
+import uuid
+import pathlib
+import threading
+
+from datetime import datetime
+from datetime import timezone
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+# The client methods that change channel state and can be journaled.
+JOURNALED_METHODS = [
+    'insert_playlist',
+    'insert_playlist_items',
+    'update_playlist',
+    'update_playlist_items',
+    'update_video',
+    'delete_playlist_items'
+]
+
+# HTTP codes and reasons that mean the mutation never happened and can be sent again.
+RETRYABLE_CODES = [429, 500, 502, 503, 504]
+RETRYABLE_REASONS = [
+    'rateLimitExceeded',
+    'userRateLimitExceeded',
+    'quotaExceeded',
+    'backendError'
+]
+
+
+class MutationJournal():
+
+    def __init__(self, journal_path: str) -> None:
+        """Initalizes a new write-ahead journal for channel mutations.
+
+        Every mutation is written to the journal as an `intent` entry before it's
+        sent, and as a `result` entry once the API has answered. If the process
+        dies in between, `resume()` will replay only the operations that never
+        got an answer.
+
+        Arguments:
+        ----
+        journal_path {str} -- The path to the journal file, the file is stored
+            as JSON lines and is created if it doesn't exist.
+
+        Usage:
+        ----
+            >>> journal = MutationJournal(journal_path='data/mutations.jsonl')
+            >>> journal.execute(
+                client=youtube_session,
+                method='delete_playlist_items',
+                playlist_item_id='<PLAYLIST_ITEM_ID>'
+            )
+        """
+
+        self.journal_path = pathlib.Path(journal_path).absolute()
+        self._lock = threading.Lock()
+
+        # Make sure the folder exists so the first append doesn't fail.
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _append(self, entry: Dict) -> None:
+        """Appends a single entry to the journal and forces it to disk.
+
+        Arguments:
+        ----
+        entry {Dict} -- The journal entry to write.
+        """
+
+        # Stamp the entry.
+        entry['timestamp'] = datetime.now(tz=timezone.utc).isoformat()
+
+        with self._lock:
+            with open(self.journal_path, 'a+b') as journal_file:
+
+                # A crash mid-write leaves a last line with no newline, end it so
+                # this entry doesn't get glued onto the broken one.
+                if journal_file.seek(0, os.SEEK_END) > 0:
+                    journal_file.seek(-1, os.SEEK_END)
+                    if journal_file.read(1) != b'\n':
+                        journal_file.write(b'\n')
+
+                journal_file.write((json.dumps(obj=entry) + '\n').encode('utf-8'))
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+    def entries(self) -> List[Dict]:
+        """Reads every entry in the journal.
+
+        A partially written last line, left behind by a crash mid-write,
+        is ignored.
+
+        Returns:
+        ----
+        {List[Dict]} -- The journal entries in the order they were written.
+        """
+
+        # No journal, no entries.
+        if not self.journal_path.exists():
+            return []
+
+        journal_entries = []
+
+        with open(self.journal_path, 'r', encoding='utf-8') as journal_file:
+            for line in journal_file:
+
+                try:
+                    journal_entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+        return journal_entries
+
+    def record_intent(self, method: str, arguments: Dict) -> str:
+        """Records a mutation before it's sent.
+
+        Arguments:
+        ----
+        method {str} -- The name of the `YouTubeClient` method that will be called.
+
+        arguments {Dict} -- The keyword arguments for the method.
+
+        Returns:
+        ----
+        {str} -- The operation ID used to record the result.
+        """
+
+        if method not in JOURNALED_METHODS:
+            raise ValueError(
+                "Method {method} can't be journaled, must be one of {methods}.".format(
+                    method=method,
+                    methods=JOURNALED_METHODS
+                )
+            )
+
+        # Define the operation ID.
+        op_id = uuid.uuid4().hex
+
+        self._append(
+            entry={
+                'type': 'intent',
+                'op_id': op_id,
+                'method': method,
+                'arguments': arguments
+            }
+        )
+
+        return op_id
+
+    def record_result(self, op_id: str, response: Dict, status: str = None) -> str:
+        """Records the API answer for a mutation.
+
+        Arguments:
+        ----
+        op_id {str} -- The operation ID returned by `record_intent()`.
+
+        response {Dict} -- The response returned by the client method.
+
+        Keyword Arguments:
+        ----
+        status {str} -- Overrides the status derived from the response, one
+            of ['acknowledged', 'failed', 'retryable', 'reconciled']. (default: {None})
+
+        Returns:
+        ----
+        {str} -- The status that was recorded.
+        """
+
+        if status is None:
+            status = self._status_from_response(response=response)
+
+        # Only keep the bits we need to identify the resource, not the whole payload.
+        response = response or {}
+        summary = {
+            'id': response.get('id'),
+            'etag': response.get('etag'),
+            'error': response.get('error')
+        }
+
+        self._append(
+            entry={
+                'type': 'result',
+                'op_id': op_id,
+                'status': status,
+                'response': summary
+            }
+        )
+
+        return status
+
+    def _status_from_response(self, response: Dict) -> str:
+        """Classifies a client response as acknowledged, failed or retryable.
+
+        Arguments:
+        ----
+        response {Dict} -- The response returned by the client method.
+
+        Returns:
+        ----
+        {str} -- The status of the mutation.
+        """
+
+        # Deletes come back empty when they work.
+        if not response or 'error' not in response:
+            return 'acknowledged'
+
+        error = response['error']
+        reasons = [detail.get('reason') for detail in error.get('errors', [])]
+
+        if error.get('code') in RETRYABLE_CODES:
+            return 'retryable'
+        elif set(reasons).intersection(RETRYABLE_REASONS):
+            return 'retryable'
+        else:
+            return 'failed'
+
+    def pending(self) -> List[Dict]:
+        """Returns the intents that still need to be sent.
+
+        An intent is pending if it has no result, or if its last result
+        was a retryable failure.
+
+        Returns:
+        ----
+        {List[Dict]} -- The pending intent entries, in the order they were planned.
+        """
+
+        intents = {}
+        statuses = {}
+
+        for entry in self.entries():
+            if entry['type'] == 'intent':
+                intents[entry['op_id']] = entry
+            elif entry['type'] == 'result':
+                statuses[entry['op_id']] = entry['status']
+
+        return [
+            intent for op_id, intent in intents.items()
+            if statuses.get(op_id, 'retryable') == 'retryable'
+        ]
+
+    def execute(self, client: object, method: str, **kwargs) -> Dict:
+        """Journals and sends a single mutation.
+
+        Arguments:
+        ----
+        client {YouTubeClient} -- The client used to send the mutation.
+
+        method {str} -- The name of the client method to call.
+
+        Returns:
+        ----
+        {Dict} -- The response from the client method.
+        """
+
+        op_id = self.record_intent(method=method, arguments=kwargs)
+
+        return self._send(client=client, op_id=op_id, method=method, arguments=kwargs)
+
+    def execute_many(self, client: object, operations: List[Tuple[str, Dict]], max_workers: int = 4) -> List[Dict]:
+        """Journals a batch of mutations up front and sends them concurrently.
+
+        Every intent is written before the first request goes out, so the whole
+        batch can be resumed no matter where the process stops.
+
+        Arguments:
+        ----
+        client {YouTubeClient} -- The client used to send the mutations.
+
+        operations {List[Tuple[str, Dict]]} -- A list of `(method, arguments)` pairs.
+
+        Keyword Arguments:
+        ----
+        max_workers {int} -- The number of mutations in flight at once. (default: {4})
+
+        Returns:
+        ----
+        {List[Dict]} -- The responses, in the same order as `operations`.
+        """
+
+        # Record every intent first.
+        planned = [
+            (self.record_intent(method=method, arguments=arguments), method, arguments)
+            for method, arguments in operations
+        ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._send, client, op_id, method, arguments)
+                for op_id, method, arguments in planned
+            ]
+
+        return [future.result() for future in futures]
+
+    def _send(self, client: object, op_id: str, method: str, arguments: Dict) -> Dict:
+        """Calls the client method and records the result.
+
+        Arguments:
+        ----
+        client {YouTubeClient} -- The client used to send the mutation.
+
+        op_id {str} -- The operation ID for the mutation.
+
+        method {str} -- The name of the client method to call.
+
+        arguments {Dict} -- The keyword arguments for the method.
+
+        Returns:
+        ----
+        {Dict} -- The response from the client method.
+        """
+
+        response = getattr(client, method)(**arguments)
+        self.record_result(op_id=op_id, response=response)
+
+        return response
+
+    def resume(self, client: object) -> List[Dict]:
+        """Replays every pending mutation.
+
+        Inserts are checked against the current server state first so a video
+        that already made it into a playlist isn't added twice. Deletes that
+        come back as not found are treated as done, and updates are plain PUTs
+        so they're safe to send again.
+
+        Arguments:
+        ----
+        client {YouTubeClient} -- The client used to send the mutations.
+
+        Returns:
+        ----
+        {List[Dict]} -- A list of `{'op_id', 'method', 'status'}` summaries.
+        """
+
+        summaries = []
+        playlist_cache = {}
+
+        for intent in self.pending():
+
+            op_id = intent['op_id']
+            method = intent['method']
+            arguments = intent['arguments']
+
+            # Skip inserts the server already has.
+            if self._already_applied(client=client, method=method, arguments=arguments, cache=playlist_cache):
+                status = self.record_result(op_id=op_id, response={}, status='reconciled')
+
+            else:
+                response = getattr(client, method)(**arguments)
+
+                # A delete for something that's gone already did its job.
+                if method == 'delete_playlist_items' and (response or {}).get('error', {}).get('code') == 404:
+                    status = self.record_result(op_id=op_id, response=response, status='reconciled')
+                else:
+                    status = self.record_result(op_id=op_id, response=response)
+
+                # Remember what went in, so a duplicate intent later in the journal isn't sent again.
+                if status == 'acknowledged':
+                    self._record_applied(method=method, arguments=arguments, cache=playlist_cache)
+
+            summaries.append({'op_id': op_id, 'method': method, 'status': status})
+
+        return summaries
+
+    def _already_applied(self, client: object, method: str, arguments: Dict, cache: Dict) -> bool:
+        """Checks the server to see if an insert made it through before the crash.
+
+        Arguments:
+        ----
+        client {YouTubeClient} -- The client used to read the server state.
+
+        method {str} -- The name of the client method.
+
+        arguments {Dict} -- The keyword arguments for the method.
+
+        cache {Dict} -- A cache of server state shared during a single resume.
+
+        Returns:
+        ----
+        {bool} -- `True` if the mutation is already on the server.
+        """
+
+        snippet = arguments.get('data', {}).get('snippet', {})
+
+        if method == 'insert_playlist_items':
+
+            playlist_id = snippet.get('playlistId')
+            video_id = snippet.get('resourceId', {}).get('videoId')
+
+            # Grab the playlist once per resume.
+            if playlist_id not in cache:
+                pages = client.playlists_items(playlist_id=playlist_id, all_pages=True)
+                cache[playlist_id] = {
+                    item['snippet']['resourceId']['videoId']
+                    for page in pages
+                    for item in page.get('items', [])
+                }
+
+            return video_id in cache[playlist_id]
+
+        elif method == 'insert_playlist':
+
+            # Grab the channel playlists once per resume.
+            if 'channel_playlists' not in cache:
+                pages = client.grab_channel_playlists(parts=['snippet'])
+                cache['channel_playlists'] = {
+                    item['snippet']['title']
+                    for page in pages
+                    for item in page.get('items', [])
+                }
+
+            return snippet.get('title') in cache['channel_playlists']
+
+        return False
+
+    def _record_applied(self, method: str, arguments: Dict, cache: Dict) -> None:
+        """Adds an insert that just went through to the server state cached during a resume.
+
+        Arguments:
+        ----
+        method {str} -- The name of the client method.
+
+        arguments {Dict} -- The keyword arguments for the method.
+
+        cache {Dict} -- The cache filled by `_already_applied`.
+        """
+
+        snippet = arguments.get('data', {}).get('snippet', {})
+
+        if method == 'insert_playlist_items':
+            cache.setdefault(snippet.get('playlistId'), set()).add(
+                snippet.get('resourceId', {}).get('videoId')
+            )
+
+        elif method == 'insert_playlist':
+            cache.setdefault('channel_playlists', set()).add(snippet.get('title'))
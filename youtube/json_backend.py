@@ -0,0 +1,108 @@
+import json
+
+from typing import Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# The backends we know how to use.
+BACKENDS = ['orjson', 'json']
+
+# Use the fastest backend that's installed.
+_backend = 'orjson' if orjson else 'json'
+
+
+def use_backend(name: str) -> None:
+    """Picks the JSON backend used for every decode and encode.
+
+    Arguments:
+    ----
+    name {str} -- One of ['orjson', 'json'].
+
+    Raises:
+    ----
+    ImportError: The backend isn't installed.
+    """
+
+    global _backend
+
+    if name not in BACKENDS:
+        raise ValueError(
+            "JSON backend {name} isn't supported, must be one of {backends}.".format(
+                name=name,
+                backends=BACKENDS
+            )
+        )
+
+    if name == 'orjson' and orjson is None:
+        raise ImportError(
+            "The orjson backend needs the `orjson` package, install it with `pip install orjson`."
+        )
+
+    _backend = name
+
+
+def backend() -> str:
+    """Returns the name of the JSON backend in use."""
+
+    return _backend
+
+
+def loads(content: Union[bytes, str]) -> object:
+    """Decodes JSON.
+
+    Arguments:
+    ----
+    content {Union[bytes, str]} -- The JSON document.
+
+    Returns:
+    ----
+    {object} -- The decoded content.
+    """
+
+    if _backend == 'orjson':
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def dumps(content: object, pretty: bool = False, sort_keys: bool = False) -> bytes:
+    """Encodes content as UTF-8 JSON.
+
+    Arguments:
+    ----
+    content {object} -- The content to encode.
+
+    Keyword Arguments:
+    ----
+    pretty {bool} -- Indent with two spaces, otherwise the output is compact. (default: {False})
+
+    sort_keys {bool} -- Sort dictionary keys, so the same content always encodes
+        to the same bytes. (default: {False})
+
+    Returns:
+    ----
+    {bytes} -- The encoded content.
+    """
+
+    if _backend == 'orjson':
+
+        option = 0
+
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        return orjson.dumps(content, option=option)
+
+    # Keep non-ASCII characters as UTF-8 like orjson does, so both backends write the same bytes.
+    if pretty:
+        encoded = json.dumps(content, indent=2, sort_keys=sort_keys, ensure_ascii=False)
+    else:
+        encoded = json.dumps(content, separators=(',', ':'), sort_keys=sort_keys, ensure_ascii=False)
+
+    return encoded.encode('utf-8')
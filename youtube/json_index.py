@@ -0,0 +1,272 @@
+import os
+import re
+import mmap
+import pathlib
+import tempfile
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from youtube import json_backend
+from youtube.storage import GZIP_MAGIC
+from youtube.storage import ZSTD_MAGIC
+from youtube.storage import find_data_file
+
+
+# Bump when the layout of the index file changes, older indexes are rebuilt.
+INDEX_VERSION = 1
+
+# Strings, with their escapes, and the brackets outside of them.
+_TOKENS = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{}]', re.DOTALL)
+
+
+def index_path_for(file_path: Union[str, pathlib.Path]) -> pathlib.Path:
+    """The sidecar index of a data file, like `data/channel_playlists_items_all.json.index`."""
+
+    file_path = pathlib.Path(file_path)
+
+    return file_path.with_name(file_path.name + '.index')
+
+
+def page_spans(content: Union[bytes, mmap.mmap]) -> List[Tuple[int, int]]:
+    """Finds where each page of a list of pages starts and ends, without decoding it.
+
+    Arguments:
+    ----
+    content {Union[bytes, mmap.mmap]} -- A JSON list of objects, like `save_to_json_file` writes.
+
+    Raises:
+    ----
+    ValueError: The content isn't a JSON list of objects.
+
+    Returns:
+    ----
+    {List[Tuple[int, int]]} -- The `(offset, length)` of each page in bytes.
+    """
+
+    spans = []
+    depth = 0
+    start = None
+
+    for token in _TOKENS.finditer(content):
+
+        character = token.group()[:1]
+
+        if character == b'"':
+            continue
+
+        if character in b'[{':
+
+            if depth == 0 and character != b'[':
+                raise ValueError("The content isn't a JSON list.")
+
+            if depth == 1:
+                if character != b'{':
+                    raise ValueError("The list holds something other than objects.")
+                start = token.start()
+
+            depth += 1
+
+        else:
+
+            depth -= 1
+
+            if depth == 1:
+                spans.append((start, token.end() - start))
+            elif depth == 0:
+                return spans
+
+    raise ValueError("The content isn't a complete JSON list.")
+
+
+def _page_key(page: Dict) -> str:
+    """The playlist a page of playlist items belongs to, `None` for other pages."""
+
+    items = page.get('items') or [{}]
+
+    return items[0].get('snippet', {}).get('playlistId')
+
+
+def build_index(file_path: Union[str, pathlib.Path]) -> Dict:
+    """Builds the offset index of a data file and saves it next to the file.
+
+    Arguments:
+    ----
+    file_path {Union[str, pathlib.Path]} -- An uncompressed list of pages.
+
+    Raises:
+    ----
+    ValueError: The file is compressed, so it can't be memory mapped.
+
+    Returns:
+    ----
+    {Dict} -- The index, with the `size` and `mtime_ns` of the file it was built from,
+        the `(offset, length, playlist_id)` of every page and the pages of each playlist.
+    """
+
+    file_path = pathlib.Path(file_path).absolute()
+    stat = file_path.stat()
+
+    if not stat.st_size:
+        raise ValueError("{file_name} is empty.".format(file_name=file_path.name))
+
+    with open(file_path, 'rb') as data_file:
+
+        magic = data_file.read(4)
+
+        if magic.startswith(GZIP_MAGIC) or magic.startswith(ZSTD_MAGIC):
+            raise ValueError(
+                "{file_name} is compressed, the offset index needs an uncompressed file.".format(
+                    file_name=file_path.name
+                )
+            )
+
+        with mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+
+            pages = []
+            playlists: Dict[str, List[int]] = {}
+
+            for offset, length in page_spans(content=content):
+
+                playlist_id = _page_key(page=json_backend.loads(content[offset:offset + length]))
+
+                if playlist_id is not None:
+                    playlists.setdefault(playlist_id, []).append(len(pages))
+
+                pages.append([offset, length, playlist_id])
+
+    index = {
+        'version': INDEX_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'pages': pages,
+        'playlists': playlists
+    }
+
+    # Write it next to the file, then swap it in.
+    index_path = index_path_for(file_path=file_path)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=index_path.parent, suffix='.tmp')
+
+    with os.fdopen(file_descriptor, 'wb') as index_file:
+        index_file.write(json_backend.dumps(index))
+
+    os.replace(temp_path, index_path)
+
+    return index
+
+
+class IndexedJsonReader():
+
+    def __init__(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Initalizes a reader that decodes only the pages asked for.
+
+        The file is memory mapped, and a sidecar index of where each page sits
+        is built the first time the file is read and again whenever the file
+        changes. Grabbing one playlist's pages then decodes those pages and
+        nothing else.
+
+        Arguments:
+        ----
+        file_path {Union[str, pathlib.Path]} -- An uncompressed list of pages, like
+            `data/channel_playlists_items_all.json`.
+
+        Usage:
+        ----
+            >>> with IndexedJsonReader(file_path='data/channel_playlists_items_all.json') as reader:
+                    reader.playlist_pages(playlist_id='PLcFcktZ0wnNnozjOmQSw0zBN4SK0YXTBG')
+        """
+
+        self.file_path = find_data_file(file_path=file_path).absolute()
+        self.index_path = index_path_for(file_path=self.file_path)
+        self.index = self._load_index()
+
+        self._file = open(self.file_path, 'rb')
+        self._content = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _load_index(self) -> Dict:
+        """Loads the sidecar index, rebuilding it if it's missing or out of date."""
+
+        stat = self.file_path.stat()
+
+        if self.index_path.exists():
+
+            index = json_backend.loads(self.index_path.read_bytes())
+
+            if (index.get('version'), index.get('size'), index.get('mtime_ns')) == (INDEX_VERSION, stat.st_size, stat.st_mtime_ns):
+                return index
+
+        return build_index(file_path=self.file_path)
+
+    def __len__(self) -> int:
+        return len(self.index['pages'])
+
+    def playlist_ids(self) -> List[str]:
+        """Lists the playlists in the file, in the order they first show up."""
+
+        return list(self.index['playlists'])
+
+    def page(self, position: int) -> Dict:
+        """Decodes one page of the file.
+
+        Arguments:
+        ----
+        position {int} -- The page's position in the file, starting at 0.
+
+        Returns:
+        ----
+        {Dict} -- The page.
+        """
+
+        offset, length, _ = self.index['pages'][position]
+
+        return json_backend.loads(self._content[offset:offset + length])
+
+    def playlist_pages(self, playlist_id: str, page_number: int = None) -> List[Dict]:
+        """Decodes the pages of one playlist.
+
+        Arguments:
+        ----
+        playlist_id {str} -- The playlist ID.
+
+        Keyword Arguments:
+        ----
+        page_number {int} -- Only this page of the playlist, starting at 0, all of
+            them if not set. (default: {None})
+
+        Raises:
+        ----
+        KeyError: The playlist isn't in the file.
+
+        Returns:
+        ----
+        {List[Dict]} -- The pages, in order.
+        """
+
+        if playlist_id not in self.index['playlists']:
+            raise KeyError(
+                "Playlist {playlist_id} isn't in {file_name}.".format(
+                    playlist_id=playlist_id,
+                    file_name=self.file_path.name
+                )
+            )
+
+        positions = self.index['playlists'][playlist_id]
+
+        if page_number is not None:
+            positions = positions[page_number:page_number + 1]
+
+        return [self.page(position=position) for position in positions]
+
+    def close(self) -> None:
+        """Unmaps and closes the file."""
+
+        self._content.close()
+        self._file.close()
+
+    def __enter__(self) -> 'IndexedJsonReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,238 @@
+import pathlib
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Iterable
+
+from youtube.storage import read_json
+from youtube.storage import write_json
+
+
+class MembershipIndex():
+
+    def __init__(self) -> None:
+        """Initalizes an index of which videos are in which playlists.
+
+        The index is kept both ways, so "which playlists is this video in" and
+        "which videos are in this playlist, in order" are lookups instead of a
+        scan over every playlist item. It's fed with `playlists_items` pages as
+        they come in, and a playlist item seen again replaces what was there.
+
+        Usage:
+        ----
+            >>> membership_index = MembershipIndex()
+            >>> membership_index.sync_playlist(
+                playlist_id='PLcFcktZ0wnNnozjOmQSw0zBN4SK0YXTBG',
+                pages=youtube_session.playlists_items(playlist_id='PLcFcktZ0wnNnozjOmQSw0zBN4SK0YXTBG', all_pages=True)
+            )
+            >>> membership_index.playlists_for(video_id='wZjA6d2WDYk')
+        """
+
+        # Every playlist item, as `(playlist_id, video_id, position)`.
+        self._items: Dict[str, Tuple[str, str, int]] = {}
+
+        # The playlist items of each video and of each playlist, dicts keep the order they were added.
+        self._by_video: Dict[str, Dict[str, bool]] = {}
+        self._by_playlist: Dict[str, Dict[str, bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _unlink(self, item_id: str) -> None:
+        """Drops a playlist item from both sides of the index."""
+
+        playlist_id, video_id, _ = self._items.pop(item_id)
+
+        for side, key in [(self._by_video, video_id), (self._by_playlist, playlist_id)]:
+            side[key].pop(item_id, None)
+            if not side[key]:
+                del side[key]
+
+    def add_item(self, item_id: str, playlist_id: str, video_id: str, position: int) -> None:
+        """Adds a playlist item, or updates it if it's already in the index.
+
+        Arguments:
+        ----
+        item_id {str} -- The playlist item ID.
+
+        playlist_id {str} -- The playlist it's in.
+
+        video_id {str} -- The video it points to.
+
+        position {int} -- Its position in the playlist.
+        """
+
+        if item_id in self._items:
+            self._unlink(item_id=item_id)
+
+        self._items[item_id] = (playlist_id, video_id, position)
+        self._by_video.setdefault(video_id, {})[item_id] = True
+        self._by_playlist.setdefault(playlist_id, {})[item_id] = True
+
+    def add_pages(self, pages: Iterable[Dict]) -> List[str]:
+        """Adds the items in `playlists_items` pages.
+
+        Arguments:
+        ----
+        pages {Iterable[Dict]} -- The list responses, pages with an `error` are skipped.
+
+        Returns:
+        ----
+        {List[str]} -- The IDs of the playlist items that were added.
+        """
+
+        item_ids = []
+
+        for page in pages:
+            for item in page.get('items', []):
+
+                snippet = item['snippet']
+
+                self.add_item(
+                    item_id=item['id'],
+                    playlist_id=snippet['playlistId'],
+                    video_id=snippet['resourceId']['videoId'],
+                    position=snippet['position']
+                )
+                item_ids.append(item['id'])
+
+        return item_ids
+
+    def add_parsed(self, records: Iterable[Dict]) -> None:
+        """Adds the records from a `parse_playlist_items` result, like
+        `channel_playlists_items_all_parsed.json`.
+
+        Arguments:
+        ----
+        records {Iterable[Dict]} -- The simplified playlist items.
+        """
+
+        for record in records:
+            self.add_item(
+                item_id=record['playlist_item_id'],
+                playlist_id=record['playlist_item_playlist_id'],
+                video_id=record['playlist_item_video_id'],
+                position=record['playlist_item_position']
+            )
+
+    def sync_playlist(self, playlist_id: str, pages: Iterable[Dict]) -> Dict[str, int]:
+        """Replaces what's known about a playlist with a fresh copy of all its pages.
+
+        Items that are no longer in the playlist are dropped, unless a page came
+        back with an error, then nothing is dropped.
+
+        Arguments:
+        ----
+        playlist_id {str} -- The playlist ID.
+
+        pages {Iterable[Dict]} -- Every page of the playlist, from `playlists_items(all_pages=True)`.
+
+        Returns:
+        ----
+        {Dict[str, int]} -- How many items are in the playlist and how many were `removed`.
+        """
+
+        pages = list(pages)
+        seen = set(self.add_pages(pages=pages))
+
+        if any('error' in page for page in pages):
+            return {'items': len(self._by_playlist.get(playlist_id, {})), 'removed': 0}
+
+        stale = [item_id for item_id in self._by_playlist.get(playlist_id, {}) if item_id not in seen]
+
+        for item_id in stale:
+            self._unlink(item_id=item_id)
+
+        return {'items': len(self._by_playlist.get(playlist_id, {})), 'removed': len(stale)}
+
+    def remove_item(self, item_id: str) -> bool:
+        """Removes a playlist item, `True` if it was in the index."""
+
+        if item_id not in self._items:
+            return False
+
+        self._unlink(item_id=item_id)
+
+        return True
+
+    def playlists_for(self, video_id: str) -> List[Dict]:
+        """Lists the playlists a video is in.
+
+        Arguments:
+        ----
+        video_id {str} -- The video ID.
+
+        Returns:
+        ----
+        {List[Dict]} -- The `playlist_id`, `position` and `playlist_item_id` of each
+            membership, a video can be in the same playlist more than once.
+        """
+
+        return [
+            {
+                'playlist_id': self._items[item_id][0],
+                'position': self._items[item_id][2],
+                'playlist_item_id': item_id
+            }
+            for item_id in self._by_video.get(video_id, {})
+        ]
+
+    def videos_in(self, playlist_id: str) -> List[str]:
+        """Lists the videos in a playlist, in position order."""
+
+        item_ids = sorted(self._by_playlist.get(playlist_id, {}), key=lambda item_id: self._items[item_id][2])
+
+        return [self._items[item_id][1] for item_id in item_ids]
+
+    def video_ids(self) -> List[str]:
+        """Lists every video once, in the order they were first added."""
+
+        return list(self._by_video)
+
+    def playlist_ids(self) -> List[str]:
+        """Lists every playlist, in the order they were first added."""
+
+        return list(self._by_playlist)
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> pathlib.Path:
+        """Saves the index, only the playlist items are saved, the lookups are rebuilt on load.
+
+        Arguments:
+        ----
+        file_path {Union[str, pathlib.Path]} -- The JSON file.
+
+        Returns:
+        ----
+        {pathlib.Path} -- The path of the file.
+        """
+
+        return write_json(
+            file_path=file_path,
+            content=[
+                [item_id, playlist_id, video_id, position]
+                for item_id, (playlist_id, video_id, position) in self._items.items()
+            ],
+            compact=True
+        )
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path]) -> 'MembershipIndex':
+        """Loads an index saved with `save`.
+
+        Arguments:
+        ----
+        file_path {Union[str, pathlib.Path]} -- The JSON file.
+
+        Returns:
+        ----
+        {MembershipIndex} -- The index.
+        """
+
+        membership_index = cls()
+
+        for item_id, playlist_id, video_id, position in read_json(file_path=file_path):
+            membership_index.add_item(item_id=item_id, playlist_id=playlist_id, video_id=video_id, position=position)
+
+        return membership_index
@@ -0,0 +1,325 @@
+import string
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+
+from youtube.quota import quota_cost
+
+
+# The snippet fields a video update keeps, the API clears anything left out.
+WRITABLE_SNIPPET_FIELDS = ['title', 'description', 'tags', 'categoryId', 'defaultLanguage', 'defaultAudioLanguage']
+
+# The limits the API enforces on a snippet.
+MAX_TITLE_LENGTH = 100
+MAX_DESCRIPTION_BYTES = 5000
+MAX_TAGS_LENGTH = 500
+
+_FORMATTER = string.Formatter()
+
+
+def _comparable(field: str, value: object) -> object:
+    """Normalizes a snippet field, so a missing field and an empty one compare equal."""
+
+    if field == 'tags':
+        return list(value or [])
+
+    return value or ''
+
+
+class CompiledTemplate():
+
+    def __init__(self, source: str) -> None:
+        """Initalizes a `str.format` style template that's parsed only once.
+
+        Arguments:
+        ----
+        source {str} -- The template, like `{body}\\n\\nSupport Sigma Coding: {patreon}`.
+        """
+
+        self.source = source
+        self.parts: List[Tuple[str, str, str, str]] = list(_FORMATTER.parse(source))
+        self.fields = {
+            field_name.split('.')[0].split('[')[0]
+            for _, field_name, _, _ in self.parts if field_name
+        }
+
+    def render(self, context: Dict) -> str:
+        """Fills in the template.
+
+        Arguments:
+        ----
+        context {Dict} -- The values of the fields.
+
+        Returns:
+        ----
+        {str} -- The rendered text.
+        """
+
+        pieces = []
+
+        for literal, field_name, format_spec, conversion in self.parts:
+
+            pieces.append(literal)
+
+            if field_name is not None:
+                value, _ = _FORMATTER.get_field(field_name, (), context)
+                value = _FORMATTER.convert_field(value, conversion)
+                pieces.append(_FORMATTER.format_field(value, format_spec or ''))
+
+        return ''.join(pieces)
+
+
+class MetadataEngine():
+
+    def __init__(self, youtube_session: object, title: str = None, description: str = None, tags: List[str] = None,
+                 keep_tags: bool = True, description_marker: str = None, variables: Dict = None, max_workers: int = 4) -> None:
+        """Initalizes an engine that rewrites video metadata in bulk.
+
+        The current snippets are grabbed 50 videos per request, the new title,
+        description and tags are rendered from the templates, and only the
+        videos where something changed are updated, so a video that's already
+        right costs 1 quota unit instead of 51.
+
+        Templates use `str.format` fields. Every template can use `title`,
+        `description`, `body`, `tags`, `video_id` and `published_at` from the
+        current video, plus anything in `variables`.
+
+        Arguments:
+        ----
+        youtube_session {YouTubeClient} -- The client used to grab and update the videos.
+
+        Keyword Arguments:
+        ----
+        title {str} -- The title template, the title is left alone if not set. (default: {None})
+
+        description {str} -- The description template, left alone if not set. (default: {None})
+
+        tags {List[str]} -- Tag templates, the tags are left alone if not set. (default: {None})
+
+        keep_tags {bool} -- If `True` the rendered tags are added to the current ones,
+            otherwise they replace them. (default: {True})
+
+        description_marker {str} -- If set, `body` is the current description up to this
+            text, so an old footer can be swapped for a new one. (default: {None})
+
+        variables {Dict} -- Extra values for the templates. (default: {None})
+
+        max_workers {int} -- The number of updates running at the same time. (default: {4})
+
+        Usage:
+        ----
+            >>> metadata_engine = MetadataEngine(
+                youtube_session=youtube_session,
+                description='{body}\\n\\nResources:\\n{footer}',
+                description_marker='Resources:',
+                variables={'footer': youtube_session._load_desc()['footer']}
+            )
+            >>> metadata_engine.run(video_ids=['XEjaDFqImCk', 'Jd6q1AzNQvQ'])
+        """
+
+        self.youtube_session = youtube_session
+        self.title = CompiledTemplate(title) if title is not None else None
+        self.description = CompiledTemplate(description) if description is not None else None
+        self.tags = [CompiledTemplate(tag) for tag in tags] if tags is not None else None
+        self.keep_tags = keep_tags
+        self.description_marker = description_marker
+        self.variables = variables or {}
+        self.max_workers = max_workers
+
+    def _context(self, video: Dict) -> Dict:
+        """Builds the template values for a video."""
+
+        snippet = video.get('snippet', {})
+        description = snippet.get('description', '')
+
+        if self.description_marker and self.description_marker in description:
+            body = description[:description.index(self.description_marker)].rstrip()
+        else:
+            body = description.rstrip()
+
+        context = dict(self.variables)
+        context.update({
+            'title': snippet.get('title', ''),
+            'description': description,
+            'body': body,
+            'tags': snippet.get('tags', []),
+            'video_id': video.get('id'),
+            'published_at': snippet.get('publishedAt')
+        })
+
+        return context
+
+    def render(self, video: Dict) -> Dict:
+        """Renders the new snippet for a video.
+
+        Arguments:
+        ----
+        video {Dict} -- The Video resource with its current `snippet`.
+
+        Returns:
+        ----
+        {Dict} -- The new snippet, with only the writable fields.
+        """
+
+        snippet = video.get('snippet', {})
+        context = self._context(video=video)
+
+        new_snippet = {
+            field: snippet[field]
+            for field in WRITABLE_SNIPPET_FIELDS if field in snippet
+        }
+
+        if self.title:
+            new_snippet['title'] = self.title.render(context=context)
+
+        if self.description:
+            new_snippet['description'] = self.description.render(context=context)
+
+        if self.tags is not None:
+
+            rendered = [tag.render(context=context) for tag in self.tags]
+            combined = (snippet.get('tags', []) if self.keep_tags else []) + rendered
+
+            # Drop duplicates but keep the order.
+            new_snippet['tags'] = list(dict.fromkeys(tag for tag in combined if tag))
+
+        return new_snippet
+
+    def _problems(self, snippet: Dict) -> List[str]:
+        """Checks a snippet against the API's limits."""
+
+        problems = []
+
+        if not snippet.get('title') or len(snippet['title']) > MAX_TITLE_LENGTH:
+            problems.append('The title must be 1 to {} characters.'.format(MAX_TITLE_LENGTH))
+
+        if len(snippet.get('description', '').encode('utf-8')) > MAX_DESCRIPTION_BYTES:
+            problems.append('The description is over {} bytes.'.format(MAX_DESCRIPTION_BYTES))
+
+        if len(','.join(snippet.get('tags', []))) > MAX_TAGS_LENGTH:
+            problems.append('The tags are over {} characters.'.format(MAX_TAGS_LENGTH))
+
+        if '<' in snippet.get('title', '') + snippet.get('description', ''):
+            problems.append("The title and description can't have angle brackets.")
+
+        return problems
+
+    def plan(self, video_ids: List[str]) -> Dict[str, List[Dict]]:
+        """Works out which videos need an update, without changing anything.
+
+        Arguments:
+        ----
+        video_ids {List[str]} -- The videos to check.
+
+        Returns:
+        ----
+        {Dict[str, List[Dict]]} -- The `changes`, each with the `video_id`, the `fields` that
+            changed as `(old, new)` pairs and the new `snippet`. Also the `unchanged` video
+            IDs, the `invalid` ones with their `problems` and the `missing` ones.
+        """
+
+        pages = self.youtube_session.grab_videos(video_ids=video_ids, parts=['snippet'])
+        videos = {
+            video['id']: video
+            for page in pages for video in page.get('items', [])
+        }
+
+        result = {'changes': [], 'unchanged': [], 'invalid': [], 'missing': []}
+
+        for video_id in dict.fromkeys(video_ids):
+
+            if video_id not in videos:
+                result['missing'].append(video_id)
+                continue
+
+            current = videos[video_id].get('snippet', {})
+            new_snippet = self.render(video=videos[video_id])
+
+            fields = {
+                field: (current.get(field), new_snippet.get(field))
+                for field in ['title', 'description', 'tags']
+                if _comparable(field=field, value=current.get(field)) != _comparable(field=field, value=new_snippet.get(field))
+            }
+
+            if not fields:
+                result['unchanged'].append(video_id)
+                continue
+
+            problems = self._problems(snippet=new_snippet)
+
+            if problems:
+                result['invalid'].append({'video_id': video_id, 'problems': problems})
+                continue
+
+            result['changes'].append({'video_id': video_id, 'fields': fields, 'snippet': new_snippet})
+
+        return result
+
+    def apply(self, changes: List[Dict]) -> Dict[str, Dict]:
+        """Updates the videos that changed, a few at a time.
+
+        Arguments:
+        ----
+        changes {List[Dict]} -- The `changes` from `plan`.
+
+        Returns:
+        ----
+        {Dict[str, Dict]} -- The response of each update by video ID.
+        """
+
+        responses = {}
+
+        def update(change: Dict) -> Dict:
+            return self.youtube_session.update_video(
+                part=['snippet'],
+                data={'id': change['video_id'], 'snippet': change['snippet']}
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            futures = {
+                executor.submit(update, change): change['video_id']
+                for change in changes
+            }
+
+            for future in as_completed(futures):
+                try:
+                    responses[futures[future]] = future.result()
+                except (OSError, ValueError) as update_error:
+                    responses[futures[future]] = {'error': {'message': str(update_error)}}
+
+        return responses
+
+    def run(self, video_ids: List[str], dry_run: bool = False) -> Dict:
+        """Plans and applies an update.
+
+        Arguments:
+        ----
+        video_ids {List[str]} -- The videos to update.
+
+        Keyword Arguments:
+        ----
+        dry_run {bool} -- If `True` only the plan is made. (default: {False})
+
+        Returns:
+        ----
+        {Dict} -- The `plan`, the `responses`, the `updated` and `failed` video IDs
+            and the `quota_saved` by skipping the unchanged videos.
+        """
+
+        plan = self.plan(video_ids=video_ids)
+        responses = {} if dry_run else self.apply(changes=plan['changes'])
+
+        failed = [video_id for video_id, response in responses.items() if not response or 'error' in response]
+
+        return {
+            'plan': plan,
+            'responses': responses,
+            'updated': [video_id for video_id in responses if video_id not in failed],
+            'failed': failed,
+            'quota_saved': len(plan['unchanged']) * quota_cost(endpoint='videos', method='put')
+        }
@@ -0,0 +1,271 @@
+import os
+import bisect
+import pathlib
+import tempfile
+import threading
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Callable
+
+
+# The upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestMetrics():
+
+    def __init__(self, latency_buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initalizes the per-endpoint request metrics.
+
+        Metrics are kept per `(endpoint, method)` pair, and every request
+        also runs the registered pre and post request hooks.
+
+        Keyword Arguments:
+        ----
+        latency_buckets {Tuple[float, ...]} -- The upper bounds of the latency
+            histogram buckets, in seconds. (default: {LATENCY_BUCKETS})
+
+        Usage:
+        ----
+            >>> youtube_session.metrics.add_post_request_hook(
+                hook=lambda request, response: print(request['endpoint'], response['latency'])
+            )
+            >>> youtube_session.metrics.snapshot()
+        """
+
+        self.latency_buckets = tuple(sorted(latency_buckets))
+
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[str, str], Dict] = {}
+        self._pre_request_hooks: List[Callable] = []
+        self._post_request_hooks: List[Callable] = []
+
+    def _series(self, endpoint: str, method: str) -> Dict:
+        """Grabs the counters for an endpoint, creating them if needed.
+
+        Must be called while holding the lock.
+        """
+
+        key = (endpoint, method.lower())
+
+        if key not in self._endpoints:
+            self._endpoints[key] = {
+                'requests': 0,
+                'errors': 0,
+                'retries': 0,
+                'cache_hits': 0,
+                'quota_units': 0,
+                'response_bytes': 0,
+                'latency_sum': 0.0,
+                'latency_buckets': [0] * (len(self.latency_buckets) + 1)
+            }
+
+        return self._endpoints[key]
+
+    def add_pre_request_hook(self, hook: Callable[[Dict], None]) -> None:
+        """Registers a function called before every request.
+
+        Arguments:
+        ----
+        hook {Callable[[Dict], None]} -- Called with a dictionary holding the
+            `endpoint`, `method`, `url` and `params` of the request.
+        """
+
+        self._pre_request_hooks.append(hook)
+
+    def add_post_request_hook(self, hook: Callable[[Dict, Dict], None]) -> None:
+        """Registers a function called after every request.
+
+        Arguments:
+        ----
+        hook {Callable[[Dict, Dict], None]} -- Called with the request dictionary
+            and a response dictionary holding the `status_code`, `latency`,
+            `response_bytes` and `quota_units` of the request.
+        """
+
+        self._post_request_hooks.append(hook)
+
+    def before_request(self, request: Dict) -> None:
+        """Runs the pre request hooks.
+
+        Arguments:
+        ----
+        request {Dict} -- The request dictionary.
+        """
+
+        for hook in self._pre_request_hooks:
+            hook(request)
+
+    def after_request(self, request: Dict, response: Dict) -> None:
+        """Records a finished request and runs the post request hooks.
+
+        Arguments:
+        ----
+        request {Dict} -- The request dictionary, with the `endpoint` and `method`.
+
+        response {Dict} -- The response dictionary, with the `status_code`,
+            `latency`, `response_bytes` and `quota_units`.
+        """
+
+        latency = response.get('latency', 0.0)
+
+        with self._lock:
+
+            series = self._series(endpoint=request['endpoint'], method=request['method'])
+            series['requests'] += 1
+            series['quota_units'] += response.get('quota_units', 0)
+            series['response_bytes'] += response.get('response_bytes', 0)
+            series['latency_sum'] += latency
+            series['latency_buckets'][bisect.bisect_left(self.latency_buckets, latency)] += 1
+
+            if response.get('status_code', 200) >= 400:
+                series['errors'] += 1
+
+        for hook in self._post_request_hooks:
+            hook(request, response)
+
+    def record_retry(self, endpoint: str, method: str) -> None:
+        """Counts a retried request.
+
+        Arguments:
+        ----
+        endpoint {str} -- The endpoint of the request.
+
+        method {str} -- The request method.
+        """
+
+        with self._lock:
+            self._series(endpoint=endpoint, method=method)['retries'] += 1
+
+    def record_cache_hit(self, endpoint: str, method: str) -> None:
+        """Counts a request that was answered without going to the API.
+
+        Arguments:
+        ----
+        endpoint {str} -- The endpoint of the request.
+
+        method {str} -- The request method.
+        """
+
+        with self._lock:
+            self._series(endpoint=endpoint, method=method)['cache_hits'] += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Returns a copy of the metrics collected so far.
+
+        Returns:
+        ----
+        {Dict[str, Dict]} -- The metrics keyed by `"<METHOD> <endpoint>"`, with the
+            latency histogram keyed by bucket bound and the mean latency.
+        """
+
+        bounds = [str(bound) for bound in self.latency_buckets] + ['+Inf']
+        snapshot = {}
+
+        with self._lock:
+
+            for (endpoint, method), series in sorted(self._endpoints.items()):
+
+                entry = dict(series)
+                entry['latency_buckets'] = dict(zip(bounds, series['latency_buckets']))
+                entry['latency_mean'] = series['latency_sum'] / series['requests'] if series['requests'] else 0.0
+
+                snapshot['{method} {endpoint}'.format(method=method.upper(), endpoint=endpoint)] = entry
+
+        return snapshot
+
+    def reset(self) -> None:
+        """Clears every counter, the hooks stay registered."""
+
+        with self._lock:
+            self._endpoints = {}
+
+    def to_prometheus(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+        ----
+        {str} -- The metrics text.
+        """
+
+        counters = [
+            ('requests', 'Requests sent to the YouTube API.'),
+            ('errors', 'Requests that came back with an error status.'),
+            ('retries', 'Requests that were retried.'),
+            ('cache_hits', 'Requests answered without calling the API.'),
+            ('quota_units', 'Quota units spent.'),
+            ('response_bytes', 'Response body bytes received.')
+        ]
+
+        lines = []
+
+        with self._lock:
+            endpoints = sorted(
+                (key, dict(series, latency_buckets=list(series['latency_buckets'])))
+                for key, series in self._endpoints.items()
+            )
+
+        for name, description in counters:
+
+            lines.append('# HELP youtube_{name}_total {description}'.format(name=name, description=description))
+            lines.append('# TYPE youtube_{name}_total counter'.format(name=name))
+
+            for (endpoint, method), series in endpoints:
+                lines.append('youtube_{name}_total{{endpoint="{endpoint}",method="{method}"}} {value}'.format(
+                    name=name,
+                    endpoint=endpoint,
+                    method=method,
+                    value=series[name]
+                ))
+
+        lines.append('# HELP youtube_request_latency_seconds Request latency.')
+        lines.append('# TYPE youtube_request_latency_seconds histogram')
+
+        for (endpoint, method), series in endpoints:
+
+            labels = 'endpoint="{endpoint}",method="{method}"'.format(endpoint=endpoint, method=method)
+            cumulative = 0
+
+            # Prometheus buckets are cumulative.
+            for bound, count in zip(list(self.latency_buckets) + ['+Inf'], series['latency_buckets']):
+                cumulative += count
+                lines.append('youtube_request_latency_seconds_bucket{{{labels},le="{bound}"}} {count}'.format(
+                    labels=labels,
+                    bound=bound,
+                    count=cumulative
+                ))
+
+            lines.append('youtube_request_latency_seconds_sum{{{labels}}} {value}'.format(labels=labels, value=series['latency_sum']))
+            lines.append('youtube_request_latency_seconds_count{{{labels}}} {value}'.format(labels=labels, value=series['requests']))
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, file_path: str) -> pathlib.Path:
+        """Writes the metrics to a Prometheus text file, for the node exporter's
+        textfile collector.
+
+        The file is written to a temporary file first and then moved into
+        place, so a scrape never sees half a file.
+
+        Arguments:
+        ----
+        file_path {str} -- The path of the `.prom` file.
+
+        Returns:
+        ----
+        {pathlib.Path} -- The path of the file.
+        """
+
+        file_path = pathlib.Path(file_path).absolute()
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=file_path.parent, suffix='.tmp')
+
+        with os.fdopen(file_descriptor, 'w') as temp_file:
+            temp_file.write(self.to_prometheus())
+
+        os.replace(temp_path, file_path)
+
+        return file_path
@@ -0,0 +1,473 @@
+import json
+import time
+import random
+import socket
+import pathlib
+import threading
+import urllib.parse
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from youtube.quota import quota_cost
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+
+    # The default backlog of 5 drops connections when a pool of worker threads
+    # connects at once, the listen call reads this so it has to be set on the class.
+    request_queue_size = 128
+
+
+class MockYouTubeServer():
+
+    def __init__(self, data_folder: str = None, page_size: int = 50, latency: Union[float, Tuple[float, float]] = 0.0,
+                 error_rate: float = 0.0, quota_limit: int = None, seed: int = 0, host: str = '127.0.0.1', port: int = 0) -> None:
+        """Initalizes an offline stand-in for the YouTube Data API.
+
+        The server is seeded from the JSON exports in the `data` folder and
+        answers the endpoints the `YouTubeClient` uses: `playlists`,
+        `playlistItems`, `videos`, `channels`, `commentThreads` and
+        `thumbnails/set`. Point a client at it by setting `api_url` to `url`.
+
+        Keyword Arguments:
+        ----
+        data_folder {str} -- The folder with the JSON exports to seed from. (default: {'data'})
+
+        page_size {int} -- The most items returned in one page, the request's
+            `maxResults` can only lower it. (default: {50})
+
+        latency {Union[float, Tuple[float, float]]} -- Seconds to wait before
+            answering, or a `(low, high)` range to pick from. (default: {0.0})
+
+        error_rate {float} -- The share of requests answered with a `500 backendError`. (default: {0.0})
+
+        quota_limit {int} -- The quota units available before every request gets a
+            `403 quotaExceeded`, no limit if `None`. (default: {None})
+
+        seed {int} -- Seeds the random number generator so runs are repeatable. (default: {0})
+
+        Usage:
+        ----
+            >>> with MockYouTubeServer(page_size=20, latency=(0.01, 0.05)) as mock_server:
+                    youtube_session.api_url = mock_server.url
+                    youtube_session.playlists_items(playlist_id='<PLAYLIST_ID>', all_pages=True)
+        """
+
+        if data_folder is None:
+            data_folder = pathlib.Path(__file__).parents[1].joinpath('data')
+
+        self.data_folder = pathlib.Path(data_folder)
+        self.page_size = page_size
+        self.latency = latency
+        self.error_rate = error_rate
+        self.quota_limit = quota_limit
+
+        self.quota_used = 0
+        self.request_log: List[Tuple[str, str]] = []
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counter = 0
+
+        self._seed()
+
+        self._server = _MockHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """The base URL to use as the client's `api_url`."""
+
+        host, port = self._server.server_address[:2]
+
+        return 'http://{host}:{port}'.format(host=host, port=port)
+
+    def start(self) -> 'MockYouTubeServer':
+        """Starts serving on a background thread."""
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Stops the server and frees the port."""
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'MockYouTubeServer':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _load(self, file_name: str) -> List[Dict]:
+        """Loads a list of response pages from the data folder, or nothing if it's missing."""
+
+        file_path = self.data_folder.joinpath(file_name)
+
+        if not file_path.exists():
+            return []
+
+        with open(file_path, 'r', encoding='utf-8') as data_file:
+            return json.load(fp=data_file)
+
+    def _seed(self) -> None:
+        """Builds the in-memory channel from the data exports."""
+
+        # Playlists, in the order they were exported.
+        self.playlists: Dict[str, Dict] = {}
+
+        for page in self._load(file_name='channel_playlists.json'):
+            for playlist in page.get('items', []):
+                self.playlists[playlist['id']] = playlist
+
+        # Playlist items grouped by playlist, kept in position order.
+        self.playlist_items: Dict[str, List[Dict]] = {}
+
+        for page in self._load(file_name='channel_playlists_items_all.json'):
+            for item in page.get('items', []):
+                self.playlist_items.setdefault(item['snippet']['playlistId'], []).append(item)
+
+        for items in self.playlist_items.values():
+            items.sort(key=lambda item: item['snippet']['position'])
+
+        # Videos are rebuilt from the playlist item snippets, with made up statistics.
+        self.videos: Dict[str, Dict] = {}
+
+        for items in self.playlist_items.values():
+            for item in items:
+
+                video_id = item['snippet']['resourceId']['videoId']
+
+                if video_id in self.videos:
+                    continue
+
+                snippet = {
+                    key: value for key, value in item['snippet'].items()
+                    if key not in ['playlistId', 'position', 'resourceId']
+                }
+
+                self.videos[video_id] = {
+                    'kind': 'youtube#video',
+                    'etag': 'mock-{video_id}'.format(video_id=video_id),
+                    'id': video_id,
+                    'snippet': snippet,
+                    'contentDetails': {'duration': 'PT10M', 'definition': 'hd'},
+                    'status': item.get('status', {'privacyStatus': 'public'}),
+                    'statistics': {
+                        'viewCount': str(self._random.randint(100, 100000)),
+                        'likeCount': str(self._random.randint(0, 1000)),
+                        'commentCount': str(self._random.randint(0, 100))
+                    }
+                }
+
+        # The channel itself.
+        channel_ids = [playlist['snippet']['channelId'] for playlist in self.playlists.values()]
+        self.channel_id = channel_ids[0] if channel_ids else 'UCmockchannel'
+        self.channel = {
+            'kind': 'youtube#channel',
+            'etag': 'mock-channel',
+            'id': self.channel_id,
+            'snippet': {'title': 'Mock Channel'},
+            'contentDetails': {'relatedPlaylists': {'uploads': 'UU' + self.channel_id[2:]}},
+            'statistics': {'subscriberCount': '25400', 'videoCount': str(len(self.videos))}
+        }
+
+        # A few comment threads per video, made up on request.
+        self.comment_threads: Dict[str, List[Dict]] = {}
+        self.thumbnails: Dict[str, int] = {}
+
+    def _next_id(self, prefix: str) -> str:
+        """Hands out a new resource ID."""
+
+        self._counter += 1
+
+        return '{prefix}{counter:08d}'.format(prefix=prefix, counter=self._counter)
+
+    def _page(self, kind: str, items: List[Dict], query: Dict) -> Dict:
+        """Slices a list of resources into a list response with page tokens."""
+
+        max_results = min(int(query.get('maxResults', 5)), self.page_size)
+        offset = int(query.get('pageToken', 0) or 0)
+        page_items = items[offset:offset + max_results]
+
+        page = {
+            'kind': 'youtube#{kind}ListResponse'.format(kind=kind),
+            'etag': 'mock-page-{offset}'.format(offset=offset),
+            'pageInfo': {'totalResults': len(items), 'resultsPerPage': max_results},
+            'items': page_items
+        }
+
+        if offset + max_results < len(items):
+            page['nextPageToken'] = str(offset + max_results)
+
+        if offset > 0:
+            page['prevPageToken'] = str(max(0, offset - max_results))
+
+        return page
+
+    def _error(self, code: int, reason: str, message: str) -> Tuple[int, Dict]:
+        """Builds an error response in the API's format."""
+
+        return code, {
+            'error': {
+                'code': code,
+                'message': message,
+                'errors': [{'domain': 'youtube', 'reason': reason, 'message': message}]
+            }
+        }
+
+    def _comments(self, video_id: str) -> List[Dict]:
+        """Makes up the comment threads for a video the first time they're asked for."""
+
+        if video_id not in self.comment_threads:
+            self.comment_threads[video_id] = [
+                {
+                    'kind': 'youtube#commentThread',
+                    'etag': 'mock-comment-{video_id}-{index}'.format(video_id=video_id, index=index),
+                    'id': 'Ug{video_id}{index}'.format(video_id=video_id, index=index),
+                    'snippet': {
+                        'videoId': video_id,
+                        'totalReplyCount': 0,
+                        'topLevelComment': {
+                            'id': 'Ug{video_id}{index}'.format(video_id=video_id, index=index),
+                            'snippet': {
+                                'videoId': video_id,
+                                'textDisplay': 'Mock comment {index} on {video_id}'.format(index=index, video_id=video_id),
+                                'authorDisplayName': 'Viewer {index}'.format(index=index)
+                            }
+                        }
+                    }
+                }
+                for index in range(self._random.randint(0, 12))
+            ]
+
+        return self.comment_threads[video_id]
+
+    def handle(self, method: str, path: str, query: Dict, body: bytes) -> Tuple[int, Dict]:
+        """Answers a single API request.
+
+        Arguments:
+        ----
+        method {str} -- The request method.
+
+        path {str} -- The request path.
+
+        query {Dict} -- The query string values.
+
+        body {bytes} -- The request body.
+
+        Returns:
+        ----
+        {Tuple[int, Dict]} -- The status code and the JSON body.
+        """
+
+        endpoint = path.split('/v3/', 1)[-1].strip('/')
+
+        # Simulate the network.
+        if isinstance(self.latency, (tuple, list)):
+            time.sleep(self._random.uniform(*self.latency))
+        elif self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+
+            self.request_log.append((method, endpoint))
+
+            # Charge quota, and refuse once it's gone.
+            if self.quota_limit is not None and self.quota_used >= self.quota_limit:
+                return self._error(403, 'quotaExceeded', 'The request cannot be completed because you have exceeded your quota.')
+
+            self.quota_used += quota_cost(endpoint=endpoint, method=method)
+
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self._error(500, 'backendError', 'Backend Error')
+
+            payload = json.loads(body) if body else {}
+
+            return self._route(method=method, endpoint=endpoint, query=query, payload=payload)
+
+    def _route(self, method: str, endpoint: str, query: Dict, payload: Dict) -> Tuple[int, Dict]:
+        """Dispatches a request to the resource it's for. Must be called while holding the lock."""
+
+        if (method, endpoint) == ('GET', 'playlists'):
+
+            if 'id' in query:
+                ids = query['id'].split(',')
+                items = [self.playlists[playlist_id] for playlist_id in ids if playlist_id in self.playlists]
+            else:
+                items = list(self.playlists.values())
+
+            return 200, self._page(kind='playlist', items=items, query=query)
+
+        elif (method, endpoint) == ('GET', 'playlistItems'):
+
+            items = self.playlist_items.get(query.get('playlistId'), [])
+
+            if query.get('playlistId') not in self.playlists and not items:
+                return self._error(404, 'playlistNotFound', 'The playlist identified with the request cannot be found.')
+
+            return 200, self._page(kind='playlistItem', items=items, query=query)
+
+        elif (method, endpoint) == ('GET', 'videos'):
+
+            ids = query.get('id', '').split(',')
+            items = [self.videos[video_id] for video_id in ids if video_id in self.videos]
+
+            return 200, self._page(kind='video', items=items, query=query)
+
+        elif (method, endpoint) == ('GET', 'channels'):
+            return 200, self._page(kind='channel', items=[self.channel], query=query)
+
+        elif (method, endpoint) == ('GET', 'commentThreads'):
+            return 200, self._page(kind='commentThread', items=self._comments(video_id=query.get('videoId')), query=query)
+
+        elif (method, endpoint) == ('POST', 'playlistItems'):
+
+            snippet = payload.get('snippet', {})
+            items = self.playlist_items.setdefault(snippet.get('playlistId'), [])
+            video = self.videos.get(snippet.get('resourceId', {}).get('videoId'), {})
+
+            item = {
+                'kind': 'youtube#playlistItem',
+                'etag': self._next_id(prefix='etag'),
+                'id': self._next_id(prefix='PLI'),
+                'snippet': dict(
+                    video.get('snippet', {}),
+                    playlistId=snippet.get('playlistId'),
+                    resourceId=snippet.get('resourceId'),
+                    position=snippet.get('position', len(items))
+                )
+            }
+            items.insert(min(item['snippet']['position'], len(items)), item)
+
+            # Keep the positions in order.
+            for position, playlist_item in enumerate(items):
+                playlist_item['snippet']['position'] = position
+
+            return 200, item
+
+        elif (method, endpoint) == ('PUT', 'playlistItems'):
+
+            for items in self.playlist_items.values():
+                for item in items:
+                    if item['id'] == payload.get('id'):
+                        item['snippet'].update(payload.get('snippet', {}))
+                        return 200, item
+
+            return self._error(404, 'playlistItemNotFound', 'Playlist item not found.')
+
+        elif (method, endpoint) == ('DELETE', 'playlistItems'):
+
+            for items in self.playlist_items.values():
+                for item in items:
+                    if item['id'] == query.get('id'):
+                        items.remove(item)
+                        return 204, None
+
+            return self._error(404, 'playlistItemNotFound', 'Playlist item not found.')
+
+        elif (method, endpoint) == ('POST', 'playlists'):
+
+            playlist = {
+                'kind': 'youtube#playlist',
+                'etag': self._next_id(prefix='etag'),
+                'id': self._next_id(prefix='PL'),
+                'snippet': dict(payload.get('snippet', {}), channelId=self.channel_id),
+                'status': payload.get('status', {'privacyStatus': 'private'}),
+                'contentDetails': {'itemCount': 0}
+            }
+            self.playlists[playlist['id']] = playlist
+
+            return 200, playlist
+
+        elif (method, endpoint) in [('PUT', 'playlists'), ('PUT', 'videos')]:
+
+            resources = self.playlists if endpoint == 'playlists' else self.videos
+
+            if payload.get('id') not in resources:
+                return self._error(404, endpoint[:-1] + 'NotFound', 'Resource not found.')
+
+            resource = resources[payload['id']]
+
+            for part in query.get('part', '').split(','):
+                if part in payload:
+                    resource[part] = payload[part]
+
+            resource['etag'] = self._next_id(prefix='etag')
+
+            return 200, resource
+
+        elif (method, endpoint) == ('POST', 'thumbnails/set'):
+
+            video_id = query.get('videoId')
+
+            if video_id not in self.videos:
+                return self._error(404, 'videoNotFound', 'The video that you are trying to update cannot be found.')
+
+            self.thumbnails[video_id] = self.thumbnails.get(video_id, 0) + 1
+
+            return 200, {
+                'kind': 'youtube#thumbnailSetResponse',
+                'etag': self._next_id(prefix='etag'),
+                'items': [{'default': {'url': 'https://i.ytimg.com/vi/{video_id}/default.jpg'.format(video_id=video_id)}}]
+            }
+
+        return self._error(404, 'notFound', 'Unknown endpoint {method} {endpoint}.'.format(method=method, endpoint=endpoint))
+
+    def _handler_class(self) -> type:
+        """Builds the request handler bound to this server."""
+
+        mock_server = self
+
+        class MockRequestHandler(BaseHTTPRequestHandler):
+
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self) -> None:
+
+                super().setup()
+
+                # The headers and body go out in separate writes, without this Nagle's
+                # algorithm holds the body back until the client's delayed ACK, ~40 ms.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def _answer(self) -> None:
+
+                parsed = urllib.parse.urlsplit(self.path)
+                query = dict(urllib.parse.parse_qsl(parsed.query))
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0) or 0))
+
+                status, content = mock_server.handle(
+                    method=self.command,
+                    path=parsed.path,
+                    query=query,
+                    body=body if 'json' in self.headers.get('Content-Type', '') else b''
+                )
+
+                encoded = json.dumps(content).encode('utf-8') if content is not None else b''
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=UTF-8')
+                self.send_header('Content-Length', str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            do_GET = _answer
+            do_POST = _answer
+            do_PUT = _answer
+            do_DELETE = _answer
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return MockRequestHandler
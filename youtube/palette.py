@@ -0,0 +1,9 @@
+"""The colors used on the thumbnails, as `(Red, Green, Blue)` tuples."""
+
+# The accent colors.
+HIGH_CONTRAST_GREEN = (7, 255, 1)
+HIGH_CONTRAST_PINK = (248, 5, 254)
+
+# The background and text colors.
+BACKGROUND_BLACK = (25, 24, 24)
+FOREGROUND_WHITE = (255, 255, 255)
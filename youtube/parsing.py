@@ -0,0 +1,311 @@
+import os
+import mmap
+import pathlib
+import tempfile
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from typing import Iterator
+from typing import Iterable
+
+from concurrent.futures import ProcessPoolExecutor
+
+from youtube import json_backend
+from youtube.storage import read_json
+from youtube.storage import find_data_file
+from youtube.storage import GZIP_MAGIC
+from youtube.storage import ZSTD_MAGIC
+from youtube.json_index import page_spans
+
+
+# Uncompressed files bigger than this are split into page ranges parsed by different workers.
+SPLIT_BYTES = 1024 * 1024
+
+
+def parse_playlist(playlist: Dict) -> Dict:
+    """Simplifies a Playlist resource, see `YouTubeClient.parse_playlist_ids`."""
+
+    return {
+        'playlist_id': playlist['id'],
+        'playlist_title': playlist['snippet']['title'],
+        'playlist_item_count': playlist['contentDetails']['itemCount']
+    }
+
+
+def parse_playlist_item(playlist_item: Dict) -> Dict:
+    """Simplifies a PlaylistItem resource, see `YouTubeClient.parse_playlist_items`."""
+
+    snippet = playlist_item['snippet']
+
+    return {
+        'playlist_item_id': playlist_item['id'],
+        'playlist_item_title': snippet['title'],
+        'playlist_item_position': snippet['position'],
+        'playlist_item_publish_time': snippet['publishedAt'],
+        'playlist_item_video_id': snippet['resourceId']['videoId'],
+        'playlist_item_playlist_id': snippet['playlistId']
+    }
+
+
+# The parser used for each kind of export.
+PARSERS = {
+    'playlists': parse_playlist,
+    'playlist_items': parse_playlist_item
+}
+
+
+def _parser(kind: str):
+    """Looks up the parser of a kind of export."""
+
+    if kind not in PARSERS:
+        raise ValueError(
+            "Kind {kind} isn't supported, must be one of {kinds}.".format(
+                kind=kind,
+                kinds=list(PARSERS)
+            )
+        )
+
+    return PARSERS[kind]
+
+
+def parse_pages(pages: Iterable[Dict], kind: str) -> List[Dict]:
+    """Simplifies every resource in a list of response pages.
+
+    Arguments:
+    ----
+    pages {Iterable[Dict]} -- The list responses, like `save_to_json_file` writes.
+
+    kind {str} -- One of ['playlists', 'playlist_items'].
+
+    Returns:
+    ----
+    {List[Dict]} -- The simplified resources, in page order.
+    """
+
+    parser = _parser(kind=kind)
+
+    return [parser(resource) for page in pages for resource in page['items']]
+
+
+def _parse_task(task: Tuple[str, str, int, int]) -> List[Dict]:
+    """Parses one byte range of one file, runs in a worker process.
+
+    The range runs from the first byte of its first page to the last byte of
+    its last page, so wrapped in brackets it's a JSON list of just those pages
+    and the worker never decodes the rest of the file. A task without a range
+    decodes the whole file.
+    """
+
+    file_path, kind, start, end = task
+
+    if start is None:
+        return parse_pages(pages=read_json(file_path=file_path), kind=kind)
+
+    with open(file_path, 'rb') as data_file:
+        data_file.seek(start)
+        content = data_file.read(end - start)
+
+    return parse_pages(pages=json_backend.loads(b'[' + content + b']'), kind=kind)
+
+
+def _split_file(file_path: str, split_bytes: int) -> List[Tuple[int, int]]:
+    """Groups the pages of an uncompressed file into byte ranges of about `split_bytes`.
+
+    Returns:
+    ----
+    {List[Tuple[int, int]]} -- The `(start, end)` of each range, or `[(None, None)]` when
+        the file is small, compressed or not a list of pages, so it's parsed in one go.
+    """
+
+    if os.path.getsize(file_path) <= split_bytes:
+        return [(None, None)]
+
+    with open(file_path, 'rb') as data_file:
+
+        magic = data_file.read(4)
+
+        # A compressed file can't be read from the middle.
+        if magic.startswith(GZIP_MAGIC) or magic.startswith(ZSTD_MAGIC):
+            return [(None, None)]
+
+        with mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            try:
+                spans = page_spans(content=content)
+            except ValueError:
+                return [(None, None)]
+
+    ranges = []
+
+    for offset, length in spans:
+
+        if ranges and offset + length - ranges[-1][0] <= split_bytes:
+            ranges[-1] = (ranges[-1][0], offset + length)
+        else:
+            ranges.append((offset, offset + length))
+
+    return ranges or [(None, None)]
+
+
+def plan_tasks(file_paths: Iterable[Union[str, pathlib.Path]], kind: str, split_bytes: int = SPLIT_BYTES) -> List[Tuple[str, str, int, int]]:
+    """Splits exports into the work handed to the workers.
+
+    An uncompressed file bigger than `split_bytes` is split on its page
+    boundaries, found with a scan that doesn't decode the pages. Compressed
+    files are parsed by one worker each.
+
+    Arguments:
+    ----
+    file_paths {Iterable[Union[str, pathlib.Path]]} -- The exports, compressed or not.
+
+    kind {str} -- One of ['playlists', 'playlist_items'].
+
+    Keyword Arguments:
+    ----
+    split_bytes {int} -- About how many bytes of pages go into each range. (default: {SPLIT_BYTES})
+
+    Returns:
+    ----
+    {List[Tuple[str, str, int, int]]} -- The `(file_path, kind, start, end)` tasks, in output
+        order, `start` and `end` are `None` for a task that parses the whole file.
+    """
+
+    _parser(kind=kind)
+
+    tasks = []
+
+    for file_path in file_paths:
+
+        file_path = find_data_file(file_path=file_path).absolute().as_posix()
+
+        tasks.extend(
+            (file_path, kind, start, end)
+            for start, end in _split_file(file_path=file_path, split_bytes=split_bytes)
+        )
+
+    return tasks
+
+
+def parse_in_parallel(file_paths: Iterable[Union[str, pathlib.Path]], kind: str = 'playlist_items',
+                      max_workers: int = None, split_bytes: int = SPLIT_BYTES) -> Iterator[List[Dict]]:
+    """Parses exports across a process pool.
+
+    Arguments:
+    ----
+    file_paths {Iterable[Union[str, pathlib.Path]]} -- The exports, compressed or not.
+
+    Keyword Arguments:
+    ----
+    kind {str} -- One of ['playlists', 'playlist_items']. (default: {'playlist_items'})
+
+    max_workers {int} -- The number of worker processes, one per core if not set. (default: {None})
+
+    split_bytes {int} -- About how many bytes of pages go into each range. (default: {SPLIT_BYTES})
+
+    Yields:
+    ----
+    {List[Dict]} -- The simplified resources of each range, in file then page order
+        no matter which worker finishes first, so the output is the same every run.
+    """
+
+    tasks = plan_tasks(file_paths=file_paths, kind=kind, split_bytes=split_bytes)
+
+    if not tasks:
+        return
+
+    # A single range isn't worth starting a pool for.
+    if len(tasks) == 1:
+        yield _parse_task(task=tasks[0])
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(_parse_task, tasks)
+
+
+def parse_files(file_paths: Iterable[Union[str, pathlib.Path]], kind: str = 'playlist_items',
+                max_workers: int = None, split_bytes: int = SPLIT_BYTES) -> List[Dict]:
+    """Parses exports across a process pool into one list, see `parse_in_parallel`.
+
+    Usage:
+    ----
+        >>> parse_files(
+                file_paths=['data/channel_playlists_items.json', 'data/channel_playlists_items_all.json'],
+                kind='playlist_items'
+            )
+    """
+
+    return [
+        record
+        for records in parse_in_parallel(file_paths=file_paths, kind=kind, max_workers=max_workers, split_bytes=split_bytes)
+        for record in records
+    ]
+
+
+def _indent(encoded: bytes) -> bytes:
+    """Indents an encoded record one level, so it sits inside a pretty printed list."""
+
+    return b'\n'.join(b'  ' + line for line in encoded.splitlines())
+
+
+def parse_to_file(file_paths: Iterable[Union[str, pathlib.Path]], output_path: Union[str, pathlib.Path],
+                  kind: str = 'playlist_items', max_workers: int = None, split_bytes: int = SPLIT_BYTES) -> pathlib.Path:
+    """Parses exports across a process pool and streams the result into a file.
+
+    Each range is written as soon as it's its turn, so the whole result is
+    never held in memory. The output matches what `save_to_json_file` writes
+    for the same records, and it's moved into place only once it's complete.
+
+    Arguments:
+    ----
+    file_paths {Iterable[Union[str, pathlib.Path]]} -- The exports, compressed or not.
+
+    output_path {Union[str, pathlib.Path]} -- The parsed file, like `data/channel_playlists_items_all_parsed.json`.
+
+    Keyword Arguments:
+    ----
+    kind {str} -- One of ['playlists', 'playlist_items']. (default: {'playlist_items'})
+
+    max_workers {int} -- The number of worker processes, one per core if not set. (default: {None})
+
+    split_bytes {int} -- About how many bytes of pages go into each range. (default: {SPLIT_BYTES})
+
+    Returns:
+    ----
+    {pathlib.Path} -- The path of the parsed file.
+
+    Usage:
+    ----
+        >>> parse_to_file(
+                file_paths=['data/channel_playlists_items_all.json'],
+                output_path='data/channel_playlists_items_all_parsed.json'
+            )
+    """
+
+    output_path = pathlib.Path(output_path).absolute()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    file_descriptor, temp_path = tempfile.mkstemp(dir=output_path.parent, suffix='.tmp')
+
+    try:
+
+        with os.fdopen(file_descriptor, 'wb') as output_file:
+
+            separator = b'[\n'
+
+            for records in parse_in_parallel(file_paths=file_paths, kind=kind, max_workers=max_workers, split_bytes=split_bytes):
+                for record in records:
+                    output_file.write(separator)
+                    output_file.write(_indent(encoded=json_backend.dumps(record, pretty=True)))
+                    separator = b',\n'
+
+            # An empty list is written the way the encoders write it.
+            output_file.write(b'[]' if separator == b'[\n' else b'\n]')
+
+        os.replace(temp_path, output_path)
+
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    return output_path
@@ -0,0 +1,348 @@
+import time
+import threading
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from configparser import ConfigParser
+
+from typing import Dict
+from typing import List
+
+from youtube.quota import DAILY_QUOTA
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+except Exception:
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+
+# Reads that return the same thing no matter whose credentials are used.
+SHARED_READ_METHODS = [
+    'playlists_items',
+    'grab_playlist',
+    'grab_videos',
+    'grab_comments'
+]
+
+# Reads that use `mine=True` and writes, both only work with the owner's credentials.
+PINNED_METHODS = [
+    'grab_my_channel',
+    'grab_playlists',
+    'grab_channel_playlists',
+    'clear_playlist_items',
+    'insert_playlist',
+    'insert_playlist_items',
+    'update_playlist',
+    'update_playlist_items',
+    'update_video',
+    'delete_playlist_items',
+    'upload_thumbnail',
+    'upload_thumbnails',
+    'upload_video'
+]
+
+
+class ClientPool():
+
+    def __init__(self, clients: List[object], daily_quota: int = DAILY_QUOTA, failure_threshold: int = 3, cooldown: float = 60.0) -> None:
+        """Initalizes a pool of `YouTubeClient` objects, one per credential set.
+
+        Shared reads are routed to the healthy client whose project has the most
+        quota left, while `mine` reads and writes are pinned to the client that
+        owns the channel.
+
+        Arguments:
+        ----
+        clients {List[YouTubeClient]} -- The clients in the pool.
+
+        Keyword Arguments:
+        ----
+        daily_quota {int} -- The daily quota of each API project. (default: {10000})
+
+        failure_threshold {int} -- The number of failures in a row before a client
+            is taken out of rotation. (default: {3})
+
+        cooldown {float} -- The number of seconds an unhealthy client sits out. (default: {60.0})
+
+        Usage:
+        ----
+            >>> pool = ClientPool.from_configs(
+                config_paths=['configs/sigma.ini', 'configs/second_channel.ini']
+            )
+            >>> pool.call('grab_videos', video_ids=['XEjaDFqImCk'], parts=['snippet'])
+        """
+
+        if not clients:
+            raise ValueError("The pool needs at least one client.")
+
+        self.clients = clients
+        self.daily_quota = daily_quota
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._quota_day = self._current_quota_day()
+
+        # Quota is per project, and a project is identified by its API key.
+        self._project_usage: Dict[str, int] = {client.api_key: 0 for client in clients}
+        self._exhausted: Dict[str, bool] = {client.api_key: False for client in clients}
+
+        # Health is per client.
+        self._failures: Dict[int, int] = {id(client): 0 for client in clients}
+        self._benched_until: Dict[int, float] = {id(client): 0.0 for client in clients}
+
+    @classmethod
+    def from_configs(cls, config_paths: List[str], **kwargs) -> 'ClientPool':
+        """Builds a pool from a list of config files in the `configs/config.ini` format.
+
+        Arguments:
+        ----
+        config_paths {List[str]} -- The paths to the config files.
+
+        Returns:
+        ----
+        {ClientPool} -- A pool with one client per config file.
+        """
+
+        from youtube.client import YouTubeClient
+
+        clients = []
+
+        for config_path in config_paths:
+
+            # Grab configuration values.
+            config = ConfigParser()
+            config.read(config_path)
+
+            clients.append(
+                YouTubeClient(
+                    api_key=config.get('main', 'api_key'),
+                    channel_id=config.get('main', 'channel_id'),
+                    client_secret_path=config.get('main', 'client_secret_path'),
+                    state_path=config.get('main', 'state_path')
+                )
+            )
+
+        return cls(clients=clients, **kwargs)
+
+    def _current_quota_day(self) -> str:
+        """Quota resets at midnight Pacific time, so that's the day we count in."""
+
+        return datetime.now(tz=QUOTA_TIMEZONE).date().isoformat()
+
+    def _roll_quota_day(self) -> None:
+        """Resets the quota counters once the quota day changes."""
+
+        today = self._current_quota_day()
+
+        if today != self._quota_day:
+            self._quota_day = today
+            self._project_usage = {api_key: 0 for api_key in self._project_usage}
+            self._exhausted = {api_key: False for api_key in self._exhausted}
+
+    def remaining_quota(self, client: object) -> int:
+        """Returns the quota left today for the client's project.
+
+        Arguments:
+        ----
+        client {YouTubeClient} -- A client in the pool.
+
+        Returns:
+        ----
+        {int} -- The number of quota units left.
+        """
+
+        with self._lock:
+
+            self._roll_quota_day()
+
+            if self._exhausted[client.api_key]:
+                return 0
+
+            return max(0, self.daily_quota - self._project_usage[client.api_key])
+
+    def is_healthy(self, client: object) -> bool:
+        """Checks if the client is in rotation.
+
+        Arguments:
+        ----
+        client {YouTubeClient} -- A client in the pool.
+
+        Returns:
+        ----
+        {bool} -- `True` if the client can take requests.
+        """
+
+        return time.monotonic() >= self._benched_until[id(client)]
+
+    def read_client(self) -> object:
+        """Picks the client to use for a shared read.
+
+        Returns:
+        ----
+        {YouTubeClient} -- The healthy client with the most quota left, or the
+            client with the most quota left if none are healthy.
+        """
+
+        healthy = [client for client in self.clients if self.is_healthy(client)]
+
+        return max(healthy or self.clients, key=self.remaining_quota)
+
+    def write_client(self, channel_id: str) -> object:
+        """Picks the client that owns a channel.
+
+        Arguments:
+        ----
+        channel_id {str} -- The channel ID.
+
+        Raises:
+        ----
+        KeyError: No client in the pool owns the channel.
+
+        Returns:
+        ----
+        {YouTubeClient} -- The client for the channel.
+        """
+
+        for client in self.clients:
+            if client.channel_id == channel_id:
+                return client
+
+        raise KeyError(
+            "No client in the pool owns channel {channel_id}.".format(
+                channel_id=channel_id
+            )
+        )
+
+    def call(self, method: str, *args, channel_id: str = None, **kwargs) -> object:
+        """Calls a client method on the right client.
+
+        Arguments:
+        ----
+        method {str} -- The name of the `YouTubeClient` method.
+
+        Keyword Arguments:
+        ----
+        channel_id {str} -- The channel that owns the request, required for
+            `mine` reads and writes. (default: {None})
+
+        Returns:
+        ----
+        {object} -- Whatever the client method returns.
+        """
+
+        if method in SHARED_READ_METHODS:
+            client = self.read_client()
+        elif method in PINNED_METHODS:
+
+            if channel_id is None:
+                raise ValueError(
+                    "Method {method} needs a `channel_id` to pick its credentials.".format(
+                        method=method
+                    )
+                )
+
+            client = self.write_client(channel_id=channel_id)
+        else:
+            raise ValueError(
+                "Method {method} can't be called through the pool.".format(
+                    method=method
+                )
+            )
+
+        # Remember where this thread's quota counter was so we can charge the difference,
+        # the client's total also moves with calls other threads make on it.
+        used_before = client.thread_quota_units
+
+        try:
+            response = getattr(client, method)(*args, **kwargs)
+        except Exception:
+            self._record(client=client, units=client.thread_quota_units - used_before, ok=False)
+            raise
+
+        self._record(
+            client=client,
+            units=client.thread_quota_units - used_before,
+            ok=not self._has_error(response=response),
+            quota_exceeded=self._has_error(response=response, reason='quotaExceeded')
+        )
+
+        return response
+
+    def _has_error(self, response: object, reason: str = None) -> bool:
+        """Looks for an API error in a response, or in any page of a paged response.
+
+        Arguments:
+        ----
+        response {object} -- The response returned by the client method.
+
+        Keyword Arguments:
+        ----
+        reason {str} -- Only match errors with this reason. (default: {None})
+
+        Returns:
+        ----
+        {bool} -- `True` if an error was found.
+        """
+
+        if isinstance(response, dict) and 'error' not in response:
+            pages = [
+                page for value in response.values() if isinstance(value, list)
+                for page in value
+            ]
+        elif isinstance(response, list):
+            pages = response
+        else:
+            pages = [response]
+
+        for page in pages:
+
+            if not isinstance(page, dict) or 'error' not in page:
+                continue
+
+            if reason is None:
+                return True
+
+            reasons = [detail.get('reason') for detail in page['error'].get('errors', [])]
+
+            if reason in reasons:
+                return True
+
+        return False
+
+    def _record(self, client: object, units: int, ok: bool, quota_exceeded: bool = False) -> None:
+        """Charges quota to the client's project and updates its health.
+
+        Arguments:
+        ----
+        client {YouTubeClient} -- The client that made the call.
+
+        units {int} -- The quota units the call spent.
+
+        ok {bool} -- `True` if the call worked.
+
+        Keyword Arguments:
+        ----
+        quota_exceeded {bool} -- `True` if the API said the project is out of quota. (default: {False})
+        """
+
+        with self._lock:
+
+            self._roll_quota_day()
+            self._project_usage[client.api_key] += units
+
+            if quota_exceeded:
+                self._exhausted[client.api_key] = True
+
+            if ok:
+                self._failures[id(client)] = 0
+                return
+
+            self._failures[id(client)] += 1
+
+            # Take it out of rotation for a while.
+            if self._failures[id(client)] >= self.failure_threshold:
+                self._benched_until[id(client)] = time.monotonic() + self.cooldown
+                self._failures[id(client)] = 0
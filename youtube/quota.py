@@ -0,0 +1,40 @@
+from typing import Dict
+from typing import Tuple
+
+
+# The default daily quota for a Google Cloud project using the YouTube Data API.
+DAILY_QUOTA = 10000
+
+# The quota cost of a request, by HTTP method.
+METHOD_COSTS: Dict[str, int] = {
+    'get': 1,
+    'post': 50,
+    'put': 50,
+    'delete': 50
+}
+
+# Endpoints that don't follow the method defaults.
+ENDPOINT_COSTS: Dict[Tuple[str, str], int] = {
+    ('search', 'get'): 100,
+    ('thumbnails/set', 'post'): 50,
+    ('videos', 'post'): 1600
+}
+
+
+def quota_cost(endpoint: str, method: str) -> int:
+    """Returns the number of quota units a request costs.
+
+    Arguments:
+    ----
+    endpoint {str} -- The endpoint of the request, like `playlistItems`.
+
+    method {str} -- The request method, like `get`.
+
+    Returns:
+    ----
+    {int} -- The quota units charged for the request.
+    """
+
+    method = method.lower()
+
+    return ENDPOINT_COSTS.get((endpoint, method), METHOD_COSTS.get(method, 1))
@@ -0,0 +1,287 @@
+import os
+import json
+import time
+import pathlib
+import threading
+
+from typing import Dict
+from typing import Tuple
+from typing import Callable
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+def _take_tokens(state: Dict, rate: float, capacity: float, tokens: float, now: float) -> Tuple[Dict, float]:
+    """Refills a bucket and tries to take tokens out of it.
+
+    Arguments:
+    ----
+    state {Dict} -- The bucket state, with the `tokens` left and the time it was `updated`.
+
+    rate {float} -- The number of tokens added per second.
+
+    capacity {float} -- The most tokens the bucket can hold.
+
+    tokens {float} -- The number of tokens to take.
+
+    now {float} -- The current time, in seconds since the epoch.
+
+    Returns:
+    ----
+    {Tuple[Dict, float]} -- The new bucket state and the number of seconds to
+        wait before trying again, `0.0` if the tokens were taken.
+    """
+
+    # A new bucket starts full.
+    if not state:
+        state = {'tokens': capacity, 'updated': now}
+
+    # Refill the bucket for the time that passed.
+    elapsed = max(0.0, now - state['updated'])
+    available = min(capacity, state['tokens'] + elapsed * rate)
+
+    if available >= tokens:
+        return {'tokens': available - tokens, 'updated': now}, 0.0
+
+    return {'tokens': available, 'updated': now}, (tokens - available) / rate
+
+
+class MemoryBackend():
+
+    def __init__(self) -> None:
+        """Keeps bucket state in memory, shared by every thread in the process."""
+
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def update(self, name: str, function: Callable[[Dict], Tuple[Dict, float]]) -> float:
+        """Applies a function to a bucket's state while holding the lock.
+
+        Arguments:
+        ----
+        name {str} -- The name of the bucket.
+
+        function {Callable} -- Takes the current state and returns the new state
+            along with the wait time.
+
+        Returns:
+        ----
+        {float} -- The wait time returned by the function.
+        """
+
+        with self._lock:
+            self._buckets[name], wait = function(self._buckets.get(name, {}))
+
+        return wait
+
+
+class FileLockBackend():
+
+    def __init__(self, state_path: str) -> None:
+        """Keeps bucket state in a locked JSON file, so several processes on the
+        same machine share one budget.
+
+        Arguments:
+        ----
+        state_path {str} -- The path to the shared state file.
+        """
+
+        if fcntl is None and msvcrt is None:
+            raise OSError("File locking isn't supported on this platform.")
+
+        self.state_path = pathlib.Path(state_path).absolute()
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        self.state_path.touch(exist_ok=True)
+
+        # The file lock only covers other processes, so threads take this one too.
+        self._thread_lock = threading.Lock()
+
+    def _lock_file(self, state_file) -> None:
+        """Takes an exclusive lock on the state file."""
+
+        if fcntl:
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_EX)
+        else:
+            state_file.seek(0)
+            msvcrt.locking(state_file.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(self, state_file) -> None:
+        """Releases the lock on the state file."""
+
+        if fcntl:
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_UN)
+        else:
+            state_file.seek(0)
+            msvcrt.locking(state_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def update(self, name: str, function: Callable[[Dict], Tuple[Dict, float]]) -> float:
+        """Applies a function to a bucket's state while holding the file lock.
+
+        Arguments:
+        ----
+        name {str} -- The name of the bucket.
+
+        function {Callable} -- Takes the current state and returns the new state
+            along with the wait time.
+
+        Returns:
+        ----
+        {float} -- The wait time returned by the function.
+        """
+
+        with self._thread_lock:
+            with open(self.state_path, 'r+') as state_file:
+
+                self._lock_file(state_file=state_file)
+
+                try:
+                    content = state_file.read()
+                    buckets = json.loads(content) if content else {}
+
+                    buckets[name], wait = function(buckets.get(name, {}))
+
+                    # Write the new state back in place.
+                    state_file.seek(0)
+                    state_file.write(json.dumps(buckets))
+                    state_file.truncate()
+                    state_file.flush()
+                    os.fsync(state_file.fileno())
+
+                finally:
+                    self._unlock_file(state_file=state_file)
+
+        return wait
+
+
+class RateLimiter():
+
+    def __init__(self, rate: float = 10.0, capacity: float = None, endpoint_limits: Dict[str, Tuple[float, float]] = None, backend: object = None) -> None:
+        """Initalizes a token-bucket rate limiter for API requests.
+
+        Every request takes a token from the global bucket, and from the
+        endpoint's own bucket if one was configured for it. When a bucket is
+        empty the caller sleeps until it refills, which smooths bursts out
+        instead of letting them trip `rateLimitExceeded`.
+
+        Arguments:
+        ----
+        rate {float} -- The number of requests allowed per second. (default: {10.0})
+
+        capacity {float} -- The largest burst allowed, defaults to `rate`. (default: {None})
+
+        endpoint_limits {Dict[str, Tuple[float, float]]} -- A mapping of endpoint names,
+            like `playlistItems` or `thumbnails/set`, to a `(rate, capacity)` pair. (default: {None})
+
+        backend {object} -- Where the bucket state lives, either a `MemoryBackend` or a
+            `FileLockBackend`. (default: {MemoryBackend()})
+
+        Usage:
+        ----
+            >>> rate_limiter = RateLimiter(
+                rate=5.0,
+                endpoint_limits={'thumbnails/set': (0.5, 1)},
+                backend=FileLockBackend(state_path='data/rate_limit.json')
+            )
+        """
+
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.endpoint_limits = endpoint_limits or {}
+        self.backend = backend or MemoryBackend()
+
+    def _acquire_bucket(self, name: str, rate: float, capacity: float, tokens: float) -> float:
+        """Blocks until the tokens can be taken from a bucket.
+
+        Arguments:
+        ----
+        name {str} -- The name of the bucket.
+
+        rate {float} -- The refill rate of the bucket.
+
+        capacity {float} -- The capacity of the bucket.
+
+        tokens {float} -- The number of tokens to take.
+
+        Returns:
+        ----
+        {float} -- The number of seconds spent waiting.
+        """
+
+        if tokens > capacity:
+            raise ValueError(
+                "Can't take {tokens} tokens from bucket {name} with capacity {capacity}.".format(
+                    tokens=tokens,
+                    name=name,
+                    capacity=capacity
+                )
+            )
+
+        waited = 0.0
+
+        while True:
+
+            wait = self.backend.update(
+                name=name,
+                function=lambda state: _take_tokens(
+                    state=state,
+                    rate=rate,
+                    capacity=capacity,
+                    tokens=tokens,
+                    now=time.time()
+                )
+            )
+
+            if wait <= 0.0:
+                return waited
+
+            # Sleep outside the lock so other callers can check their buckets.
+            time.sleep(wait)
+            waited += wait
+
+    def acquire(self, endpoint: str, tokens: float = 1.0) -> float:
+        """Waits until a request to the endpoint is allowed.
+
+        Arguments:
+        ----
+        endpoint {str} -- The endpoint the request is for.
+
+        Keyword Arguments:
+        ----
+        tokens {float} -- The number of tokens the request costs. (default: {1.0})
+
+        Returns:
+        ----
+        {float} -- The number of seconds spent waiting.
+        """
+
+        waited = 0.0
+
+        # Wait on the endpoint first, so a caller stuck behind a slow endpoint
+        # isn't holding a global token the other endpoints could use.
+        if endpoint in self.endpoint_limits:
+
+            rate, capacity = self.endpoint_limits[endpoint]
+
+            waited += self._acquire_bucket(
+                name='endpoint:{endpoint}'.format(endpoint=endpoint),
+                rate=rate,
+                capacity=capacity,
+                tokens=tokens
+            )
+
+        waited += self._acquire_bucket(
+            name='global',
+            rate=self.rate,
+            capacity=self.capacity,
+            tokens=tokens
+        )
+
+        return waited
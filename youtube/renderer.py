@@ -0,0 +1,419 @@
+import re
+import json
+import pathlib
+
+from typing import List
+from typing import Dict
+from typing import Tuple
+from typing import Union
+
+from concurrent.futures import ProcessPoolExecutor
+
+from youtube.palette import BACKGROUND_BLACK
+from youtube.palette import FOREGROUND_WHITE
+from youtube.palette import HIGH_CONTRAST_PINK
+
+try:
+    from PIL import Image
+    from PIL import ImageDraw
+    from PIL import ImageFont
+except ImportError:
+    Image = None
+
+
+# A placeholder with the text frames of `thumbnail_help_me_grow.ai` on a plain
+# black background, none of the `.ai` file's artwork is in it. Don't upload what
+# it renders as is, add the artwork exported from Illustrator as an `image` layer.
+DEFAULT_TEMPLATE = {
+    'size': [1280, 720],
+    'background': list(BACKGROUND_BLACK),
+    'layers': [],
+    'text_frames': {
+        'GoalSubscriber': {
+            'position': [640, 110],
+            'align': 'center',
+            'font': 'Roboto-Bold.ttf',
+            'size': 60,
+            'leading': 84,
+            'fill': list(FOREGROUND_WHITE)
+        },
+        'CurrentSubscriber': {
+            'position': [640, 470],
+            'align': 'center',
+            'font': 'Roboto-Bold.ttf',
+            'size': 96,
+            'leading': 110,
+            'fill': list(HIGH_CONTRAST_PINK)
+        }
+    }
+}
+
+# Tried in order when a template's font isn't installed.
+FALLBACK_FONTS = ['DejaVuSans-Bold.ttf', 'Arial Bold.ttf', 'arialbd.ttf']
+
+# Each process keeps its own rasterized template layers and fonts.
+_BASE_CACHE: Dict[str, 'Image.Image'] = {}
+_FONT_CACHE: Dict[Tuple[str, int], 'ImageFont.FreeTypeFont'] = {}
+
+
+def _require_pillow() -> None:
+    """Raises a helpful error if the optional `Pillow` package is missing."""
+
+    if Image is None:
+        raise ImportError(
+            "Rendering thumbnails needs the `Pillow` package, install it with `pip install Pillow`."
+        )
+
+
+def load_font(font: str, size: int) -> 'ImageFont.FreeTypeFont':
+    """Loads a font once per process, falling back to a bundled one.
+
+    Arguments:
+    ----
+    font {str} -- The font file name or path, like `Roboto-Bold.ttf`.
+
+    size {int} -- The font size in pixels.
+
+    Returns:
+    ----
+    {ImageFont.FreeTypeFont} -- The loaded font.
+    """
+
+    key = (font, size)
+
+    if key not in _FONT_CACHE:
+
+        for candidate in [font] + FALLBACK_FONTS:
+            try:
+                _FONT_CACHE[key] = ImageFont.truetype(candidate, size)
+                break
+            except OSError:
+                continue
+        else:
+            # Older versions of Pillow only have a fixed size default font.
+            try:
+                _FONT_CACHE[key] = ImageFont.load_default(size=size)
+            except TypeError:
+                _FONT_CACHE[key] = ImageFont.load_default()
+
+    return _FONT_CACHE[key]
+
+
+def template_key(template: Dict) -> str:
+    """Builds the cache key of a template, including when its image layers last changed."""
+
+    modified = [
+        pathlib.Path(layer['image']).stat().st_mtime
+        for layer in template.get('layers', []) if 'image' in layer
+    ]
+
+    return json.dumps([template, modified], sort_keys=True)
+
+
+def rasterize_base(template: Dict) -> 'Image.Image':
+    """Draws the static layers of a template, or grabs them from the cache.
+
+    Arguments:
+    ----
+    template {Dict} -- The template, see `DEFAULT_TEMPLATE`.
+
+    Returns:
+    ----
+    {Image.Image} -- The background with every static layer composited on it,
+        treat it as read only.
+    """
+
+    _require_pillow()
+
+    key = template_key(template=template)
+
+    if key in _BASE_CACHE:
+        return _BASE_CACHE[key]
+
+    base = Image.new('RGBA', tuple(template['size']), tuple(template['background']) + (255,))
+
+    for layer in template.get('layers', []):
+
+        # A flat rectangle, like a banner behind the text.
+        if 'rectangle' in layer:
+            ImageDraw.Draw(base).rectangle(layer['rectangle'], fill=tuple(layer['fill']))
+
+        # A piece of exported artwork.
+        elif 'image' in layer:
+            with Image.open(layer['image']) as artwork:
+                artwork = artwork.convert('RGBA')
+                base.alpha_composite(artwork, dest=tuple(layer.get('position', [0, 0])))
+
+    _BASE_CACHE[key] = base
+
+    return base
+
+
+class ThumbnailRenderer():
+
+    def __init__(self, template: Dict = None) -> None:
+        """Initializes a renderer that draws thumbnails without Illustrator.
+
+        It offers the same operations as `AdobeIllustrator`: set the text of the
+        `GoalSubscriber` and `CurrentSubscriber` frames, recolor ranges of
+        characters and export a PNG. The static layers are only rasterized once
+        per process, a render just draws the text on a copy of them.
+
+        The default template is only a placeholder, it has the text frames but
+        none of the Illustrator artwork, so pass a template with the exported
+        artwork as a layer for thumbnails that are going to be uploaded.
+
+        Keyword Arguments:
+        ----
+        template {Dict} -- The layout of the thumbnail. (default: {DEFAULT_TEMPLATE})
+
+        Usage:
+        ----
+            >>> renderer = ThumbnailRenderer()
+            >>> renderer.set_current_subscriber_text(text='25,400 SO FAR !!!')
+            >>> renderer.recolor(frame='CurrentSubscriber', start=-10, color=FOREGROUND_WHITE)
+            >>> renderer.export_to_png(file_name='thumbnails/current_thumbnail')
+        """
+
+        _require_pillow()
+
+        self.template = template or DEFAULT_TEMPLATE
+        self.texts: Dict[str, str] = {name: '' for name in self.template['text_frames']}
+        self.colors: Dict[str, List[Tuple[int, int, Tuple[int, int, int]]]] = {
+            name: [] for name in self.template['text_frames']
+        }
+
+    def _frame(self, frame: str) -> Dict:
+        """Grabs a text frame from the template."""
+
+        if frame not in self.template['text_frames']:
+            raise KeyError(
+                "Text frame {frame} isn't in the template, must be one of {options}.".format(
+                    frame=frame,
+                    options=list(self.template['text_frames'])
+                )
+            )
+
+        return self.template['text_frames'][frame]
+
+    def set_text(self, frame: str, text: str) -> None:
+        """Sets the text of a frame, dropping its old colors.
+
+        Arguments:
+        ----
+        frame {str} -- The name of the text frame.
+
+        text {str} -- The new text, lines are split on new lines.
+        """
+
+        self._frame(frame=frame)
+        self.texts[frame] = text
+        self.colors[frame] = []
+
+    def set_goal_subscriber_text(self, text: str) -> None:
+        """Set the Text for the Goal Subscriber."""
+
+        self.set_text(frame='GoalSubscriber', text=text)
+
+    def set_current_subscriber_text(self, text: str) -> None:
+        """Set the Text for the Current Subscriber."""
+
+        self.set_text(frame='CurrentSubscriber', text=text)
+
+    def recolor(self, frame: str, color: Tuple[int, int, int], start: int = 0, end: int = None) -> None:
+        """Colors a range of characters, like slicing the frame's text.
+
+        Arguments:
+        ----
+        frame {str} -- The name of the text frame.
+
+        color {Tuple[int, int, int]} -- The new color, see `youtube.palette`.
+
+        Keyword Arguments:
+        ----
+        start {int} -- The first character, negative counts from the end. (default: {0})
+
+        end {int} -- One past the last character, negative counts from the end. (default: {None})
+        """
+
+        self._frame(frame=frame)
+
+        # Resolve negative offsets against the current text.
+        start, end, _ = slice(start, end).indices(len(self.texts[frame]))
+        self.colors[frame].append((start, end, tuple(color)))
+
+    def recolor_match(self, frame: str, pattern: str, color: Tuple[int, int, int]) -> None:
+        """Colors every match of a pattern, like `100,000` in the goal text.
+
+        Arguments:
+        ----
+        frame {str} -- The name of the text frame.
+
+        pattern {str} -- The regular expression to search for.
+
+        color {Tuple[int, int, int]} -- The new color.
+        """
+
+        for match in re.finditer(pattern, self.texts[frame]):
+            self.recolor(frame=frame, color=color, start=match.start(), end=match.end())
+
+    def _character_colors(self, frame: str) -> List[Tuple[int, int, int]]:
+        """Works out the color of every character, later ranges win."""
+
+        colors = [tuple(self._frame(frame=frame)['fill'])] * len(self.texts[frame])
+
+        for start, end, color in self.colors[frame]:
+            colors[start:end] = [color] * len(colors[start:end])
+
+        return colors
+
+    def _draw_frame(self, canvas: 'ImageDraw.ImageDraw', frame: str) -> None:
+        """Draws a text frame line by line, one run of same colored characters at a time."""
+
+        settings = self._frame(frame=frame)
+        font = load_font(font=settings['font'], size=settings['size'])
+        colors = self._character_colors(frame=frame)
+
+        x, y = settings['position']
+        offset = 0
+
+        for line_number, line in enumerate(self.texts[frame].split('\n')):
+
+            # Centered and right aligned lines start at a different spot.
+            width = font.getlength(line)
+
+            if settings.get('align') == 'center':
+                left = x - width / 2
+            elif settings.get('align') == 'right':
+                left = x - width
+            else:
+                left = x
+
+            top = y + line_number * settings['leading']
+
+            # Split the line into runs of the same color.
+            runs = []
+            for index, character in enumerate(line):
+                color = colors[offset + index]
+                if runs and runs[-1][1] == color:
+                    runs[-1][0] += character
+                else:
+                    runs.append([character, color])
+
+            # Measure the text before each run so kerning across runs stays put.
+            drawn = ''
+            for run, color in runs:
+                canvas.text((left + font.getlength(drawn), top), run, font=font, fill=color)
+                drawn += run
+
+            # Skip past the line and its new line character.
+            offset += len(line) + 1
+
+    def render(self) -> 'Image.Image':
+        """Draws the thumbnail.
+
+        Returns:
+        ----
+        {Image.Image} -- The rendered thumbnail.
+        """
+
+        thumbnail = rasterize_base(template=self.template).copy()
+        canvas = ImageDraw.Draw(thumbnail)
+
+        for frame in self.template['text_frames']:
+            self._draw_frame(canvas=canvas, frame=frame)
+
+        return thumbnail
+
+    def export_to_png(self, file_name: Union[str, pathlib.Path]) -> pathlib.Path:
+        """Exports the thumbnail as a PNG Image.
+
+        Arguments:
+        ----
+        file_name {Union[str, pathlib.Path]} -- The file path to export to, `.png`
+            is added if it's missing, like Illustrator does.
+
+        Returns:
+        ----
+        {pathlib.Path} -- The path of the PNG.
+        """
+
+        file_path = pathlib.Path(file_name)
+
+        if file_path.suffix.lower() != '.png':
+            file_path = file_path.with_name(file_path.name + '.png')
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.render().save(file_path, format='PNG')
+
+        return file_path
+
+
+def render_job(template: Dict, job: Dict) -> str:
+    """Renders a single thumbnail, runs inside a worker process.
+
+    Arguments:
+    ----
+    template {Dict} -- The template to render with.
+
+    job {Dict} -- The `file_name` to export to, the `texts` of each frame and a
+        list of `colors`, each one a dictionary of `recolor` or `recolor_match`
+        arguments.
+
+    Returns:
+    ----
+    {str} -- The path of the PNG.
+    """
+
+    renderer = ThumbnailRenderer(template=template)
+
+    for frame, text in job.get('texts', {}).items():
+        renderer.set_text(frame=frame, text=text)
+
+    for color in job.get('colors', []):
+        if 'pattern' in color:
+            renderer.recolor_match(**color)
+        else:
+            renderer.recolor(**color)
+
+    return renderer.export_to_png(file_name=job['file_name']).as_posix()
+
+
+def render_batch(jobs: List[Dict], template: Dict = None, max_workers: int = None) -> List[str]:
+    """Renders many thumbnails across a pool of processes.
+
+    Arguments:
+    ----
+    jobs {List[Dict]} -- The thumbnails to render, see `render_job`.
+
+    Keyword Arguments:
+    ----
+    template {Dict} -- The template every job uses. (default: {DEFAULT_TEMPLATE})
+
+    max_workers {int} -- The number of processes, one per CPU by default. (default: {None})
+
+    Returns:
+    ----
+    {List[str]} -- The path of each PNG, in the same order as the jobs.
+
+    Usage:
+    ----
+        >>> render_batch(
+            jobs=[
+                {
+                    'file_name': 'thumbnails/video_{}'.format(number),
+                    'texts': {'CurrentSubscriber': '{:,} SO FAR !!!'.format(count)},
+                    'colors': [{'frame': 'CurrentSubscriber', 'start': -10, 'color': FOREGROUND_WHITE}]
+                }
+                for number, count in enumerate([25400, 25500])
+            ]
+        )
+    """
+
+    _require_pillow()
+
+    template = template or DEFAULT_TEMPLATE
+
+    # Each worker rasterizes the template once and reuses it for all of its jobs.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(render_job, [template] * len(jobs), jobs))
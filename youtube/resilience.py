@@ -0,0 +1,274 @@
+import time
+import threading
+import urllib.parse
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+from typing import Dict
+
+
+# Methods that are safe to send twice.
+IDEMPOTENT_METHODS = ['get']
+
+# Status codes that count against an endpoint's health.
+FAILURE_CODES = [429, 500, 502, 503, 504]
+
+
+def _endpoint(url: str) -> str:
+    """Pulls the endpoint, like `playlistItems`, out of a full API url."""
+
+    path = urllib.parse.urlsplit(url).path
+
+    return path.split('/v3/', 1)[-1].strip('/')
+
+
+class CircuitOpenError(Exception):
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        """Raised when a request is refused because the endpoint's circuit is open.
+
+        Arguments:
+        ----
+        endpoint {str} -- The endpoint that's failing.
+
+        retry_after {float} -- The number of seconds until a trial request is allowed.
+        """
+
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+        super().__init__(
+            "Circuit for {endpoint} is open, retry in {retry_after:.1f} seconds.".format(
+                endpoint=endpoint,
+                retry_after=retry_after
+            )
+        )
+
+
+class CircuitBreakerTransport():
+
+    def __init__(self, transport: object, failure_rate: float = 0.5, window: int = 20, minimum_requests: int = 10, cooldown: float = 30.0) -> None:
+        """Wraps a transport with a per-endpoint circuit breaker.
+
+        When the share of failed requests in an endpoint's recent window goes over
+        `failure_rate` the circuit opens, and requests to that endpoint fail fast
+        with a `CircuitOpenError` until `cooldown` passes. Then one trial request
+        is let through: if it works the circuit closes, otherwise it opens again.
+
+        Arguments:
+        ----
+        transport {object} -- The transport that actually sends the requests.
+
+        Keyword Arguments:
+        ----
+        failure_rate {float} -- The share of failures that opens the circuit. (default: {0.5})
+
+        window {int} -- The number of recent requests the failure rate is taken over. (default: {20})
+
+        minimum_requests {int} -- The fewest requests in the window before the circuit
+            can open. (default: {10})
+
+        cooldown {float} -- The number of seconds the circuit stays open. (default: {30.0})
+
+        Usage:
+        ----
+            >>> youtube_session.transport = CircuitBreakerTransport(
+                transport=youtube_session.transport,
+                failure_rate=0.5,
+                cooldown=30.0
+            )
+        """
+
+        self.transport = transport
+        self.failure_rate = failure_rate
+        self.window = window
+        self.minimum_requests = minimum_requests
+        self.cooldown = cooldown
+
+        self._lock = threading.Lock()
+        self._outcomes: Dict[str, deque] = {}
+        self._state: Dict[str, str] = {}
+        self._opened_at: Dict[str, float] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, endpoint: str, name: str) -> None:
+        """Bumps a counter, must be called while holding the lock."""
+
+        counters = self.counters.setdefault(
+            endpoint,
+            {'requests': 0, 'failures': 0, 'rejected': 0, 'opened': 0, 'closed': 0}
+        )
+        counters[name] += 1
+
+    def state(self, endpoint: str) -> str:
+        """Returns the circuit state for an endpoint, one of ['closed', 'open', 'half_open']."""
+
+        return self._state.get(endpoint, 'closed')
+
+    def _before(self, endpoint: str) -> None:
+        """Decides if a request may go out, raising if the circuit is open."""
+
+        with self._lock:
+
+            if self.state(endpoint) == 'closed':
+                return
+
+            retry_after = self._opened_at[endpoint] + self.cooldown - time.monotonic()
+
+            # Let one trial request through once the cooldown is over.
+            if self.state(endpoint) == 'open' and retry_after <= 0:
+                self._state[endpoint] = 'half_open'
+                return
+
+            self._count(endpoint=endpoint, name='rejected')
+
+        raise CircuitOpenError(endpoint=endpoint, retry_after=max(0.0, retry_after))
+
+    def _after(self, endpoint: str, failed: bool) -> None:
+        """Records the outcome of a request and opens or closes the circuit."""
+
+        with self._lock:
+
+            self._count(endpoint=endpoint, name='requests')
+
+            if failed:
+                self._count(endpoint=endpoint, name='failures')
+
+            outcomes = self._outcomes.setdefault(endpoint, deque(maxlen=self.window))
+            outcomes.append(failed)
+
+            if self.state(endpoint) == 'half_open':
+
+                if failed:
+                    self._open(endpoint=endpoint)
+                else:
+                    self._state[endpoint] = 'closed'
+                    self._count(endpoint=endpoint, name='closed')
+                    outcomes.clear()
+
+            elif len(outcomes) >= self.minimum_requests and sum(outcomes) / len(outcomes) >= self.failure_rate:
+                self._open(endpoint=endpoint)
+
+    def _open(self, endpoint: str) -> None:
+        """Opens the circuit, must be called while holding the lock."""
+
+        self._state[endpoint] = 'open'
+        self._opened_at[endpoint] = time.monotonic()
+        self._count(endpoint=endpoint, name='opened')
+
+    def send(self, method: str, url: str, **kwargs) -> object:
+        """Sends the request unless the endpoint's circuit is open.
+
+        Raises:
+        ----
+        CircuitOpenError: The endpoint's circuit is open.
+        """
+
+        endpoint = _endpoint(url=url)
+        self._before(endpoint=endpoint)
+
+        try:
+            response = self.transport.send(method=method, url=url, **kwargs)
+        except Exception:
+            self._after(endpoint=endpoint, failed=True)
+            raise
+
+        self._after(endpoint=endpoint, failed=response.status_code in FAILURE_CODES)
+
+        return response
+
+
+class HedgingTransport():
+
+    def __init__(self, transport: object, delay: float = 0.5, max_workers: int = 8, metrics: object = None) -> None:
+        """Wraps a transport so slow reads get a second, hedged, request.
+
+        If a `GET` hasn't answered after `delay` seconds a duplicate is sent, and
+        whichever answers first wins. Writes are never hedged.
+
+        Arguments:
+        ----
+        transport {object} -- The transport that actually sends the requests.
+
+        Keyword Arguments:
+        ----
+        delay {float} -- The number of seconds to wait before hedging. Pick something
+            around the endpoint's p95 latency. (default: {0.5})
+
+        max_workers {int} -- The number of requests in flight at once. (default: {8})
+
+        metrics {RequestMetrics} -- If given, every hedge is counted as a retry of its
+            endpoint, like the client's `metrics`. (default: {None})
+
+        Usage:
+        ----
+            >>> youtube_session.transport = HedgingTransport(
+                transport=youtube_session.transport,
+                delay=0.8,
+                metrics=youtube_session.metrics
+            )
+        """
+
+        self.transport = transport
+        self.delay = delay
+        self.metrics = metrics
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, endpoint: str, name: str) -> None:
+        """Bumps a counter."""
+
+        with self._lock:
+            counters = self.counters.setdefault(
+                endpoint,
+                {'requests': 0, 'hedged': 0, 'primary_wins': 0, 'hedge_wins': 0}
+            )
+            counters[name] += 1
+
+    def send(self, method: str, url: str, **kwargs) -> object:
+        """Sends the request, hedging it if it's a slow read."""
+
+        if method.lower() not in IDEMPOTENT_METHODS:
+            return self.transport.send(method=method, url=url, **kwargs)
+
+        endpoint = _endpoint(url=url)
+        self._count(endpoint=endpoint, name='requests')
+
+        primary = self._executor.submit(self.transport.send, method=method, url=url, **kwargs)
+        done, _ = wait([primary], timeout=self.delay)
+
+        if done:
+            return primary.result()
+
+        # The primary is slow, so send the hedge and take whichever finishes first.
+        self._count(endpoint=endpoint, name='hedged')
+
+        if self.metrics:
+            self.metrics.record_retry(endpoint=endpoint, method=method.lower())
+
+        hedge = self._executor.submit(self.transport.send, method=method, url=url, **kwargs)
+        pending = {primary, hedge}
+
+        while pending:
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+
+                # If one of them blew up, give the other a chance.
+                if future.exception() is not None and pending:
+                    continue
+
+                self._count(endpoint=endpoint, name='primary_wins' if future is primary else 'hedge_wins')
+
+                return future.result()
+
+    def close(self) -> None:
+        """Shuts down the worker threads."""
+
+        self._executor.shutdown(wait=False)
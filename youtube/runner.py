@@ -0,0 +1,240 @@
+import json
+import time
+import pathlib
+import traceback
+
+from configparser import ConfigParser
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
+
+from typing import Dict
+from typing import List
+
+from youtube.membership import MembershipIndex
+
+
+def _page_errors(pages: List[Dict]) -> List[Dict]:
+    """Pulls the API errors out of a list of response pages."""
+
+    return [page['error'] for page in pages if 'error' in page]
+
+
+def sync_channel(config_path: str, output_folder: str) -> Dict:
+    """Syncs one channel's playlists, playlist items and videos.
+
+    This runs inside a worker process, so it builds its own `YouTubeClient`
+    and writes its results to a folder named after the channel. The client
+    never asks for a console login, a channel without saved credentials
+    fails straight away instead of hanging the worker.
+
+    Arguments:
+    ----
+    config_path {str} -- The path to a config file in the `configs/config.ini` format.
+
+    output_folder {str} -- The folder that holds the per-channel result folders.
+
+    Returns:
+    ----
+    {Dict} -- A summary of the sync with the counts, files written and errors.
+    """
+
+    from youtube.client import YouTubeClient
+
+    start = time.monotonic()
+
+    # Grab configuration values.
+    config = ConfigParser()
+    config.read(config_path)
+
+    # Create a new instance of the Client.
+    youtube_session = YouTubeClient(
+        api_key=config.get('main', 'api_key'),
+        channel_id=config.get('main', 'channel_id'),
+        client_secret_path=config.get('main', 'client_secret_path'),
+        state_path=config.get('main', 'state_path'),
+        interactive=False
+    )
+
+    # Point the client somewhere else, like a `MockYouTubeServer`.
+    if config.has_option('main', 'api_url'):
+        youtube_session.api_url = config.get('main', 'api_url')
+
+    # Each channel gets its own data folder.
+    channel_folder = pathlib.Path(output_folder).joinpath(youtube_session.channel_id)
+    channel_folder.mkdir(parents=True, exist_ok=True)
+    youtube_session.data_folder_path = channel_folder
+
+    errors = []
+    files = []
+
+    # Grab all Playlists for the channel.
+    channel_playlists = youtube_session.grab_channel_playlists(
+        parts=['snippet', 'contentDetails']
+    )
+    errors += _page_errors(pages=channel_playlists)
+    files.append(
+        youtube_session.save_to_json_file(
+            file_name='channel_playlists',
+            youtube_content=channel_playlists
+        )
+    )
+
+    # Grab the items for every playlist.
+    playlist_ids = [
+        playlist['id']
+        for page in channel_playlists
+        for playlist in page.get('items', [])
+    ]
+
+    # Start from the last sync's memberships, so a playlist that fails this time keeps what we knew.
+    membership_path = channel_folder.joinpath('channel_memberships.json')
+
+    if membership_path.exists():
+        membership_index = MembershipIndex.load(file_path=membership_path)
+    else:
+        membership_index = MembershipIndex()
+
+    # Forget the playlists that are gone, but only if we got the full list of them.
+    if not _page_errors(pages=channel_playlists):
+        for playlist_id in membership_index.playlist_ids():
+            if playlist_id not in playlist_ids:
+                membership_index.sync_playlist(playlist_id=playlist_id, pages=[])
+
+    all_playlist_items = []
+
+    for playlist_id in playlist_ids:
+
+        playlist_items = youtube_session.playlists_items(
+            playlist_id=playlist_id,
+            all_pages=True
+        )
+        errors += _page_errors(pages=playlist_items)
+        all_playlist_items += playlist_items
+        membership_index.sync_playlist(playlist_id=playlist_id, pages=playlist_items)
+
+    files.append(
+        youtube_session.save_to_json_file(
+            file_name='channel_playlists_items_all',
+            youtube_content=all_playlist_items
+        )
+    )
+
+    # Keep which playlists each video is in, so it doesn't take a scan to find out.
+    files.append(
+        membership_index.save(file_path=membership_path)
+    )
+
+    # Grab every video once, even if it's in several playlists.
+    video_ids = membership_index.video_ids()
+
+    videos = youtube_session.grab_videos(
+        video_ids=video_ids,
+        parts=['snippet', 'contentDetails', 'statistics']
+    )
+    errors += _page_errors(pages=videos)
+    files.append(
+        youtube_session.save_to_json_file(
+            file_name='channel_videos',
+            youtube_content=videos
+        )
+    )
+
+    return {
+        'config_path': str(config_path),
+        'channel_id': youtube_session.channel_id,
+        'playlists': len(playlist_ids),
+        'playlist_items': sum(len(page.get('items', [])) for page in all_playlist_items),
+        'videos': len(video_ids),
+        'quota_units_used': youtube_session.quota_units_used,
+        'files': [str(file_path) for file_path in files],
+        'errors': errors,
+        'elapsed': round(time.monotonic() - start, 3)
+    }
+
+
+class SyncRunner():
+
+    def __init__(self, config_paths: List[str], output_folder: str = 'data/channels', max_workers: int = 4) -> None:
+        """Initalizes a runner that syncs many channels in a bounded process pool.
+
+        Arguments:
+        ----
+        config_paths {List[str]} -- The config files, one per channel, in the
+            `configs/config.ini` format.
+
+        Keyword Arguments:
+        ----
+        output_folder {str} -- The folder that holds the per-channel result
+            folders. (default: {'data/channels'})
+
+        max_workers {int} -- The number of channels synced at once. (default: {4})
+
+        Usage:
+        ----
+            >>> sync_runner = SyncRunner(
+                config_paths=['configs/sigma.ini', 'configs/second_channel.ini'],
+                max_workers=2
+            )
+            >>> sync_runner.run()
+        """
+
+        self.config_paths = [str(config_path) for config_path in config_paths]
+        self.output_folder = pathlib.Path(output_folder).absolute()
+        self.max_workers = max_workers
+
+    def run(self) -> List[Dict]:
+        """Syncs every channel and writes a summary file.
+
+        A channel that fails doesn't stop the others, its traceback is
+        reported in its summary instead.
+
+        Returns:
+        ----
+        {List[Dict]} -- One summary per channel, in the same order as `config_paths`.
+        """
+
+        self.output_folder.mkdir(parents=True, exist_ok=True)
+
+        summaries = {}
+        total = len(self.config_paths)
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+
+            futures = {
+                executor.submit(sync_channel, config_path, str(self.output_folder)): config_path
+                for config_path in self.config_paths
+            }
+
+            for completed, future in enumerate(as_completed(futures), start=1):
+
+                config_path = futures[future]
+
+                try:
+                    summary = future.result()
+                    status = 'synced' if not summary['errors'] else 'synced with errors'
+                except Exception:
+                    summary = {
+                        'config_path': config_path,
+                        'errors': [traceback.format_exc()]
+                    }
+                    status = 'failed'
+
+                summary['status'] = status
+                summaries[config_path] = summary
+
+                # Print the progress.
+                print('[{completed}/{total}] {status}: {config_path} ({errors} errors)'.format(
+                    completed=completed,
+                    total=total,
+                    status=status,
+                    config_path=config_path,
+                    errors=len(summary['errors'])
+                ))
+
+        ordered = [summaries[config_path] for config_path in self.config_paths]
+
+        # Save the aggregated report.
+        with open(self.output_folder.joinpath('sync_summary.json'), 'w+') as summary_file:
+            json.dump(obj=ordered, fp=summary_file, indent=2)
+
+        return ordered
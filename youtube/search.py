@@ -0,0 +1,366 @@
+import sqlite3
+import hashlib
+import pathlib
+
+from typing import Dict
+from typing import List
+from typing import Union
+from typing import Iterable
+
+from youtube import json_backend
+from youtube.storage import read_json
+
+
+# How much a match in each column counts towards the ranking.
+COLUMN_WEIGHTS = {
+    'title': 10.0,
+    'tags': 5.0,
+    'body': 1.0
+}
+
+# The resource kinds the index understands, and the short name they're stored under.
+KINDS = {
+    'youtube#video': 'video',
+    'youtube#playlist': 'playlist',
+    'youtube#playlistItem': 'playlistItem',
+    'youtube#commentThread': 'comment',
+    'youtube#comment': 'comment'
+}
+
+
+def _quote(query: str) -> str:
+    """Turns free text into an FTS5 query that matches all of its words."""
+
+    return ' '.join(
+        '"{word}"'.format(word=word.replace('"', '""'))
+        for word in query.split()
+    )
+
+
+def _document(resource: Dict) -> Dict:
+    """Pulls the searchable text out of a resource.
+
+    Returns:
+    ----
+    {Dict} -- The `kind`, `resource_id`, `parent_id`, `video_id`, `title`, `tags`
+        and `body`, or `None` for a resource the index doesn't understand.
+    """
+
+    kind = KINDS.get(resource.get('kind'))
+    snippet = resource.get('snippet', {})
+
+    if kind is None:
+        return None
+
+    document = {
+        'kind': kind,
+        'resource_id': resource.get('id'),
+        'parent_id': None,
+        'video_id': None,
+        'title': snippet.get('title', ''),
+        'tags': ' '.join(snippet.get('tags', [])),
+        'body': snippet.get('description', '')
+    }
+
+    if kind == 'video':
+        document['video_id'] = resource.get('id')
+
+    elif kind == 'playlistItem':
+        document['parent_id'] = snippet.get('playlistId')
+        document['video_id'] = snippet.get('resourceId', {}).get('videoId')
+
+    elif kind == 'comment':
+
+        # A thread is indexed by its top level comment.
+        if resource.get('kind') == 'youtube#commentThread':
+            snippet = snippet.get('topLevelComment', {}).get('snippet', {})
+
+        document['parent_id'] = snippet.get('parentId')
+        document['video_id'] = snippet.get('videoId') or resource.get('snippet', {}).get('videoId')
+        # A comment has no title, its author goes with the text so a name doesn't rank like a title.
+        document['title'] = ''
+        document['body'] = '\n'.join(
+            text for text in [snippet.get('textOriginal') or snippet.get('textDisplay', ''), snippet.get('authorDisplayName', '')]
+            if text
+        )
+
+    return document
+
+
+class SearchIndex():
+
+    def __init__(self, database_path: str = ':memory:') -> None:
+        """Initalizes a full text search index over videos, playlists and comments.
+
+        The index is a SQLite FTS5 table ranked with BM25, titles count the most,
+        then tags, then descriptions and comment text. Adding a resource again
+        only rewrites it if its text changed, so the index can be fed every
+        sync's results.
+
+        Keyword Arguments:
+        ----
+        database_path {str} -- The SQLite file the index lives in, kept in memory
+            if not set. (default: {':memory:'})
+
+        Usage:
+        ----
+            >>> search_index = SearchIndex(database_path='data/search.db')
+            >>> search_index.add_file(file_path='data/channel_playlists_items_all.json')
+            >>> search_index.search(query='pandas', kinds=['playlistItem'])
+        """
+
+        if database_path != ':memory:':
+            pathlib.Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path)
+
+        try:
+            self._create_tables()
+        except sqlite3.OperationalError as sqlite_error:
+            raise RuntimeError(
+                "The search index needs SQLite with the FTS5 extension: {error}".format(error=sqlite_error)
+            )
+
+    def _create_tables(self) -> None:
+        """Creates the tables if they don't exist."""
+
+        with self.connection:
+
+            self.connection.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+                    kind UNINDEXED,
+                    resource_id UNINDEXED,
+                    parent_id UNINDEXED,
+                    video_id UNINDEXED,
+                    title,
+                    tags,
+                    body,
+                    tokenize = 'porter unicode61 remove_diacritics 2'
+                )
+                """
+            )
+
+            # What's indexed for each resource, so unchanged ones are skipped.
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc_key TEXT PRIMARY KEY,
+                    search_rowid INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL
+                )
+                """
+            )
+
+    def add(self, resources: Iterable[Dict]) -> Dict[str, int]:
+        """Adds or updates resources in the index.
+
+        Arguments:
+        ----
+        resources {Iterable[Dict]} -- Video, Playlist, PlaylistItem, CommentThread
+            or Comment resources, whole list responses with an `items` key, or the
+            `{video_id: [pages]}` dictionary `grab_comments` returns.
+
+        Returns:
+        ----
+        {Dict[str, int]} -- How many resources were `added`, `updated`, `unchanged`
+            and `skipped` because the index doesn't know their kind.
+        """
+
+        counts = {'added': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0}
+
+        with self.connection:
+
+            for resource in self._flatten(resources=resources):
+
+                document = _document(resource=resource)
+
+                if document is None or not document['resource_id']:
+                    counts['skipped'] += 1
+                    continue
+
+                doc_key = '{kind}:{resource_id}'.format(**document)
+                content_hash = hashlib.sha1(
+                    json_backend.dumps(document, sort_keys=True)
+                ).hexdigest()
+
+                existing = self.connection.execute(
+                    'SELECT search_rowid, content_hash FROM documents WHERE doc_key = ?',
+                    (doc_key,)
+                ).fetchone()
+
+                if existing and existing[1] == content_hash:
+                    counts['unchanged'] += 1
+                    continue
+
+                if existing:
+                    self.connection.execute('DELETE FROM search WHERE rowid = ?', (existing[0],))
+
+                cursor = self.connection.execute(
+                    """
+                    INSERT INTO search (kind, resource_id, parent_id, video_id, title, tags, body)
+                    VALUES (:kind, :resource_id, :parent_id, :video_id, :title, :tags, :body)
+                    """,
+                    document
+                )
+
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO documents (doc_key, search_rowid, content_hash) VALUES (?, ?, ?)',
+                    (doc_key, cursor.lastrowid, content_hash)
+                )
+
+                counts['updated' if existing else 'added'] += 1
+
+        return counts
+
+    def add_file(self, file_path: Union[str, pathlib.Path]) -> Dict[str, int]:
+        """Adds the resources from a file saved with `save_to_json_file`.
+
+        Arguments:
+        ----
+        file_path {Union[str, pathlib.Path]} -- The JSON file, compressed or not.
+
+        Returns:
+        ----
+        {Dict[str, int]} -- The counts from `add`.
+        """
+
+        return self.add(resources=read_json(file_path=file_path))
+
+    def _flatten(self, resources: Union[Iterable[Dict], Dict]) -> Iterable[Dict]:
+        """Unwraps list responses into their items, and `grab_comments` results into their pages."""
+
+        if isinstance(resources, dict):
+
+            # A single resource or list response.
+            if 'kind' in resources:
+                resources = [resources]
+
+            # The pages of each video, from `grab_comments`.
+            else:
+                resources = [page for pages in resources.values() for page in pages]
+
+        for resource in resources:
+
+            if 'items' in resource and KINDS.get(resource.get('kind')) is None:
+                yield from resource['items']
+            else:
+                yield resource
+
+    def remove(self, kind: str, resource_id: str) -> bool:
+        """Removes a resource from the index.
+
+        Arguments:
+        ----
+        kind {str} -- One of `video`, `playlist`, `playlistItem` or `comment`.
+
+        resource_id {str} -- The ID of the resource.
+
+        Returns:
+        ----
+        {bool} -- `True` if it was in the index.
+        """
+
+        doc_key = '{kind}:{resource_id}'.format(kind=kind, resource_id=resource_id)
+
+        with self.connection:
+
+            existing = self.connection.execute(
+                'SELECT search_rowid FROM documents WHERE doc_key = ?',
+                (doc_key,)
+            ).fetchone()
+
+            if not existing:
+                return False
+
+            self.connection.execute('DELETE FROM search WHERE rowid = ?', (existing[0],))
+            self.connection.execute('DELETE FROM documents WHERE doc_key = ?', (doc_key,))
+
+        return True
+
+    def search(self, query: str, kinds: List[str] = None, limit: int = 20, raw: bool = False) -> List[Dict]:
+        """Searches the index.
+
+        Arguments:
+        ----
+        query {str} -- The words to search for, every one has to match.
+
+        Keyword Arguments:
+        ----
+        kinds {List[str]} -- Only return these kinds, like `['video', 'comment']`. (default: {None})
+
+        limit {int} -- The most results returned. (default: {20})
+
+        raw {bool} -- If `True` the query is passed to FTS5 as is, so `OR`, `NEAR`,
+            prefixes like `panda*` and column filters like `title:pandas` work. (default: {False})
+
+        Returns:
+        ----
+        {List[Dict]} -- The best matches first, each with its `kind`, `id`, `parent_id`,
+            `video_id`, `title`, a `snippet` of the matching text and its `score`.
+        """
+
+        match = query if raw else _quote(query=query)
+
+        if not match:
+            return []
+
+        sql = """
+            SELECT
+                kind,
+                resource_id,
+                parent_id,
+                video_id,
+                title,
+                snippet(search, 6, '[', ']', '...', 12),
+                bm25(search, 0, 0, 0, 0, :title_weight, :tags_weight, :body_weight) AS score
+            FROM search
+            WHERE search MATCH :match
+        """
+
+        params = {
+            'match': match,
+            'title_weight': COLUMN_WEIGHTS['title'],
+            'tags_weight': COLUMN_WEIGHTS['tags'],
+            'body_weight': COLUMN_WEIGHTS['body'],
+            'limit': limit
+        }
+
+        if kinds:
+            sql += ' AND kind IN ({placeholders})'.format(
+                placeholders=', '.join(':kind_{}'.format(index) for index in range(len(kinds)))
+            )
+            params.update({'kind_{}'.format(index): kind for index, kind in enumerate(kinds)})
+
+        # BM25 scores are negative, the lowest is the best match.
+        sql += ' ORDER BY score LIMIT :limit'
+
+        return [
+            {
+                'kind': row[0],
+                'id': row[1],
+                'parent_id': row[2],
+                'video_id': row[3],
+                'title': row[4],
+                'snippet': row[5],
+                'score': -row[6]
+            }
+            for row in self.connection.execute(sql, params)
+        ]
+
+    def count(self) -> int:
+        """Counts the indexed resources."""
+
+        return self.connection.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    def close(self) -> None:
+        """Closes the database."""
+
+        self.connection.close()
+
+    def __enter__(self) -> 'SearchIndex':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,185 @@
+import gzip
+import pathlib
+
+from typing import Union
+
+from youtube import json_backend
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# The file suffix used for each compression.
+COMPRESSION_SUFFIXES = {
+    None: '',
+    'gzip': '.gz',
+    'zstd': '.zst'
+}
+
+# The magic bytes each compressed format starts with.
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _require_zstandard() -> None:
+    """Raises a helpful error if the optional `zstandard` package is missing."""
+
+    if zstandard is None:
+        raise ImportError(
+            "Reading or writing zstd files needs the `zstandard` package, install it with `pip install zstandard`."
+        )
+
+
+def data_file_path(folder: Union[str, pathlib.Path], file_name: str, compression: str = None) -> pathlib.Path:
+    """Builds the path of a data file for a compression.
+
+    Arguments:
+    ----
+    folder {Union[str, pathlib.Path]} -- The folder the file lives in.
+
+    file_name {str} -- The name of the file, without an extension.
+
+    Keyword Arguments:
+    ----
+    compression {str} -- One of [None, 'gzip', 'zstd']. (default: {None})
+
+    Returns:
+    ----
+    {pathlib.Path} -- The path, like `data/channel_playlists.json.gz`.
+    """
+
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(
+            "Compression {compression} isn't supported, must be one of {options}.".format(
+                compression=compression,
+                options=list(COMPRESSION_SUFFIXES)
+            )
+        )
+
+    return pathlib.Path(folder).joinpath(
+        '{file_name}.json{suffix}'.format(
+            file_name=file_name,
+            suffix=COMPRESSION_SUFFIXES[compression]
+        )
+    )
+
+
+def find_data_file(file_path: Union[str, pathlib.Path]) -> pathlib.Path:
+    """Finds a data file, falling back to its compressed versions.
+
+    Arguments:
+    ----
+    file_path {Union[str, pathlib.Path]} -- The path of the file.
+
+    Raises:
+    ----
+    FileNotFoundError: Neither the file nor a compressed version of it exists.
+
+    Returns:
+    ----
+    {pathlib.Path} -- The path of the file that exists.
+    """
+
+    file_path = pathlib.Path(file_path)
+    candidates = [file_path] + [
+        file_path.with_name(file_path.name + suffix)
+        for suffix in COMPRESSION_SUFFIXES.values() if suffix
+    ]
+
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+
+    raise FileNotFoundError(
+        "File {file_name} doesn't exist.".format(
+            file_name=file_path.as_posix()
+        )
+    )
+
+
+def read_bytes(file_path: Union[str, pathlib.Path]) -> bytes:
+    """Reads a data file and decompresses it if it's gzip or zstd.
+
+    The format is picked from the file's first bytes, not its name.
+
+    Arguments:
+    ----
+    file_path {Union[str, pathlib.Path]} -- The path of the file.
+
+    Returns:
+    ----
+    {bytes} -- The decompressed content.
+    """
+
+    with open(file_path, 'rb') as data_file:
+        content = data_file.read()
+
+    if content.startswith(GZIP_MAGIC):
+        return gzip.decompress(content)
+
+    if content.startswith(ZSTD_MAGIC):
+        _require_zstandard()
+        return zstandard.ZstdDecompressor().decompressobj().decompress(content)
+
+    return content
+
+
+def read_json(file_path: Union[str, pathlib.Path]) -> object:
+    """Loads a JSON data file, compressed or not.
+
+    Arguments:
+    ----
+    file_path {Union[str, pathlib.Path]} -- The path of the file.
+
+    Returns:
+    ----
+    {object} -- The decoded content.
+    """
+
+    return json_backend.loads(read_bytes(file_path=file_path))
+
+
+def write_json(file_path: Union[str, pathlib.Path], content: object, compression: str = None, compact: bool = False) -> pathlib.Path:
+    """Saves content to a JSON data file.
+
+    Arguments:
+    ----
+    file_path {Union[str, pathlib.Path]} -- The path of the file.
+
+    content {object} -- The content to save.
+
+    Keyword Arguments:
+    ----
+    compression {str} -- One of [None, 'gzip', 'zstd']. (default: {None})
+
+    compact {bool} -- If `True` the JSON is written without indentation or
+        spaces, otherwise it's pretty printed. (default: {False})
+
+    Returns:
+    ----
+    {pathlib.Path} -- The path of the file.
+    """
+
+    encoded = json_backend.dumps(content, pretty=not compact)
+
+    if compression == 'gzip':
+        encoded = gzip.compress(encoded, compresslevel=6)
+    elif compression == 'zstd':
+        _require_zstandard()
+        encoded = zstandard.ZstdCompressor(level=10).compress(encoded)
+    elif compression is not None:
+        raise ValueError(
+            "Compression {compression} isn't supported, must be one of {options}.".format(
+                compression=compression,
+                options=list(COMPRESSION_SUFFIXES)
+            )
+        )
+
+    file_path = pathlib.Path(file_path)
+
+    with open(file_path, 'wb') as data_file:
+        data_file.write(encoded)
+
+    return file_path
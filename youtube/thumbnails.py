@@ -0,0 +1,122 @@
+import os
+import hashlib
+import pathlib
+import tempfile
+import threading
+
+from typing import Dict
+
+from youtube import json_backend
+
+
+def file_hash(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """Hashes a file's content without loading it all into memory.
+
+    Arguments:
+    ----
+    file_path {str} -- The path of the file.
+
+    Keyword Arguments:
+    ----
+    block_size {int} -- The number of bytes read at a time. (default: {1 MB})
+
+    Returns:
+    ----
+    {str} -- The SHA-256 hex digest of the content.
+    """
+
+    content_hash = hashlib.sha256()
+
+    with open(file_path, 'rb') as content_file:
+        for block in iter(lambda: content_file.read(block_size), b''):
+            content_hash.update(block)
+
+    return content_hash.hexdigest()
+
+
+class ThumbnailIndex():
+
+    def __init__(self, index_path: str) -> None:
+        """Initalizes an index of the last thumbnail uploaded to each video.
+
+        The index maps a video ID to the content hash of the last image that was
+        uploaded to it successfully, so a byte-identical image doesn't have to
+        be uploaded again.
+
+        Arguments:
+        ----
+        index_path {str} -- The path of the JSON index file, created on the first save.
+
+        Usage:
+        ----
+            >>> thumbnail_index = ThumbnailIndex(index_path='data/thumbnail_index.json')
+            >>> youtube_session.upload_thumbnail(
+                video_id='XEjaDFqImCk',
+                thumbnail_path='thumbnails/current_thumbnail.png',
+                thumbnail_index=thumbnail_index
+            )
+        """
+
+        self.index_path = pathlib.Path(index_path).absolute()
+        self._lock = threading.Lock()
+
+        if self.index_path.exists():
+            self._hashes: Dict[str, str] = json_backend.loads(self.index_path.read_bytes())
+        else:
+            self._hashes: Dict[str, str] = {}
+
+    def last_hash(self, video_id: str) -> str:
+        """Returns the hash of the last thumbnail uploaded to a video, if there is one."""
+
+        with self._lock:
+            return self._hashes.get(video_id)
+
+    def is_unchanged(self, video_id: str, content_hash: str) -> bool:
+        """Checks if a video already has this exact thumbnail.
+
+        Arguments:
+        ----
+        video_id {str} -- The video ID.
+
+        content_hash {str} -- The content hash of the new thumbnail.
+
+        Returns:
+        ----
+        {bool} -- `True` if the last successful upload had the same content.
+        """
+
+        return self.last_hash(video_id=video_id) == content_hash
+
+    def record(self, video_id: str, content_hash: str) -> None:
+        """Records a successful upload and saves the index.
+
+        Arguments:
+        ----
+        video_id {str} -- The video ID.
+
+        content_hash {str} -- The content hash of the uploaded thumbnail.
+        """
+
+        with self._lock:
+            self._hashes[video_id] = content_hash
+            self._save()
+
+    def forget(self, video_id: str) -> None:
+        """Drops a video from the index, so its next upload always goes through."""
+
+        with self._lock:
+            self._hashes.pop(video_id, None)
+            self._save()
+
+    def _save(self) -> None:
+        """Writes the index to a temporary file and moves it into place, must be
+        called while holding the lock."""
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix='.tmp')
+
+        with os.fdopen(file_descriptor, 'wb') as temp_file:
+            temp_file.write(json_backend.dumps(self._hashes, pretty=True, sort_keys=True))
+
+        os.replace(temp_path, self.index_path)
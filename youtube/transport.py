@@ -0,0 +1,332 @@
+import time
+import base64
+import hashlib
+import pathlib
+import threading
+import urllib.parse
+
+from collections import deque
+
+from typing import Dict
+from typing import Tuple
+
+import requests
+
+from youtube import json_backend
+
+
+# Query parameters that hold secrets and never go into a cassette.
+SECRET_PARAMS = ['key']
+
+
+def _encode(content: object) -> str:
+    """Encodes content as compact JSON."""
+
+    return json_backend.dumps(content).decode('utf-8')
+
+
+def _decode(content: bytes) -> object:
+    """Decodes a JSON body."""
+
+    return json_backend.loads(content)
+
+
+class TransportResponse():
+
+    def __init__(self, status_code: int, headers: Dict, content: bytes, elapsed: float = 0.0) -> None:
+        """A transport agnostic HTTP response.
+
+        Arguments:
+        ----
+        status_code {int} -- The HTTP status code.
+
+        headers {Dict} -- The response headers.
+
+        content {bytes} -- The response body.
+
+        Keyword Arguments:
+        ----
+        elapsed {float} -- The number of seconds the request took. (default: {0.0})
+        """
+
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """`True` if the status code is below 400."""
+
+        return self.status_code < 400
+
+    def json(self) -> Dict:
+        """Decodes the body as JSON."""
+
+        return json_backend.loads(self.content)
+
+
+class HttpTransport():
+
+    def __init__(self, verify: bool = True) -> None:
+        """Sends requests over HTTP with a `requests.Session` per thread, so
+        connections are reused between requests and a transport can be shared
+        by worker threads, a `requests.Session` itself isn't thread safe.
+
+        Keyword Arguments:
+        ----
+        verify {bool} -- Verify the server's TLS certificate. (default: {True})
+        """
+
+        self.verify = verify
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session, created on first use."""
+
+        session = getattr(self._local, 'session', None)
+
+        if session is None:
+            session = requests.Session()
+            session.verify = self.verify
+            self._local.session = session
+
+        return session
+
+    def send(self, method: str, url: str, headers: Dict = None, params: Dict = None, json: Dict = None, data: object = None, files: Dict = None) -> TransportResponse:
+        """Sends a request.
+
+        Arguments:
+        ----
+        method {str} -- The request method.
+
+        url {str} -- The full URL.
+
+        Keyword Arguments:
+        ----
+        headers {Dict} -- The request headers. (default: {None})
+
+        params {Dict} -- The URL params. (default: {None})
+
+        json {Dict} -- A JSON payload. (default: {None})
+
+        data {object} -- A raw payload. (default: {None})
+
+        files {Dict} -- Files for a multipart upload. (default: {None})
+
+        Returns:
+        ----
+        {TransportResponse} -- The response.
+        """
+
+        # Prepare the request.
+        new_request = requests.Request(
+            method=method.upper(),
+            headers=headers,
+            params=params,
+            data=data,
+            json=json,
+            files=files,
+            url=url
+        ).prepare()
+
+        # Send the request.
+        response: requests.Response = self.session.send(request=new_request)
+
+        return TransportResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+            elapsed=response.elapsed.total_seconds()
+        )
+
+
+def _request_key(method: str, url: str, params: Dict = None, payload: Dict = None, data: object = None) -> Tuple[str, str, str, str]:
+    """Builds the key a request is matched on when replaying.
+
+    Secrets are dropped from the params, the params are sorted and the
+    body is reduced to a hash.
+    """
+
+    params = {
+        name: value if not isinstance(value, (list, tuple)) else ','.join(map(str, value))
+        for name, value in (params or {}).items()
+        if name not in SECRET_PARAMS
+    }
+
+    if payload is not None:
+        body = json_backend.dumps(payload, sort_keys=True)
+    elif isinstance(data, (bytes, str)):
+        body = data if isinstance(data, bytes) else data.encode('utf-8')
+    else:
+        body = b''
+
+    return (
+        method.lower(),
+        url,
+        urllib.parse.urlencode(sorted((name, str(value)) for name, value in params.items())),
+        hashlib.sha256(body).hexdigest() if body else ''
+    )
+
+
+class RecordingTransport():
+
+    def __init__(self, transport: object, cassette_path: str) -> None:
+        """Wraps a transport and records every request and response pair into a
+        JSON lines cassette.
+
+        Authorization headers and the API key are never recorded.
+
+        Arguments:
+        ----
+        transport {object} -- The transport that actually sends the requests.
+
+        cassette_path {str} -- The path to the cassette, new recordings are appended.
+
+        Usage:
+        ----
+            >>> youtube_session.transport = RecordingTransport(
+                transport=youtube_session.transport,
+                cassette_path='data/cassettes/crawl.jsonl'
+            )
+        """
+
+        self.transport = transport
+        self.cassette_path = pathlib.Path(cassette_path).absolute()
+        self.cassette_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+    def send(self, method: str, url: str, headers: Dict = None, params: Dict = None, json: Dict = None, data: object = None, files: Dict = None) -> TransportResponse:
+        """Sends the request with the wrapped transport and records it."""
+
+        response = self.transport.send(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            data=data,
+            files=files
+        )
+
+        key = _request_key(method=method, url=url, params=params, payload=json, data=data)
+
+        # Store JSON bodies as JSON so the cassette stays readable and small.
+        entry = {
+            'method': key[0],
+            'url': key[1],
+            'query': key[2],
+            'body_sha256': key[3],
+            'status_code': response.status_code,
+            'headers': {
+                name: value for name, value in response.headers.items()
+                if name.lower() in ['content-type', 'etag', 'location', 'range']
+            },
+            'elapsed': response.elapsed
+        }
+
+        try:
+            entry['body'] = _decode(content=response.content) if response.content else None
+        except ValueError:
+            entry['body_base64'] = base64.b64encode(response.content).decode('ascii')
+
+        with self._lock:
+            with open(self.cassette_path, 'a', encoding='utf-8') as cassette_file:
+                cassette_file.write(_encode(content=entry) + '\n')
+
+        return response
+
+
+class ReplayTransport():
+
+    def __init__(self, cassette_path: str, simulate_latency: bool = False, latency_scale: float = 1.0) -> None:
+        """Answers requests from a cassette instead of the network.
+
+        Requests are matched on their method, URL, params (without the API key)
+        and body. When the same request was recorded more than once the
+        responses are played back in the order they were recorded.
+
+        Arguments:
+        ----
+        cassette_path {str} -- The path to the cassette.
+
+        Keyword Arguments:
+        ----
+        simulate_latency {bool} -- Sleep for the recorded time before answering. (default: {False})
+
+        latency_scale {float} -- Multiplies the recorded latency when simulating it. (default: {1.0})
+
+        Usage:
+        ----
+            >>> youtube_session.transport = ReplayTransport(
+                cassette_path='data/cassettes/crawl.jsonl',
+                simulate_latency=True
+            )
+        """
+
+        self.cassette_path = pathlib.Path(cassette_path).absolute()
+        self.simulate_latency = simulate_latency
+        self.latency_scale = latency_scale
+
+        self._lock = threading.Lock()
+        self._recordings: Dict[Tuple, deque] = {}
+
+        with open(self.cassette_path, 'r', encoding='utf-8') as cassette_file:
+            for line in cassette_file:
+
+                if not line.strip():
+                    continue
+
+                entry = _decode(content=line)
+                key = (entry['method'], entry['url'], entry['query'], entry['body_sha256'])
+                self._recordings.setdefault(key, deque()).append(entry)
+
+    def remaining(self) -> int:
+        """The number of recorded responses that haven't been played back."""
+
+        return sum(len(entries) for entries in self._recordings.values())
+
+    def send(self, method: str, url: str, headers: Dict = None, params: Dict = None, json: Dict = None, data: object = None, files: Dict = None) -> TransportResponse:
+        """Plays back the recorded response for a request.
+
+        Raises:
+        ----
+        LookupError: The request isn't in the cassette.
+        """
+
+        key = _request_key(method=method, url=url, params=params, payload=json, data=data)
+
+        with self._lock:
+
+            entries = self._recordings.get(key)
+
+            if not entries:
+                raise LookupError(
+                    "No recorded response for {method} {url}?{query}.".format(
+                        method=key[0].upper(),
+                        url=key[1],
+                        query=key[2]
+                    )
+                )
+
+            # Keep the last one around so a request can be replayed forever.
+            entry = entries.popleft() if len(entries) > 1 else entries[0]
+
+        if self.simulate_latency:
+            time.sleep(entry['elapsed'] * self.latency_scale)
+
+        if 'body_base64' in entry:
+            content = base64.b64decode(entry['body_base64'])
+        elif entry.get('body') is None:
+            content = b''
+        else:
+            content = _encode(content=entry['body']).encode('utf-8')
+
+        return TransportResponse(
+            status_code=entry['status_code'],
+            headers=entry['headers'],
+            content=content,
+            elapsed=entry['elapsed']
+        )
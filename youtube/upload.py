@@ -0,0 +1,297 @@
+import os
+import time
+import pathlib
+import mimetypes
+
+from typing import Dict
+from typing import Callable
+
+from youtube import json_backend
+
+
+# Chunks must be a multiple of 256 KB, except for the last one.
+CHUNK_ALIGNMENT = 256 * 1024
+DEFAULT_CHUNK_SIZE = 8 * CHUNK_ALIGNMENT
+
+# Status codes worth retrying after querying the server for the offset.
+RETRYABLE_CODES = [500, 502, 503, 504]
+
+
+def _header(response: object, name: str) -> str:
+    """Grabs a response header without caring about its case."""
+
+    for header, value in response.headers.items():
+        if header.lower() == name.lower():
+            return value
+
+    return None
+
+
+class UploadError(Exception):
+
+    def __init__(self, message: str, response: object = None) -> None:
+        """Raised when an upload can't be started or finished.
+
+        Arguments:
+        ----
+        message {str} -- What went wrong.
+
+        Keyword Arguments:
+        ----
+        response {TransportResponse} -- The response that ended the upload. (default: {None})
+        """
+
+        self.response = response
+
+        super().__init__(message)
+
+
+class ResumableUpload():
+
+    def __init__(self, transport: object, url: str, headers: Callable[[], Dict], file_path: str, params: Dict = None,
+                 metadata: Dict = None, mime_type: str = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 progress_callback: Callable[[Dict], None] = None, max_retries: int = 5,
+                 on_retry: Callable[[], None] = None) -> None:
+        """Initalizes a resumable media upload against the `/upload/youtube/v3` API.
+
+        The file is streamed from disk one chunk at a time, so it never sits in
+        memory as a whole. If a chunk fails, the server is asked how much it
+        already has and the upload carries on from there.
+
+        Arguments:
+        ----
+        transport {object} -- The transport used to send the requests.
+
+        url {str} -- The upload URL, like `https://www.googleapis.com/upload/youtube/v3/videos`.
+
+        headers {Callable[[], Dict]} -- Builds the authorization headers, called before
+            every request so a refreshed token is picked up.
+
+        file_path {str} -- The path of the file to upload.
+
+        Keyword Arguments:
+        ----
+        params {Dict} -- The URL params for the initial request. (default: {None})
+
+        metadata {Dict} -- The JSON resource sent along with the media, like a video
+            `snippet` and `status`. (default: {None})
+
+        mime_type {str} -- The MIME type of the file, guessed from its name if not given. (default: {None})
+
+        chunk_size {int} -- The number of bytes sent per request, rounded up to a
+            multiple of 256 KB. (default: {2 MB})
+
+        progress_callback {Callable[[Dict], None]} -- Called after every chunk with the
+            `bytes_sent`, `total_bytes` and `progress`. (default: {None})
+
+        max_retries {int} -- The number of failed chunks in a row before giving up. (default: {5})
+
+        on_retry {Callable[[], None]} -- Called every time a failed chunk is tried again,
+            like `RequestMetrics.record_retry`. (default: {None})
+        """
+
+        self.transport = transport
+        self.url = url
+        self.headers = headers
+        self.file_path = pathlib.Path(file_path).absolute()
+        self.params = params or {}
+        self.metadata = metadata
+        self.mime_type = mime_type or mimetypes.guess_type(self.file_path.as_posix())[0] or 'application/octet-stream'
+        self.chunk_size = max(1, -(-chunk_size // CHUNK_ALIGNMENT)) * CHUNK_ALIGNMENT
+        self.progress_callback = progress_callback
+        self.max_retries = max_retries
+        self.on_retry = on_retry
+
+        self.total_bytes = os.path.getsize(self.file_path)
+        self.bytes_sent = 0
+        self.session_uri = None
+
+    def start(self) -> str:
+        """Opens an upload session.
+
+        Returns:
+        ----
+        {str} -- The session URI, keep it around to resume the upload after a restart.
+        """
+
+        headers = self.headers()
+        headers['X-Upload-Content-Type'] = self.mime_type
+        headers['X-Upload-Content-Length'] = str(self.total_bytes)
+
+        if self.metadata is not None:
+            headers['Content-Type'] = 'application/json; charset=UTF-8'
+
+        response = self.transport.send(
+            method='post',
+            url=self.url,
+            headers=headers,
+            params=dict(self.params, uploadType='resumable'),
+            json=self.metadata
+        )
+
+        self.session_uri = _header(response=response, name='Location')
+
+        if not response.ok or not self.session_uri:
+            raise UploadError(
+                "Couldn't start the upload for {file_path}, status {status_code}.".format(
+                    file_path=self.file_path.as_posix(),
+                    status_code=response.status_code
+                ),
+                response=response
+            )
+
+        return self.session_uri
+
+    def _offset_from(self, response: object) -> int:
+        """Reads the next offset from a `308 Resume Incomplete` response."""
+
+        received = _header(response=response, name='Range')
+
+        # No range means the server has nothing yet.
+        if not received:
+            return 0
+
+        return int(received.split('-')[-1]) + 1
+
+    def query_offset(self) -> object:
+        """Asks the server how many bytes it already has.
+
+        Returns:
+        ----
+        {TransportResponse} -- The status response, a `308` while the upload is
+            incomplete or the final response if it's done.
+        """
+
+        headers = self.headers()
+        headers['Content-Range'] = 'bytes */{total}'.format(total=self.total_bytes)
+        headers['Content-Length'] = '0'
+
+        response = self.transport.send(method='put', url=self.session_uri, headers=headers)
+
+        if response.status_code == 308:
+            self.bytes_sent = self._offset_from(response=response)
+
+        return response
+
+    def _send_chunk(self, media_file) -> object:
+        """Reads the next chunk from disk and sends it."""
+
+        media_file.seek(self.bytes_sent)
+        chunk = media_file.read(self.chunk_size)
+
+        headers = self.headers()
+        headers['Content-Type'] = self.mime_type
+        headers['Content-Length'] = str(len(chunk))
+
+        if chunk:
+            headers['Content-Range'] = 'bytes {start}-{end}/{total}'.format(
+                start=self.bytes_sent,
+                end=self.bytes_sent + len(chunk) - 1,
+                total=self.total_bytes
+            )
+        else:
+            headers['Content-Range'] = 'bytes */{total}'.format(total=self.total_bytes)
+
+        return self.transport.send(method='put', url=self.session_uri, headers=headers, data=chunk)
+
+    def _report(self) -> None:
+        """Calls the progress callback."""
+
+        if self.progress_callback:
+            self.progress_callback({
+                'file_path': self.file_path.as_posix(),
+                'bytes_sent': self.bytes_sent,
+                'total_bytes': self.total_bytes,
+                'progress': self.bytes_sent / self.total_bytes if self.total_bytes else 1.0
+            })
+
+    def upload(self, session_uri: str = None) -> Dict:
+        """Uploads the file, starting a new session or resuming an old one.
+
+        Keyword Arguments:
+        ----
+        session_uri {str} -- The session URI of an upload that was interrupted,
+            the upload picks up from whatever the server already has. (default: {None})
+
+        Raises:
+        ----
+        UploadError: The server refused the upload or it failed too many times.
+
+        Returns:
+        ----
+        {Dict} -- The JSON resource returned once the upload is done.
+        """
+
+        if session_uri:
+            self.session_uri = session_uri
+            response = self.query_offset()
+
+            if response.status_code in [200, 201]:
+                return self._finish(response=response)
+        else:
+            self.start()
+
+        failures = 0
+
+        with open(self.file_path, 'rb') as media_file:
+
+            while True:
+
+                # Connection and timeout errors, including the ones from requests, are all `OSError`s.
+                try:
+                    response = self._send_chunk(media_file=media_file)
+                except OSError:
+                    response = None
+
+                # The chunk landed, carry on from wherever the server says.
+                if response is not None and response.status_code == 308:
+                    failures = 0
+                    self.bytes_sent = self._offset_from(response=response)
+                    self._report()
+                    continue
+
+                # All done.
+                if response is not None and response.status_code in [200, 201]:
+                    self.bytes_sent = self.total_bytes
+                    self._report()
+                    return self._finish(response=response)
+
+                # A client error won't get better by retrying.
+                if response is not None and response.status_code not in RETRYABLE_CODES:
+                    raise UploadError(
+                        "Upload for {file_path} failed with status {status_code}.".format(
+                            file_path=self.file_path.as_posix(),
+                            status_code=response.status_code
+                        ),
+                        response=response
+                    )
+
+                failures += 1
+
+                if failures > self.max_retries:
+                    raise UploadError(
+                        "Upload for {file_path} failed {failures} times in a row.".format(
+                            file_path=self.file_path.as_posix(),
+                            failures=failures
+                        ),
+                        response=response
+                    )
+
+                if self.on_retry:
+                    self.on_retry()
+
+                # Back off, then find out what made it.
+                time.sleep(min(2 ** failures, 32))
+
+                try:
+                    response = self.query_offset()
+                except OSError:
+                    continue
+
+                if response.status_code in [200, 201]:
+                    return self._finish(response=response)
+
+    def _finish(self, response: object) -> Dict:
+        """Decodes the final response."""
+
+        return json_backend.loads(response.content) if response.content else {}
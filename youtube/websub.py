@@ -0,0 +1,749 @@
+import hmac
+import hashlib
+import threading
+import urllib.parse
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ElementTree
+
+from datetime import datetime
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Callable
+
+
+# Google's public hub, and the feed every channel publishes to it.
+HUB_URL = 'https://pubsubhubbub.appspot.com/subscribe'
+TOPIC_URL = 'https://www.youtube.com/xml/feeds/videos.xml?channel_id={channel_id}'
+
+# The XML namespaces used in the push notifications.
+NAMESPACES = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'yt': 'http://www.youtube.com/xml/schemas/2015',
+    'at': 'http://purl.org/atompub/tombstones/1.0'
+}
+
+# An entry updated within this many seconds of being published is a new upload,
+# anything later is an edit to an older video, like a new title.
+NEW_VIDEO_WINDOW = 3600.0
+
+
+def topic_url(channel_id: str) -> str:
+    """Builds the feed URL to subscribe to for a channel."""
+
+    return TOPIC_URL.format(channel_id=channel_id)
+
+
+def sign(secret: str, body: bytes) -> str:
+    """Signs a notification body the way the hub does.
+
+    Arguments:
+    ----
+    secret {str} -- The secret given when subscribing.
+
+    body {bytes} -- The notification body.
+
+    Returns:
+    ----
+    {str} -- The `X-Hub-Signature` header value, like `sha1=<hex digest>`.
+    """
+
+    return 'sha1=' + hmac.new(secret.encode('utf-8'), body, hashlib.sha1).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: str) -> bool:
+    """Checks the `X-Hub-Signature` of a notification.
+
+    Arguments:
+    ----
+    secret {str} -- The secret given when subscribing.
+
+    body {bytes} -- The notification body.
+
+    signature {str} -- The `X-Hub-Signature` header, like `sha1=<hex digest>`.
+
+    Returns:
+    ----
+    {bool} -- `True` if the body was signed with the secret.
+    """
+
+    if not signature or '=' not in signature:
+        return False
+
+    method, digest = signature.split('=', 1)
+
+    if method not in ['sha1', 'sha256', 'sha384', 'sha512']:
+        return False
+
+    expected = hmac.new(secret.encode('utf-8'), body, getattr(hashlib, method)).hexdigest()
+
+    return hmac.compare_digest(expected, digest)
+
+
+def parse_feed(body: bytes) -> List[Dict]:
+    """Parses an Atom push notification.
+
+    Arguments:
+    ----
+    body {bytes} -- The notification body.
+
+    Returns:
+    ----
+    {List[Dict]} -- One dictionary per entry with the `video_id`, `channel_id`, `title`,
+        `link`, `published` and `updated` values. A deleted video only has its
+        `video_id`, `deleted` set to `True` and `updated` set to when it was deleted.
+    """
+
+    feed = ElementTree.fromstring(body)
+    entries = []
+
+    for entry in feed.findall('atom:entry', NAMESPACES):
+
+        link = entry.find('atom:link', NAMESPACES)
+
+        entries.append({
+            'video_id': entry.findtext('yt:videoId', namespaces=NAMESPACES),
+            'channel_id': entry.findtext('yt:channelId', namespaces=NAMESPACES),
+            'title': entry.findtext('atom:title', namespaces=NAMESPACES),
+            'link': link.get('href') if link is not None else None,
+            'published': entry.findtext('atom:published', namespaces=NAMESPACES),
+            'updated': entry.findtext('atom:updated', namespaces=NAMESPACES),
+            'deleted': False
+        })
+
+    for deleted_entry in feed.findall('at:deleted-entry', NAMESPACES):
+
+        entries.append({
+            'video_id': deleted_entry.get('ref', '').replace('yt:video:', ''),
+            'updated': deleted_entry.get('when'),
+            'deleted': True
+        })
+
+    return entries
+
+
+def is_new_video(entry: Dict, window: float = NEW_VIDEO_WINDOW) -> bool:
+    """Tells a new upload apart from an edit to an older video.
+
+    YouTube pushes the same kind of entry for both, only the gap between
+    `published` and `updated` gives an edit away.
+
+    Arguments:
+    ----
+    entry {Dict} -- A parsed entry, see `parse_feed`.
+
+    Keyword Arguments:
+    ----
+    window {float} -- The most seconds between publishing and the update for
+        the video to still count as new. (default: {NEW_VIDEO_WINDOW})
+
+    Returns:
+    ----
+    {bool} -- `True` for a new upload, or if the entry has no usable timestamps.
+    """
+
+    try:
+        published = datetime.fromisoformat(entry['published'].replace('Z', '+00:00'))
+        updated = datetime.fromisoformat(entry['updated'].replace('Z', '+00:00'))
+    except (KeyError, AttributeError, ValueError):
+        return True
+
+    return (updated - published).total_seconds() <= window
+
+
+def subscribe(callback_url: str, topic: str, hub_url: str = HUB_URL, secret: str = None,
+              lease_seconds: int = None, mode: str = 'subscribe') -> int:
+    """Asks a hub to push a topic's notifications to a callback.
+
+    Arguments:
+    ----
+    callback_url {str} -- The public URL of the `WebSubReceiver`.
+
+    topic {str} -- The feed to subscribe to, see `topic_url`.
+
+    Keyword Arguments:
+    ----
+    hub_url {str} -- The hub to ask. (default: {HUB_URL})
+
+    secret {str} -- Signs every notification, pass the same one to the receiver. (default: {None})
+
+    lease_seconds {int} -- How long the subscription lasts, the hub picks if not set. (default: {None})
+
+    mode {str} -- Either `subscribe` or `unsubscribe`. (default: {'subscribe'})
+
+    Returns:
+    ----
+    {int} -- The status code from the hub, `202` once it's verifying the request.
+    """
+
+    form = {
+        'hub.callback': callback_url,
+        'hub.topic': topic,
+        'hub.mode': mode,
+        'hub.verify': 'async'
+    }
+
+    if secret:
+        form['hub.secret'] = secret
+
+    if lease_seconds:
+        form['hub.lease_seconds'] = str(lease_seconds)
+
+    request = urllib.request.Request(
+        url=hub_url,
+        data=urllib.parse.urlencode(form).encode('utf-8'),
+        method='POST'
+    )
+
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status
+    except urllib.error.HTTPError as http_error:
+        return http_error.code
+
+
+class WebSubReceiver():
+
+    def __init__(self, on_notification: Callable[[List[Dict]], None], secret: str = None, topics: List[str] = None,
+                 host: str = '127.0.0.1', port: int = 0) -> None:
+        """Initalizes a callback server for YouTube's push notifications.
+
+        The hub checks a subscription by sending a `GET` with a `hub.challenge`,
+        which is echoed back for the topics we asked for. Notifications arrive as
+        a `POST` with an Atom feed, which is checked against the secret, parsed
+        and handed to `on_notification`.
+
+        Arguments:
+        ----
+        on_notification {Callable[[List[Dict]], None]} -- Called with the parsed entries
+            of each notification, see `parse_feed` and `FeedRefresher`.
+
+        Keyword Arguments:
+        ----
+        secret {str} -- The secret given when subscribing, unsigned or badly signed
+            notifications are dropped. (default: {None})
+
+        topics {List[str]} -- The topics we'll confirm subscriptions for, any topic
+            if not set. (default: {None})
+
+        host {str} -- The address to listen on. (default: {'127.0.0.1'})
+
+        port {int} -- The port to listen on, a free one if `0`. (default: {0})
+
+        Usage:
+        ----
+            >>> with WebSubReceiver(on_notification=FeedRefresher(youtube_session), secret='<SECRET>') as receiver:
+                    subscribe(callback_url='<PUBLIC_URL>', topic=topic_url('<CHANNEL_ID>'), secret='<SECRET>')
+        """
+
+        self.on_notification = on_notification
+        self.secret = secret
+        self.topics = topics
+
+        self.verified: List[Tuple[str, str]] = []
+        self.received = 0
+        self.rejected = 0
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """The URL of the callback."""
+
+        host, port = self._server.server_address[:2]
+
+        return 'http://{host}:{port}/websub'.format(host=host, port=port)
+
+    def start(self) -> 'WebSubReceiver':
+        """Starts serving on a background thread."""
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Stops the server and frees the port."""
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'WebSubReceiver':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def handle(self, method: str, query: Dict, body: bytes, signature: str = None) -> Tuple[int, bytes]:
+        """Answers a request from the hub.
+
+        Arguments:
+        ----
+        method {str} -- The HTTP method.
+
+        query {Dict} -- The URL params.
+
+        body {bytes} -- The request body.
+
+        Keyword Arguments:
+        ----
+        signature {str} -- The `X-Hub-Signature` header. (default: {None})
+
+        Returns:
+        ----
+        {Tuple[int, bytes]} -- The status code and the response body.
+        """
+
+        # The hub checking we asked for a subscription.
+        if method == 'GET':
+
+            mode = query.get('hub.mode')
+            topic = query.get('hub.topic')
+
+            if mode not in ['subscribe', 'unsubscribe'] or 'hub.challenge' not in query:
+                return 404, b''
+
+            if self.topics is not None and topic not in self.topics:
+                return 404, b''
+
+            self.verified.append((mode, topic))
+
+            return 200, query['hub.challenge'].encode('utf-8')
+
+        if method != 'POST':
+            return 405, b''
+
+        # The hub wants a 2xx even for a bad signature, we just ignore the content.
+        if self.secret and not verify_signature(secret=self.secret, body=body, signature=signature):
+            self.rejected += 1
+            return 202, b''
+
+        try:
+            entries = parse_feed(body=body)
+        except ElementTree.ParseError:
+            self.rejected += 1
+            return 400, b''
+
+        self.received += 1
+        self.on_notification(entries)
+
+        return 204, b''
+
+    def _handler_class(self) -> type:
+        """Builds the request handler bound to this receiver."""
+
+        receiver = self
+
+        class WebSubRequestHandler(BaseHTTPRequestHandler):
+
+            protocol_version = 'HTTP/1.1'
+
+            def _answer(self) -> None:
+
+                parsed = urllib.parse.urlsplit(self.path)
+                query = dict(urllib.parse.parse_qsl(parsed.query))
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0) or 0))
+
+                status, content = receiver.handle(
+                    method=self.command,
+                    query=query,
+                    body=body,
+                    signature=self.headers.get('X-Hub-Signature')
+                )
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/plain; charset=UTF-8')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = _answer
+            do_POST = _answer
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return WebSubRequestHandler
+
+
+class FeedRefresher():
+
+    def __init__(self, youtube_session: object, parts: List[str] = None, playlist_id: str = None,
+                 on_videos: Callable[[List[Dict]], None] = None, new_video_window: float = NEW_VIDEO_WINDOW) -> None:
+        """Turns push notifications into targeted refreshes.
+
+        Only the videos named in a notification are grabbed, and each new video
+        can be added to a playlist. YouTube pushes again when a video's title or
+        description changes, so edits to older videos are only refreshed, and a
+        video is only added to the playlist once its insert went through.
+
+        The work runs on a background thread, so the receiver can answer the
+        hub right away instead of waiting on the API.
+
+        Arguments:
+        ----
+        youtube_session {YouTubeClient} -- The client used to grab and insert.
+
+        Keyword Arguments:
+        ----
+        parts {List[str]} -- The video parts to grab. (default: {['snippet', 'contentDetails', 'statistics']})
+
+        playlist_id {str} -- New videos are added to this playlist if set. (default: {None})
+
+        on_videos {Callable[[List[Dict]], None]} -- Called with the refreshed Video resources. (default: {None})
+
+        new_video_window {float} -- See `is_new_video`. (default: {NEW_VIDEO_WINDOW})
+        """
+
+        self.youtube_session = youtube_session
+        self.parts = parts or ['snippet', 'contentDetails', 'statistics']
+        self.playlist_id = playlist_id
+        self.on_videos = on_videos
+        self.new_video_window = new_video_window
+
+        self.inserted = set()
+        self.deleted: List[str] = []
+        self.errors: List[str] = []
+
+        # Videos with an insert in flight, so two notifications don't both insert one.
+        self._pending = set()
+        self._lock = threading.Lock()
+
+        # One worker keeps the notifications in the order they arrived.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def __call__(self, entries: List[Dict]) -> Future:
+        """Queues a refresh of the videos in a notification, see `refresh`.
+
+        Arguments:
+        ----
+        entries {List[Dict]} -- The parsed entries, see `parse_feed`.
+
+        Returns:
+        ----
+        {Future} -- Resolves to the refreshed Video resources.
+        """
+
+        return self._executor.submit(self._refresh_safely, entries)
+
+    def _refresh_safely(self, entries: List[Dict]) -> List[Dict]:
+        """Runs `refresh` on the worker, keeping the error instead of losing it in the future."""
+
+        try:
+            return self.refresh(entries=entries)
+        except Exception as refresh_error:
+            self.errors.append(str(refresh_error))
+            raise
+
+    def refresh(self, entries: List[Dict]) -> List[Dict]:
+        """Refreshes the videos in a notification, on the calling thread.
+
+        Arguments:
+        ----
+        entries {List[Dict]} -- The parsed entries, see `parse_feed`.
+
+        Returns:
+        ----
+        {List[Dict]} -- The refreshed Video resources.
+        """
+
+        video_ids = []
+        new_video_ids = []
+
+        for entry in entries:
+
+            if entry['deleted']:
+                self.deleted.append(entry['video_id'])
+
+            elif entry['video_id'] and entry['video_id'] not in video_ids:
+
+                video_ids.append(entry['video_id'])
+
+                if is_new_video(entry=entry, window=self.new_video_window):
+                    new_video_ids.append(entry['video_id'])
+
+        if not video_ids:
+            return []
+
+        # One request for everything in the notification.
+        pages = self.youtube_session.grab_videos(video_ids=video_ids, parts=self.parts)
+        videos = [video for page in pages for video in page.get('items', [])]
+
+        if self.playlist_id:
+
+            # Notifications can arrive at the same time, claim the videos before inserting.
+            with self._lock:
+                claimed = [
+                    video_id for video_id in new_video_ids
+                    if video_id not in self.inserted and video_id not in self._pending
+                ]
+                self._pending.update(claimed)
+
+            for video_id in claimed:
+
+                try:
+                    response = self.youtube_session.insert_playlist_items(
+                        part=['snippet'],
+                        data={
+                            'snippet': {
+                                'playlistId': self.playlist_id,
+                                'resourceId': {
+                                    'kind': 'youtube#video',
+                                    'videoId': video_id
+                                }
+                            }
+                        }
+                    )
+
+                    # Only a successful insert counts, a failed one is tried again on the next push.
+                    with self._lock:
+                        if response and 'error' not in response:
+                            self.inserted.add(video_id)
+                        else:
+                            self.errors.append('Inserting {video_id} failed: {response}'.format(video_id=video_id, response=response))
+
+                finally:
+                    with self._lock:
+                        self._pending.discard(video_id)
+
+        if self.on_videos:
+            self.on_videos(videos)
+
+        return videos
+
+    def close(self, wait: bool = True) -> None:
+        """Stops the worker, by default once the queued refreshes are done."""
+
+        self._executor.shutdown(wait=wait)
+
+
+class LocalHub():
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        """Initalizes a local stand-in for the WebSub hub.
+
+        It takes subscription requests, checks them with the callback the same
+        way the real hub does and pushes signed notifications with `publish`.
+        Unlike the real hub the check happens before the `202` is sent back, so
+        tests don't have to wait for it.
+
+        Keyword Arguments:
+        ----
+        host {str} -- The address to listen on. (default: {'127.0.0.1'})
+
+        port {int} -- The port to listen on, a free one if `0`. (default: {0})
+
+        Usage:
+        ----
+            >>> with LocalHub() as hub, WebSubReceiver(on_notification=print) as receiver:
+                    subscribe(callback_url=receiver.url, topic=topic_url('<CHANNEL_ID>'), hub_url=hub.url)
+                    hub.publish(topic=topic_url('<CHANNEL_ID>'), body=LocalHub.video_feed('<VIDEO_ID>', '<CHANNEL_ID>'))
+        """
+
+        self.subscriptions: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """The URL to use as `hub_url`."""
+
+        host, port = self._server.server_address[:2]
+
+        return 'http://{host}:{port}/subscribe'.format(host=host, port=port)
+
+    def start(self) -> 'LocalHub':
+        """Starts serving on a background thread."""
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Stops the server and frees the port."""
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'LocalHub':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _verify_intent(self, callback_url: str, mode: str, topic: str) -> bool:
+        """Sends the callback a challenge and checks it's echoed back."""
+
+        challenge = hashlib.sha1(
+            '{callback_url}|{topic}|{mode}'.format(callback_url=callback_url, topic=topic, mode=mode).encode('utf-8')
+        ).hexdigest()
+
+        query = urllib.parse.urlencode({
+            'hub.mode': mode,
+            'hub.topic': topic,
+            'hub.challenge': challenge,
+            'hub.lease_seconds': '432000'
+        })
+
+        separator = '&' if '?' in callback_url else '?'
+
+        try:
+            with urllib.request.urlopen(callback_url + separator + query, timeout=10) as response:
+                return response.status == 200 and response.read().decode('utf-8') == challenge
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def handle_subscription(self, form: Dict) -> int:
+        """Handles a subscribe or unsubscribe request.
+
+        Arguments:
+        ----
+        form {Dict} -- The decoded form fields.
+
+        Returns:
+        ----
+        {int} -- `202` if the callback confirmed it, `409` if it didn't.
+        """
+
+        mode = form.get('hub.mode')
+        topic = form.get('hub.topic')
+        callback_url = form.get('hub.callback')
+
+        if mode not in ['subscribe', 'unsubscribe'] or not topic or not callback_url:
+            return 400
+
+        if not self._verify_intent(callback_url=callback_url, mode=mode, topic=topic):
+            return 409
+
+        with self._lock:
+
+            callbacks = self.subscriptions.setdefault(topic, {})
+
+            if mode == 'subscribe':
+                callbacks[callback_url] = form.get('hub.secret')
+            else:
+                callbacks.pop(callback_url, None)
+
+        return 202
+
+    def publish(self, topic: str, body: bytes) -> List[int]:
+        """Pushes a notification to every callback subscribed to a topic.
+
+        Arguments:
+        ----
+        topic {str} -- The topic the notification is for.
+
+        body {bytes} -- The Atom feed, see `video_feed` and `deleted_feed`.
+
+        Returns:
+        ----
+        {List[int]} -- The status code from each callback.
+        """
+
+        with self._lock:
+            callbacks = dict(self.subscriptions.get(topic, {}))
+
+        statuses = []
+
+        for callback_url, secret in callbacks.items():
+
+            headers = {'Content-Type': 'application/atom+xml'}
+
+            if secret:
+                headers['X-Hub-Signature'] = sign(secret=secret, body=body)
+
+            request = urllib.request.Request(url=callback_url, data=body, headers=headers, method='POST')
+
+            try:
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    statuses.append(response.status)
+            except urllib.error.HTTPError as http_error:
+                statuses.append(http_error.code)
+
+        return statuses
+
+    @staticmethod
+    def video_feed(video_id: str, channel_id: str, title: str = 'New Video',
+                   published: str = '2020-10-01T12:00:00+00:00', updated: str = '2020-10-01T12:00:05+00:00') -> bytes:
+        """Builds a notification for a new or updated video, like the one YouTube sends."""
+
+        return '''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns="http://www.w3.org/2005/Atom">
+  <link rel="hub" href="https://pubsubhubbub.appspot.com"/>
+  <link rel="self" href="{topic}"/>
+  <title>YouTube video feed</title>
+  <updated>{updated}</updated>
+  <entry>
+    <id>yt:video:{video_id}</id>
+    <yt:videoId>{video_id}</yt:videoId>
+    <yt:channelId>{channel_id}</yt:channelId>
+    <title>{title}</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v={video_id}"/>
+    <published>{published}</published>
+    <updated>{updated}</updated>
+  </entry>
+</feed>'''.format(
+            topic=topic_url(channel_id=channel_id),
+            video_id=video_id,
+            channel_id=channel_id,
+            title=title,
+            published=published,
+            updated=updated
+        ).encode('utf-8')
+
+    @staticmethod
+    def deleted_feed(video_id: str, channel_id: str, when: str = '2020-10-02T12:00:00+00:00') -> bytes:
+        """Builds a notification for a deleted video."""
+
+        return '''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:at="http://purl.org/atompub/tombstones/1.0" xmlns="http://www.w3.org/2005/Atom">
+  <at:deleted-entry ref="yt:video:{video_id}" when="{when}">
+    <link href="https://www.youtube.com/watch?v={video_id}"/>
+    <at:by>
+      <name>Channel</name>
+      <uri>https://www.youtube.com/channel/{channel_id}</uri>
+    </at:by>
+  </at:deleted-entry>
+</feed>'''.format(
+            video_id=video_id,
+            channel_id=channel_id,
+            when=when
+        ).encode('utf-8')
+
+    def _handler_class(self) -> type:
+        """Builds the request handler bound to this hub."""
+
+        hub = self
+
+        class HubRequestHandler(BaseHTTPRequestHandler):
+
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self) -> None:
+
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0) or 0))
+                form = dict(urllib.parse.parse_qsl(body.decode('utf-8')))
+
+                status = hub.handle_subscription(form=form)
+
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return HubRequestHandler